@@ -1,9 +1,31 @@
 import argparse
+import sys
 from boilrpy.cli import CLI
 from boilrpy.config import Config
+from boilrpy.file_generators.dockerfile_generator import DockerfileGenerator
+from boilrpy.manifest import ManifestError
 from boilrpy.project_creator import ProjectCreator
 from boilrpy.dependency_creators.checker import DependencyManagerChecker
 
+PROJECT_OPTIONS = (
+    "initial_commit",
+    "docker_profile",
+    "use_fastapi",
+    "use_flask_cache",
+    "use_metrics",
+    "use_database",
+    "use_logging",
+)
+
+
+def project_options(args) -> dict:
+    """Return the project options given on the command line."""
+    return {
+        option: getattr(args, option)
+        for option in PROJECT_OPTIONS
+        if getattr(args, option, None) is not None
+    }
+
 
 def run_cli(args):
     """Run the CLI with given arguments."""
@@ -12,12 +34,34 @@ def run_cli(args):
         return
 
     config = Config()
+    if args.command == "update":
+        creator = ProjectCreator(config)
+        creator.update_project(args.path)
+        return
+    if args.command == "check":
+        check_projects(config, args.paths)
+        return
+
     cli = CLI(config)
-    project_info = cli.gather_project_info()
+    project_info = cli.gather_project_info(project_options(args))
     creator = ProjectCreator(config)
     creator.create_project(project_info)
 
 
+def check_projects(config, paths):
+    """Report drift of generated files, exiting with status 1 on drift."""
+    creator = ProjectCreator(config)
+    drifted = False
+    for path in paths:
+        try:
+            drifted = bool(creator.check_project(path)) or drifted
+        except ManifestError as e:
+            print(e)
+            drifted = True
+    if drifted:
+        sys.exit(1)
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -28,6 +72,78 @@ def main():
         action="store_true",
         help="Check which dependency managers are installed",
     )
+    parser.add_argument(
+        "--initial-commit",
+        action="store_true",
+        default=None,
+        help="Commit the generated files in the new git repository",
+    )
+    parser.add_argument(
+        "--docker-profile",
+        choices=DockerfileGenerator.DOCKER_PROFILES,
+        default=None,
+        help="Dockerfile flavour: a single stage (default) or a multi-stage "
+        "slim runtime image with precompiled bytecode (runtime)",
+    )
+    parser.add_argument(
+        "--fastapi",
+        dest="use_fastapi",
+        action="store_true",
+        default=None,
+        help="Generate an async FastAPI app served by uvicorn instead of Flask",
+    )
+    parser.add_argument(
+        "--flask-cache",
+        dest="use_flask_cache",
+        action="store_true",
+        default=None,
+        help="Add Flask-Caching, brotli/gzip compression and immutable caching "
+        "of fingerprinted static files to the Flask app",
+    )
+    parser.add_argument(
+        "--metrics",
+        dest="use_metrics",
+        action="store_true",
+        default=None,
+        help="Add request counts and latency histograms, exposed at /metrics, "
+        "to the Flask app",
+    )
+    parser.add_argument(
+        "--database",
+        dest="use_database",
+        action="store_true",
+        default=None,
+        help="Add a connection-pooled SQLAlchemy database layer to the Flask app",
+    )
+    parser.add_argument(
+        "--logging",
+        dest="use_logging",
+        action="store_true",
+        default=None,
+        help="Add non-blocking JSON logging, through a queue, to main.py or the "
+        "Flask app",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    update_parser = subparsers.add_parser(
+        "update",
+        help="Regenerate an existing project, rewriting only the files that changed",
+    )
+    update_parser.add_argument(
+        "path",
+        nargs="?",
+        default=".",
+        help="Path of the project to update (defaults to the current directory)",
+    )
+    check_parser = subparsers.add_parser(
+        "check",
+        help="Report generated files that drifted from the project manifest",
+    )
+    check_parser.add_argument(
+        "paths",
+        nargs="*",
+        default=["."],
+        help="Paths of the projects to check (defaults to the current directory)",
+    )
     args = parser.parse_args()
     run_cli(args)
 
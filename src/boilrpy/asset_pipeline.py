@@ -0,0 +1,148 @@
+"""Minify, fingerprint and precompress the static assets of a Flask app.
+
+The assets are written to the dist folder of the static directory, together
+with a manifest mapping each source to its fingerprinted file. The module only
+uses the standard library, brotli being optional, so boilrpy also copies it in
+generated projects as build_assets.py:
+
+    python build_assets.py [static_dir]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+from typing import Callable, Dict
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+OUTPUT_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_WHITESPACE = re.compile(r"\s+")
+CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+CSS_COLON = re.compile(r":\s+")
+JS_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def minify_css(text: str) -> str:
+    """Drop the comments and the whitespace that CSS does not need."""
+    text = CSS_COMMENT.sub("", text)
+    text = CSS_WHITESPACE.sub(" ", text)
+    text = CSS_PUNCTUATION.sub(r"\1", text)
+    text = CSS_COLON.sub(":", text)
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(text: str) -> str:
+    """Drop the comments, indentation and blank lines of a script.
+
+    Statements are kept on their own line, so the result does not depend on
+    automatic semicolon insertion.
+    """
+    lines = (line.strip() for line in JS_BLOCK_COMMENT.sub("", text).splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+MINIFIERS: Dict[str, Callable[[str], str]] = {".css": minify_css, ".js": minify_js}
+
+
+def fingerprint(name: str, content: bytes) -> str:
+    """Insert the content hash in a file name, e.g. css/style.3f2a9c1d04be.css."""
+    stem, suffix = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{suffix}"
+
+
+def compress(content: bytes) -> Dict[str, bytes]:
+    """Return the precompressed variants of a content, keyed by file suffix.
+
+    The gzip variant has no timestamp, so builds are reproducible. The brotli
+    variant is only produced when the brotli package is installed.
+    """
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    return variants
+
+
+def _write(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def _build_asset(
+    static_dir: str, name: str, output_dir: str, minifier: Callable[[str], str]
+) -> str:
+    """Write the minified, fingerprinted and compressed copies of an asset."""
+    with open(os.path.join(static_dir, name), "r", encoding="utf-8") as file:
+        content = minifier(file.read()).encode("utf-8")
+    target = f"{output_dir}/{fingerprint(name, content)}"
+    _write(os.path.join(static_dir, target), content)
+    for suffix, variant in compress(content).items():
+        _write(os.path.join(static_dir, target + suffix), variant)
+    return target
+
+
+def build_assets(
+    static_dir: str = "static", output_dir: str = OUTPUT_DIR
+) -> Dict[str, str]:
+    """Build the fingerprinted assets of a static directory.
+
+    The output directory is rebuilt from scratch, so files of previous builds
+    do not pile up.
+
+    Args:
+        static_dir (str): The static directory of the app.
+        output_dir (str): The output directory, relative to static_dir.
+
+    Returns:
+        dict: The manifest, mapping each source to its fingerprinted file,
+            both relative to static_dir.
+    """
+    output_root = os.path.join(static_dir, output_dir)
+    shutil.rmtree(output_root, ignore_errors=True)
+    manifest = {}
+    for root, directories, filenames in os.walk(static_dir):
+        directories[:] = sorted(
+            directory
+            for directory in directories
+            if os.path.join(root, directory) != output_root
+        )
+        for filename in sorted(filenames):
+            minifier = MINIFIERS.get(os.path.splitext(filename)[1])
+            if minifier is None:
+                continue
+            name = os.path.relpath(os.path.join(root, filename), static_dir)
+            name = name.replace(os.sep, "/")
+            manifest[name] = _build_asset(static_dir, name, output_dir, minifier)
+    _write(
+        os.path.join(output_root, MANIFEST_NAME),
+        (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8"),
+    )
+    return manifest
+
+
+def main(argv=None) -> None:
+    """Build the assets of the static directory given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "static_dir",
+        nargs="?",
+        default="static",
+        help="Static directory of the app (defaults to static)",
+    )
+    args = parser.parse_args(argv)
+    for name, target in build_assets(args.static_dir).items():
+        print(f"{name} -> {target}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
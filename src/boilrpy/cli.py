@@ -2,6 +2,7 @@ import sys
 from colorama import Fore, Style
 from boilrpy.input_validator import InputValidator
 from boilrpy.decorators.color_decorator import ColorDecorator
+from boilrpy.license_catalog import UnknownLicenseError, get_license_catalog
 
 
 class CLI:
@@ -12,10 +13,14 @@ class CLI:
     def __init__(self, config):
         self.config = config
 
-    def gather_project_info(self) -> dict:
+    def gather_project_info(self, options: dict = None) -> dict:
         """
         Gather project information from the user.
 
+        Args:
+            options (dict): Project options given on the command line, added
+                to the gathered information.
+
         Returns:
             dict: Dictionary containing project information.
         """
@@ -54,9 +59,15 @@ class CLI:
             project_info["use_pylint"] = self._yes_no_question(
                 "Use pylint in project? (y/n) [n]: ", "n"
             )
-            project_info["use_flask"] = self._yes_no_question(
-                "Use flask in project? (y/n) [n]: ", "n"
-            )
+            if (options or {}).get("use_fastapi"):
+                # The async FastAPI app replaces the Flask one
+                project_info["use_flask"] = False
+            else:
+                project_info["use_flask"] = self._yes_no_question(
+                    "Use flask in project? (y/n) [n]: ", "n"
+                )
+
+            project_info.update(options or {})
 
             self._display_summary(project_info)
             return project_info
@@ -76,16 +87,28 @@ class CLI:
         print(f"\n{Fore.YELLOW}Available licenses:{Style.RESET_ALL}")
         for i, lic in enumerate(licenses, 1):
             print(f"{Fore.CYAN}{i}. {lic}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}{len(licenses) + 1}. Other SPDX license{Style.RESET_ALL}")
         while True:
             choice = input("Choose a license (enter the number): ")
             try:
                 index = int(choice) - 1
                 if 0 <= index < len(licenses):
                     return licenses[index]
+                if index == len(licenses):
+                    return self._choose_spdx_license()
             except ValueError:
                 pass
             self.display_error("Invalid choice. Please try again.")
 
+    def _choose_spdx_license(self) -> str:
+        catalog = get_license_catalog()
+        while True:
+            license_name = input("Enter an SPDX license id (e.g. MPL-2.0): ")
+            try:
+                return catalog.resolve(license_name)
+            except UnknownLicenseError:
+                self.display_error("Unknown SPDX license. Please try again.")
+
     def _choose_dependencies_manager(self) -> str:
         dep_manager = self.config.get_available_dep_managers()
         print(f"\n{Fore.YELLOW}Available dependency managers:{Style.RESET_ALL}")
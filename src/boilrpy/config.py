@@ -10,6 +10,7 @@ class Config:
         self.charset = "utf-8"
         self.default_version = "0.1.0"
         self.python_version = "3.11"
+        self.git_default_branch = "main"
 
     def get_available_licenses(self) -> list:
         """Returns a list of available licenses."""
@@ -30,3 +31,7 @@ class Config:
     def get_default_version(self) -> str:
         """Returns the default version."""
         return self.default_version
+
+    def get_git_default_branch(self) -> str:
+        """Returns the branch created when initializing the git repository."""
+        return self.git_default_branch
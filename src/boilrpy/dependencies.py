@@ -0,0 +1,184 @@
+"""Dependency model shared by every file listing the project dependencies."""
+
+import re
+from typing import List, Optional, Tuple
+
+DEFAULT_CONDA_CHANNELS = ("conda-forge", "defaults")
+PIP_CHANNEL = "pip"
+
+REQUIREMENT_PATTERN = re.compile(
+    r"^(?:(?P<channel>[\w.-]+)::)?(?P<name>[A-Za-z0-9][A-Za-z0-9._\[\],-]*)"
+    r"\s*(?P<specifier>.*)$"
+)
+
+
+class Dependency:
+    """
+    A package with an optional version pin and channel hint.
+
+    The channel hint uses the conda `channel::package` syntax: `pip::package`
+    marks a package that is not available on the conda channels, and any
+    other channel is added to environment.yml.
+    """
+
+    def __init__(self, name: str, specifier: str = "", channel: Optional[str] = None):
+        self.name = name
+        self.specifier = specifier
+        self.channel = channel
+
+    @classmethod
+    def parse(cls, requirement: str) -> "Dependency":
+        """
+        Parse a requirement such as `requests>=2.31` or `pip::package==1.0`.
+
+        Args:
+            requirement (str): The requirement string.
+
+        Returns:
+            Dependency: The parsed dependency.
+
+        Raises:
+            ValueError: If the requirement cannot be parsed.
+        """
+        match = REQUIREMENT_PATTERN.match(requirement.strip())
+        if match is None:
+            raise ValueError(f"Invalid requirement: '{requirement}'")
+        return cls(
+            match.group("name"),
+            match.group("specifier").replace(" ", ""),
+            match.group("channel"),
+        )
+
+    @property
+    def requirement(self) -> str:
+        """Returns the pip requirement string."""
+        return f"{self.name}{self.specifier}"
+
+    @property
+    def conda_requirement(self) -> str:
+        """Returns the conda match specification."""
+        # conda has no compatible release operator
+        specifier = self.specifier.replace("~=", ">=")
+        name = self.name.split("[", 1)[0]
+        if self.channel:
+            return f"{self.channel}::{name}{specifier}"
+        return f"{name}{specifier}"
+
+    @property
+    def pip_only(self) -> bool:
+        """Returns whether the package must be installed with pip."""
+        return self.channel == PIP_CHANNEL
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Dependency):
+            return NotImplemented
+        return (self.name, self.specifier, self.channel) == (
+            other.name,
+            other.specifier,
+            other.channel,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.specifier, self.channel))
+
+    def __repr__(self) -> str:
+        return f"Dependency({self.name!r}, {self.specifier!r}, {self.channel!r})"
+
+
+class ProjectDependencies:
+    """
+    Main and dev dependencies of a generated project.
+
+    The dependencies are resolved once from the project information and then
+    read by every emitter: dependency creators, requirements.txt, Dockerfile
+    and README.
+    """
+
+    def __init__(self, main: List[Dependency], dev: List[Dependency]):
+        self.main = main
+        self.dev = dev
+
+    @classmethod
+    def from_project_info(cls, project_info: dict) -> "ProjectDependencies":
+        """
+        Resolve the dependencies of a project.
+
+        Args:
+            project_info (dict): Dictionary containing project information
+
+        Returns:
+            ProjectDependencies: The resolved dependencies.
+        """
+        main = []
+        if project_info.get("use_flask"):
+            main.append(Dependency("flask"))
+            main.append(Dependency("python-dotenv"))
+            main.append(Dependency("gunicorn"))
+            if project_info.get("use_flask_cache"):
+                main.append(Dependency("flask-caching"))
+                main.append(Dependency("flask-compress"))
+            if project_info.get("use_database"):
+                main.append(Dependency("sqlalchemy"))
+        if project_info.get("use_fastapi"):
+            main.append(Dependency("fastapi"))
+            main.append(Dependency("uvicorn[standard]"))
+            main.append(Dependency("httpx"))
+            main.append(Dependency("python-dotenv"))
+        if project_info.get("use_logging"):
+            # main.py reads the logging settings from .env
+            main.append(Dependency("python-dotenv"))
+        main.extend(
+            Dependency.parse(library) for library in project_info.get("libraries", [])
+        )
+
+        dev = []
+        if project_info.get("create_tests"):
+            dev.append(Dependency("pytest"))
+        if project_info.get("use_pylint"):
+            dev.append(Dependency("pylint"))
+
+        return cls(cls._unique(main), cls._unique(dev))
+
+    @staticmethod
+    def _unique(dependencies: List[Dependency]) -> List[Dependency]:
+        """Drop the packages already listed, keeping the first occurrence."""
+        names = set()
+        unique = []
+        for dependency in dependencies:
+            if dependency.name.lower() not in names:
+                names.add(dependency.name.lower())
+                unique.append(dependency)
+        return unique
+
+    def requirements(self) -> List[str]:
+        """Returns the pip requirements of the main group."""
+        return [dependency.requirement for dependency in self.main]
+
+    def dev_requirements(self) -> List[str]:
+        """Returns the pip requirements of the dev group."""
+        return [dependency.requirement for dependency in self.dev]
+
+    def conda_requirements(self) -> List[str]:
+        """Returns the conda specifications of both groups."""
+        return [
+            dependency.conda_requirement
+            for dependency in self.main + self.dev
+            if not dependency.pip_only
+        ]
+
+    def pip_only_requirements(self) -> List[str]:
+        """Returns the pip requirements of the packages not available on conda."""
+        return [
+            dependency.requirement
+            for dependency in self.main + self.dev
+            if dependency.pip_only
+        ]
+
+    def conda_channels(self) -> Tuple[str, ...]:
+        """Returns the default conda channels followed by the hinted ones."""
+        channels = list(DEFAULT_CONDA_CHANNELS)
+        for dependency in self.main + self.dev:
+            if dependency.channel and not dependency.pip_only:
+                if dependency.channel not in channels:
+                    channels.append(dependency.channel)
+        return tuple(channels)
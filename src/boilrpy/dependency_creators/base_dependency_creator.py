@@ -1,20 +1,30 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+import toml
 from boilrpy.config import Config
+from boilrpy.dependencies import ProjectDependencies
 
 
 class BaseDependencyCreator(ABC):
     """Base class for dependency managers creators."""
 
+    # Whether create_dependency_file writes requirements.txt
+    writes_requirements_txt = False
+
     def __init__(self, config: Config):
         self.config = config
         self.charset = self.config.get_charset()
 
     @abstractmethod
-    def create_dependency_file(self, project_info: dict) -> None:
+    def create_dependency_file(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> None:
         """Create dependency configuration file.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Dependencies resolved from
+                project_info, resolved again when omitted
         """
         raise NotImplementedError("Subclasses must implement create_dependency_file")
 
@@ -28,30 +38,46 @@ class BaseDependencyCreator(ABC):
         """
         raise NotImplementedError("Subclasses must implement create_dependency_file")
 
-    def _create_packages(self, project_info: dict) -> tuple[list, list]:
-        """Create lists of packages and dev packages.
+    def _resolve_dependencies(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> ProjectDependencies:
+        """Return the given dependencies, or resolve them from project_info.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Already resolved dependencies
 
         Returns:
-            tuple: (packages, dev_packages)
+            ProjectDependencies: The project dependencies
         """
-        dev_packages = ["pytest"] if project_info.get("create_tests") else []
-        if project_info.get("use_pylint"):
-            dev_packages.append("pylint")
+        if dependencies is None:
+            dependencies = ProjectDependencies.from_project_info(project_info)
+        return dependencies
 
-        packages = []
-        if project_info.get("use_flask"):
-            packages.append("flask")
-            packages.append("python-dotenv")
+    def _create_packages(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> tuple[list, list]:
+        """Create lists of packages and dev packages.
 
-        # Add additional libraries
-        additional_libs = project_info.get("libraries", [])
-        if additional_libs:
-            packages.extend(additional_libs)
+        Args:
+            project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Already resolved dependencies
 
-        return packages, dev_packages
+        Returns:
+            tuple: (packages, dev_packages)
+        """
+        dependencies = self._resolve_dependencies(project_info, dependencies)
+        return dependencies.requirements(), dependencies.dev_requirements()
+
+    def _load_pyproject_toml(self) -> dict:
+        """Load pyproject.toml from the current directory."""
+        with open("pyproject.toml", "r", encoding=self.charset) as file:
+            return toml.load(file)
+
+    def _dump_pyproject_toml(self, pyproject_data: dict) -> None:
+        """Write pyproject.toml in the current directory."""
+        with open("pyproject.toml", "w", encoding=self.charset) as file:
+            toml.dump(pyproject_data, file)
 
     def _write_requirements_files(
         self,
@@ -1,4 +1,6 @@
 import subprocess
+from typing import Optional
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.dependency_creators.base_dependency_creator import (
     BaseDependencyCreator,
     DependencyCreatorNotFoundError,
@@ -9,17 +11,21 @@ from boilrpy.dependency_creators.base_dependency_creator import (
 class CondaCreator(BaseDependencyCreator):
     """Class to create a new conda project."""
 
-    def create_dependency_file(self, project_info: dict) -> None:
+    def create_dependency_file(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> None:
         """Create a new conda project with environment.yml.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Dependencies resolved from
+                project_info, resolved again when omitted
         """
         try:
-            packages, dev_packages = self._create_packages(project_info)
+            dependencies = self._resolve_dependencies(project_info, dependencies)
 
             # Create environment.yml
-            self._create_environment_file(project_info, packages, dev_packages)
+            self._create_environment_file(project_info, dependencies)
 
             print("\nTo create and activate the conda environment:")
             print("1. conda env create -f environment.yml")
@@ -47,34 +53,32 @@ class CondaCreator(BaseDependencyCreator):
             ) from exc
 
     def _create_environment_file(
-        self, project_info: dict, packages: list, dev_packages: list
+        self, project_info: dict, dependencies: ProjectDependencies
     ) -> None:
         """Create environment.yml file.
 
+        Packages hinted as pip-only are listed in the pip section.
+
         Args:
             project_info (dict): Dictionary containing project information
-            packages (list): List of regular packages
-            dev_packages (list): List of development packages
+            dependencies (ProjectDependencies): The project dependencies
         """
-        all_packages = packages + dev_packages
-
-        environment_content = f"""name: {project_info["name"]}
-channels:
-  - conda-forge
-  - defaults
-dependencies:
-  - python={project_info.get("python_version", "3.11")}
-"""
-
-        if all_packages:
-            for package in all_packages:
-                environment_content += f"  - {package}\n"
+        environment_content = f"name: {project_info['name']}\nchannels:\n"
+        for channel in dependencies.conda_channels():
+            environment_content += f"  - {channel}\n"
+        environment_content += (
+            "dependencies:\n"
+            f"  - python={project_info.get('python_version', '3.11')}\n"
+        )
+        for package in dependencies.conda_requirements():
+            environment_content += f"  - {package}\n"
 
-        environment_content += """
-  - pip
-  - pip:
-    # Add pip-only packages here
-"""
+        environment_content += "  - pip\n"
+        pip_packages = dependencies.pip_only_requirements()
+        if pip_packages:
+            environment_content += "  - pip:\n"
+            for package in pip_packages:
+                environment_content += f"      - {package}\n"
 
         with open("environment.yml", "w", encoding=self.charset) as f:
             f.write(environment_content)
@@ -100,6 +100,25 @@ class DependencyCreatorFactory:
             )
         cls._creators[name.lower()] = creator_class
 
+    @classmethod
+    def writes_requirements_txt(cls, dep_manager: str) -> bool:
+        """Check if a dependency manager writes requirements.txt itself.
+
+        Unsupported managers fall back to pip, which does.
+
+        Args:
+            dep_manager: Name of the dependency manager
+
+        Returns:
+            True if the creator writes requirements.txt, False otherwise
+
+        Example:
+            >>> DependencyCreatorFactory.writes_requirements_txt("poetry")
+            False
+        """
+        creator_class = cls._creators.get(dep_manager.lower(), PipCreator)
+        return creator_class.writes_requirements_txt
+
     @classmethod
     def is_supported(cls, dep_manager: str) -> bool:
         """Check if a dependency manager is supported.
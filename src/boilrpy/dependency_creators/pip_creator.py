@@ -1,4 +1,6 @@
 import subprocess
+from typing import Optional
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.dependency_creators.base_dependency_creator import (
     BaseDependencyCreator,
     DependencyCreatorNotFoundError,
@@ -9,14 +11,20 @@ from boilrpy.dependency_creators.base_dependency_creator import (
 class PipCreator(BaseDependencyCreator):
     """Class to create a new pip project."""
 
-    def create_dependency_file(self, project_info: dict) -> None:
+    writes_requirements_txt = True
+
+    def create_dependency_file(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> None:
         """Create a new pip project with requirements.txt.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Dependencies resolved from
+                project_info, resolved again when omitted
         """
         try:
-            packages, dev_packages = self._create_packages(project_info)
+            packages, dev_packages = self._create_packages(project_info, dependencies)
 
             # Create requirements.txt files using base class method
             self._write_requirements_files(packages, dev_packages)
@@ -1,5 +1,6 @@
 import subprocess
-import toml
+from typing import Optional
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.dependency_creators.base_dependency_creator import (
     BaseDependencyCreator,
     DependencyCreatorNotFoundError,
@@ -10,14 +11,18 @@ from boilrpy.dependency_creators.base_dependency_creator import (
 class PoetryCreator(BaseDependencyCreator):
     """Class to create a new poetry project."""
 
-    def create_dependency_file(self, project_info: dict) -> None:
+    def create_dependency_file(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> None:
         """Create a new poetry file.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Dependencies resolved from
+                project_info, resolved again when omitted
         """
         try:
-            packages, dev_packages = self._create_packages(project_info)
+            packages, dev_packages = self._create_packages(project_info, dependencies)
             subprocess.run(["poetry", "init", "-n"], check=True)
             self._update_pyproject_toml(project_info)
             self.install_dependencies(packages, dev_packages)
@@ -47,10 +52,7 @@ class PoetryCreator(BaseDependencyCreator):
 
     def _update_pyproject_toml(self, project_info):
         """Update pyproject.toml with project information."""
-        pyproject_file = "pyproject.toml"
-
-        with open(pyproject_file, "r", encoding=self.charset) as file:
-            pyproject_data = toml.load(file)
+        pyproject_data = self._load_pyproject_toml()
 
         poetry_version = self._check_poetry_version()
 
@@ -73,8 +75,7 @@ class PoetryCreator(BaseDependencyCreator):
                 ]
             pyproject_data["project"]["license"] = {"text": project_info["license"]}
 
-        with open(pyproject_file, "w", encoding=self.charset) as file:
-            toml.dump(pyproject_data, file)
+        self._dump_pyproject_toml(pyproject_data)
 
     def _check_poetry_version(self):
         """Check Poetry version."""
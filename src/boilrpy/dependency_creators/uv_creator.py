@@ -1,4 +1,6 @@
 import subprocess
+from typing import Optional
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.dependency_creators.base_dependency_creator import (
     BaseDependencyCreator,
     DependencyCreatorNotFoundError,
@@ -9,11 +11,15 @@ from boilrpy.dependency_creators.base_dependency_creator import (
 class UvCreator(BaseDependencyCreator):
     """Class to create a new uv project."""
 
-    def create_dependency_file(self, project_info: dict) -> None:
-        """Create a new uv project with requirements.txt.
+    def create_dependency_file(
+        self, project_info: dict, dependencies: Optional[ProjectDependencies] = None
+    ) -> None:
+        """Create a new uv project with pyproject.toml and uv.lock.
 
         Args:
             project_info (dict): Dictionary containing project information
+            dependencies (ProjectDependencies): Dependencies resolved from
+                project_info, resolved again when omitted
         """
         try:
             # Check if uv is installed first
@@ -38,18 +44,24 @@ class UvCreator(BaseDependencyCreator):
             ) from exc
 
         try:
-            packages, dev_packages = self._create_packages(project_info)
+            packages, dev_packages = self._create_packages(project_info, dependencies)
 
-            # Create virtual environment with uv
-            subprocess.run(["uv", "venv"], check=True)
-
-            # Create requirements.txt using base class method
-            self._write_requirements_files(
-                packages, dev_packages, create_empty_if_no_packages=False
+            # Create pyproject.toml, then lock and install the dependencies
+            subprocess.run(
+                [
+                    "uv",
+                    "init",
+                    "--bare",
+                    "--no-workspace",
+                    "--name",
+                    project_info["name"],
+                ],
+                check=True,
             )
-
-            # Install dependencies
+            self._update_pyproject_toml(project_info)
             self.install_dependencies(packages, dev_packages)
+            if not packages and not dev_packages:
+                subprocess.run(["uv", "lock"], check=True)
 
         except subprocess.CalledProcessError as e:
             raise DependencyCreatorError(f"uv initialization failed: {e}") from e
@@ -62,8 +74,21 @@ class UvCreator(BaseDependencyCreator):
             dev_packages (list): List of development packages
         """
         try:
-            all_packages = packages + dev_packages
-            if all_packages:
-                subprocess.run(["uv", "pip", "install"] + all_packages, check=True)
+            if packages:
+                subprocess.run(["uv", "add"] + packages, check=True)
+            if dev_packages:
+                subprocess.run(["uv", "add", "--dev"] + dev_packages, check=True)
         except subprocess.CalledProcessError as e:
             raise DependencyCreatorError(f"Failed to install dependencies: {e}") from e
+
+    def _update_pyproject_toml(self, project_info: dict) -> None:
+        """Update pyproject.toml with project information."""
+        pyproject_data = self._load_pyproject_toml()
+
+        project = pyproject_data.setdefault("project", {})
+        project["version"] = project_info["version"]
+        project["description"] = project_info["description"]
+        if project_info["author"]:
+            project["authors"] = [{"name": project_info["author"]}]
+
+        self._dump_pyproject_toml(pyproject_data)
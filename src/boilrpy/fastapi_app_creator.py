@@ -0,0 +1,30 @@
+from typing import Optional
+from boilrpy.config import Config
+from boilrpy.file_generator import FileGenerator
+from boilrpy.file_writer import FileWriter
+
+
+class FastAPIAppCreator:
+    """Class to create a new FastAPI app, served by uvicorn."""
+
+    def __init__(self, config: Config, file_writer: Optional[FileWriter] = None):
+        self.config = config
+        self.file_generator = FileGenerator(config)
+        self.file_writer = file_writer or FileWriter(self.config.get_charset())
+
+    def create_fastapi_project(self, project_info: dict) -> None:
+        """Create a new FastAPI app.
+
+        Args:
+            project_info (dict): Dictionary containing project information
+        """
+        self._create_fastapi_app_file(project_info)
+        self._create_fastapi_dot_env()
+
+    def _create_fastapi_app_file(self, project_info: dict) -> None:
+        content = self.file_generator.generate_fastapi_app_file(project_info)
+        self.file_writer.write_file("app.py", content)
+
+    def _create_fastapi_dot_env(self) -> None:
+        content = self.file_generator.generate_fastapi_dot_env_file()
+        self.file_writer.write_file(".env", content)
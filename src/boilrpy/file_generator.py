@@ -8,8 +8,11 @@ from boilrpy.file_generators.main_file_generator import MainFileGenerator
 from boilrpy.file_generators.readme_generator import ReadmeGenerator
 from boilrpy.file_generators.pylint_generator import PylintGenerator
 from boilrpy.file_generators.flask_generator import FlaskGenerator
+from boilrpy.file_generators.fastapi_generator import FastAPIGenerator
+from boilrpy.file_generators.logging_generator import LoggingGenerator
 from boilrpy.file_generators.requirements_generator import RequirementsGenerator
 from boilrpy.config import Config
+from boilrpy.dependencies import ProjectDependencies
 
 
 class Generator(ABC):
@@ -36,6 +39,8 @@ class GeneratorFactory:
         "dockerfile": DockerfileGenerator,
         "pylint": PylintGenerator,
         "flask": FlaskGenerator,
+        "fastapi": FastAPIGenerator,
+        "logging": LoggingGenerator,
         "requirements": RequirementsGenerator,
     }
 
@@ -60,7 +65,8 @@ class GeneratorFactory:
         return generator_class(config)
 
 
-class FileGenerator:
+# One method per generated file, delegating to the generators
+class FileGenerator:  # pylint: disable=too-many-public-methods
     """
     Main class for generating project files.
     """
@@ -76,14 +82,17 @@ class FileGenerator:
             )
         return self.generators[generator_type]
 
-    def generate_readme(self, project_info: dict) -> str:
+    def generate_readme(
+        self, project_info: dict, dependencies: ProjectDependencies = None
+    ) -> str:
         """
         Generate README.md content.
 
         :param project_info: Dictionary containing project information
+        :param dependencies: The project dependencies
         :return: Content of README.md file
         """
-        return self._get_generator("readme").generate(project_info)
+        return self._get_generator("readme").generate(project_info, dependencies)
 
     def generate_license(self, license_name: str, author: str) -> str:
         """
@@ -95,13 +104,14 @@ class FileGenerator:
         """
         return self._get_generator("license").generate(license_name, author)
 
-    def generate_gitignore(self) -> str:
+    def generate_gitignore(self, project_info: dict = None) -> str:
         """
         Generate .gitignore file content.
 
+        :param project_info: Dictionary containing project information
         :return: Content of .gitignore file
         """
-        return self._get_generator("gitignore").generate()
+        return self._get_generator("gitignore").generate(project_info)
 
     def generate_changelog(self, version: str) -> str:
         """
@@ -112,22 +122,45 @@ class FileGenerator:
         """
         return self._get_generator("changelog").generate(version)
 
-    def generate_main_file(self) -> str:
+    def generate_main_file(self, project_info: dict = None) -> str:
         """
         Generate main.py content.
 
+        :param project_info: Dictionary containing project information
+
         :return: Content of main.py file
         """
-        return self._get_generator("main_file").generate()
+        return self._get_generator("main_file").generate(project_info or {})
+
+    def generate_logging_config(self, project_info: dict) -> str:
+        """
+        Generate logging_config.py content.
+
+        :param project_info: Dictionary containing project information
+        :return: Content of logging_config.py
+        """
+        return self._get_generator("logging").generate(project_info)
 
-    def generate_dockerfile(self, project_name: str, use_flask: bool) -> str:
+    def generate_logging_dot_env_file(self) -> str:
+        """
+        Generate the .env file of the logging settings.
+
+        :return: Content of .env file
+        """
+        return self._get_generator("logging").generate_dot_env_file()
+
+    def generate_dockerfile(
+        self, project_info: dict, dependencies: ProjectDependencies = None
+    ) -> str:
         """
         Generate Dockerfile content.
 
+        :param project_info: Dictionary containing project information
+        :param dependencies: The project dependencies
         :return: Content of Dockerfile
         """
         return self._get_generator("dockerfile").generate_dockerfile(
-            project_name, use_flask
+            project_info, dependencies
         )
 
     def generate_dockerignore(self) -> str:
@@ -146,21 +179,104 @@ class FileGenerator:
         """
         return self._get_generator("pylint").generate()
 
-    def generate_requirements_txt(self, project_info: dict) -> str:
+    def generate_requirements_txt(self, dependencies: ProjectDependencies) -> str:
         """
         Generate requirements.txt content.
 
+        :param dependencies: The project dependencies
         :return: Content of requirements.txt
         """
-        return self._get_generator("requirements").generate(project_info)
+        return self._get_generator("requirements").generate(dependencies)
 
-    def generate_flask_app_file(self) -> str:
+    def generate_flask_app_file(self, project_info: dict = None) -> str:
         """
         Generate flask app file content.
 
+        :param project_info: Dictionary containing project information
         :return: Content of flask app file
         """
-        return self._get_generator("flask").generate_app_file()
+        return self._get_generator("flask").generate_app_file(project_info)
+
+    def generate_wsgi_file(self) -> str:
+        """
+        Generate wsgi file content.
+
+        :return: Content of wsgi file
+        """
+        return self._get_generator("flask").generate_wsgi_file()
+
+    def generate_gunicorn_conf(self) -> str:
+        """
+        Generate gunicorn.conf.py content.
+
+        :return: Content of gunicorn.conf.py
+        """
+        return self._get_generator("flask").generate_gunicorn_conf()
+
+    def generate_build_assets_script(self) -> str:
+        """
+        Generate build_assets.py content.
+
+        :return: Content of build_assets.py
+        """
+        return self._get_generator("flask").generate_build_assets_script()
+
+    def generate_metrics_module(self) -> str:
+        """
+        Generate metrics.py content.
+
+        :return: Content of metrics.py
+        """
+        return self._get_generator("flask").generate_metrics_module()
+
+    def generate_metrics_test(self) -> str:
+        """
+        Generate the tests of the metrics middleware.
+
+        :return: Content of tests/test_metrics.py
+        """
+        return self._get_generator("flask").generate_metrics_test()
+
+    def generate_database_module(self) -> str:
+        """
+        Generate database.py content.
+
+        :return: Content of database.py
+        """
+        return self._get_generator("flask").generate_database_module()
+
+    def generate_database_fixture(self) -> str:
+        """
+        Generate the test fixture of the database.
+
+        :return: Content of tests/conftest.py
+        """
+        return self._get_generator("flask").generate_database_fixture()
+
+    def generate_database_test(self) -> str:
+        """
+        Generate the tests of the database module.
+
+        :return: Content of tests/test_database.py
+        """
+        return self._get_generator("flask").generate_database_test()
+
+    def generate_fastapi_app_file(self, project_info: dict) -> str:
+        """
+        Generate FastAPI app file content.
+
+        :param project_info: Dictionary containing project information
+        :return: Content of FastAPI app file
+        """
+        return self._get_generator("fastapi").generate_app_file(project_info)
+
+    def generate_fastapi_dot_env_file(self) -> str:
+        """
+        Generate FastAPI .env file content.
+
+        :return: Content of .env file
+        """
+        return self._get_generator("fastapi").generate_dot_env_file()
 
     def generate_base_template(self, project_info: dict) -> str:
         """
@@ -178,13 +294,14 @@ class FileGenerator:
         """
         return self._get_generator("flask").generate_index_template(project_info)
 
-    def generate_dot_env_file(self) -> str:
+    def generate_dot_env_file(self, project_info: dict = None) -> str:
         """
         Generate .env file content.
 
+        :param project_info: Dictionary containing project information
         :return: Content of .env file
         """
-        return self._get_generator("flask").generate_dot_env_file()
+        return self._get_generator("flask").generate_dot_env_file(project_info)
 
     def generate_style_file(self) -> str:
         """
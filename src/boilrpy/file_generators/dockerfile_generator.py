@@ -1,3 +1,4 @@
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.base_generator import BaseGenerator
 
 
@@ -6,31 +7,211 @@ class DockerfileGenerator(BaseGenerator):
     Generator for Dockerfile and .dockerignore file.
     """
 
+    # Dependency manifests are copied and installed before the sources, so
+    # the dependency layers are reused as long as the manifests do not change.
+    # BuildKit cache mounts keep the package caches between builds.
+    DEP_MANAGER_CONFIG = {
+        "pip": {
+            "base_image": "python:${python_version}-slim",
+            "setup": "",
+            "install": (
+                "COPY requirements.txt .\n"
+                "RUN --mount=type=cache,target=/root/.cache/pip \\\n"
+                "    pip install -r requirements.txt\n"
+            ),
+            "environment": "",
+            "skip_without_packages": True,
+            "copy_sources": "COPY . .\n\n",
+            "builder_setup": (
+                "RUN python -m venv /app/.venv\n\n"
+                'ENV PATH="/app/.venv/bin:$$PATH"\n\n'
+            ),
+            "runtime_image": "python:${python_version}-slim",
+            "runtime_setup": "RUN useradd --create-home --uid 10001 app\n\n",
+            "runtime_environment": 'PATH="/app/.venv/bin:$$PATH"',
+            "runtime_user": "app",
+        },
+        "poetry": {
+            "base_image": "python:${python_version}-slim",
+            "setup": (
+                "ENV POETRY_NO_INTERACTION=1 \\\n"
+                "    POETRY_VIRTUALENVS_IN_PROJECT=1 \\\n"
+                "    POETRY_CACHE_DIR=/root/.cache/pypoetry\n\n"
+                "RUN --mount=type=cache,target=/root/.cache/pip \\\n"
+                "    pip install poetry\n\n"
+            ),
+            "install": (
+                "COPY pyproject.toml poetry.lock* ./\n"
+                "RUN --mount=type=cache,target=/root/.cache/pypoetry \\\n"
+                "    poetry install --no-root --only main\n"
+            ),
+            "environment": 'ENV PATH="/app/.venv/bin:$$PATH"\n\n',
+            "skip_without_packages": False,
+            "copy_sources": "COPY . .\n\n",
+            "builder_setup": "",
+            "runtime_image": "python:${python_version}-slim",
+            "runtime_setup": "RUN useradd --create-home --uid 10001 app\n\n",
+            "runtime_environment": 'PATH="/app/.venv/bin:$$PATH"',
+            "runtime_user": "app",
+        },
+        "uv": {
+            "base_image": "python:${python_version}-slim",
+            "setup": (
+                "COPY --from=ghcr.io/astral-sh/uv:latest /uv /uvx /bin/\n\n"
+                "ENV UV_LINK_MODE=copy\n\n"
+            ),
+            "install": (
+                "COPY pyproject.toml uv.lock ./\n"
+                "RUN --mount=type=cache,target=/root/.cache/uv \\\n"
+                "    uv sync --frozen --no-dev --no-install-project\n"
+            ),
+            "environment": 'ENV PATH="/app/.venv/bin:$$PATH"\n\n',
+            "skip_without_packages": False,
+            "copy_sources": "COPY . .\n\n",
+            "builder_setup": "ENV UV_COMPILE_BYTECODE=1\n\n",
+            "runtime_image": "python:${python_version}-slim",
+            "runtime_setup": "RUN useradd --create-home --uid 10001 app\n\n",
+            "runtime_environment": 'PATH="/app/.venv/bin:$$PATH"',
+            "runtime_user": "app",
+        },
+        "conda": {
+            "base_image": "mambaorg/micromamba:1.5.8",
+            "setup": "ARG MAMBA_DOCKERFILE_ACTIVATE=1\n\n",
+            "install": (
+                "COPY --chown=$$MAMBA_USER:$$MAMBA_USER environment.yml .\n"
+                "RUN --mount=type=cache,target=/opt/conda/pkgs,uid=57439,gid=57439 \\\n"
+                "    micromamba install -y -n base -f environment.yml\n"
+            ),
+            "environment": "",
+            "skip_without_packages": False,
+            "copy_sources": (
+                # Lets the micromamba user write the build output
+                "COPY --chown=$$MAMBA_USER:$$MAMBA_USER . .\n\n"
+            ),
+            # The micromamba image runs as $MAMBA_USER, who cannot write /app
+            "builder_setup": "USER root\n\n",
+            "runtime_image": "mambaorg/micromamba:1.5.8",
+            "runtime_setup": "COPY --from=builder /opt/conda /opt/conda\n\n",
+            "runtime_environment": "",
+            "runtime_user": "$$MAMBA_USER",
+        },
+    }
+
+    DOCKER_PROFILES = ("default", "runtime")
+
+    # Production servers of the web frameworks, keyed by project option
+    SERVER_COMMANDS = {
+        "use_flask": '["gunicorn", "--config", "gunicorn.conf.py", "wsgi:app"]',
+        "use_fastapi": (
+            '["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", '
+            '"--proxy-headers"]'
+        ),
+    }
+
     def generate(self, *args, **kwargs) -> None:
-        project_name = args[0] if args else ""
-        use_flask = args[1] if len(args) > 1 else False
-        self.generate_dockerfile(project_name, use_flask)
+        project_info = args[0] if args else {}
+        self.generate_dockerfile(project_info)
         self.generate_dockerignore()
 
-    def generate_dockerfile(self, project_name: str, use_flask: bool) -> str:
-        """Generate Dockerfile content."""
-        command = '["flask", "run"]' if use_flask else '["python", "main.py"]'
-        template = """FROM python:${python_version}-slim
+    def generate_dockerfile(
+        self, project_info: dict, dependencies: ProjectDependencies = None
+    ) -> str:
+        """Generate Dockerfile content.
 
-WORKDIR /app
+        The install steps match the dependencies manager of the project. With
+        pip, the requirements are only installed when the project has main
+        dependencies. Flask applications are served by gunicorn and FastAPI
+        applications by uvicorn, with APP_ENV set to production, and the Flask
+        static assets are built in the image. The "runtime"
+        docker profile produces a multi-stage image instead of a single stage.
 
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-COPY . .
+        :param project_info: Dictionary containing project information
+        :param dependencies: The project dependencies
+        :return: Content of Dockerfile
+        """
+        if dependencies is None:
+            dependencies = ProjectDependencies.from_project_info(project_info)
+        dep_manager = project_info.get("dependencies_manager", "pip").lower()
+        manager_config = self.DEP_MANAGER_CONFIG.get(
+            dep_manager, self.DEP_MANAGER_CONFIG["pip"]
+        )
 
-CMD ${command}
-"""
+        install = manager_config["install"] + "\n"
+        if manager_config["skip_without_packages"] and not dependencies.main:
+            install = ""
+        app_environment = expose = ""
+        command = '["python", "main.py"]'
+        for option, server_command in self.SERVER_COMMANDS.items():
+            if project_info.get(option, False):
+                app_environment = "APP_ENV=production"
+                expose = "EXPOSE 8000\n\n"
+                command = server_command
+        # The fingerprinted static assets are build output, not sources
+        build = (
+            "RUN python build_assets.py\n\n" if project_info.get("use_flask") else ""
+        )
+        if project_info.get("docker_profile", "default") == "runtime":
+            template = self._runtime_template(manager_config, install, app_environment)
+        else:
+            if app_environment:
+                app_environment = f"ENV {app_environment}\n\n"
+            template = (
+                "# syntax=docker/dockerfile:1\n"
+                f"FROM {manager_config['base_image']}\n\n"
+                f"{manager_config['setup']}"
+                "WORKDIR /app\n\n"
+                f"{install}"
+                f"{manager_config['copy_sources']}"
+                "${build}"
+                f"{manager_config['environment']}"
+                f"{app_environment}"
+                "${expose}CMD ${command}\n"
+            )
         return self.render_template(
             template,
-            project_name=project_name,
+            project_name=project_info.get("name", ""),
             python_version=self.config.python_version,
             command=command,
+            expose=expose,
+            build=build,
+        )
+
+    @staticmethod
+    def _runtime_template(
+        manager_config: dict, install: str, app_environment: str = ""
+    ) -> str:
+        """Build a multi-stage template: a builder and a slim runtime stage.
+
+        The builder installs the dependencies and precompiles the bytecode of
+        the environment and sources. The runtime stage only copies them, runs
+        as a non-root user and never writes bytecode.
+
+        :param manager_config: Configuration of the dependencies manager
+        :param install: Install steps of the dependencies
+        :param app_environment: Additional runtime environment variable
+        :return: The Dockerfile template
+        """
+        environment = "PYTHONDONTWRITEBYTECODE=1 \\\n    PYTHONUNBUFFERED=1"
+        for variable in (manager_config["runtime_environment"], app_environment):
+            if variable:
+                environment += f" \\\n    {variable}"
+        return (
+            "# syntax=docker/dockerfile:1\n"
+            f"FROM {manager_config['base_image']} AS builder\n\n"
+            f"{manager_config['setup']}"
+            f"{manager_config['builder_setup']}"
+            "WORKDIR /app\n\n"
+            f"{install}"
+            f"{manager_config['copy_sources']}"
+            "${build}"
+            "RUN python -m compileall -q --invalidation-mode unchecked-hash /app\n\n"
+            f"FROM {manager_config['runtime_image']} AS runtime\n\n"
+            f"ENV {environment}\n\n"
+            f"{manager_config['runtime_setup']}"
+            "WORKDIR /app\n\n"
+            "COPY --from=builder /app /app\n\n"
+            f"USER {manager_config['runtime_user']}\n\n"
+            "${expose}CMD ${command}\n"
         )
 
     def generate_dockerignore(self) -> str:
@@ -41,6 +222,8 @@ CMD ${command}
 *.pyd
 .Python
 env
+venv
+.venv
 pip-log.txt
 pip-delete-this-directory.txt
 .tox
@@ -55,4 +238,5 @@ coverage.xml
 .mypy_cache
 .pytest_cache
 .hypothesis
+static/dist
 """
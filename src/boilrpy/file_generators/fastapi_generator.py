@@ -0,0 +1,102 @@
+from boilrpy.file_generators.base_generator import BaseGenerator
+
+
+class FastAPIGenerator(BaseGenerator):
+    """
+    FastAPI structure generator.
+    """
+
+    def generate(self, *args, **kwargs) -> None:
+        project_info = args[0] if args else {}
+        self.generate_app_file(project_info)
+        self.generate_dot_env_file()
+
+    def generate_app_file(self, project_info: dict) -> str:
+        """
+        Generate app file content.
+
+        Each worker opens one pooled HTTP client at startup and the async
+        routes share it, so concurrent requests reuse the same connections.
+
+        :param project_info: Dictionary containing project information
+        :return: Content of app file
+        """
+        template = """import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import httpx
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request
+
+
+load_dotenv()
+APP_ENV = os.getenv("APP_ENV", "production")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One connection pool per worker, shared by every request
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "20")),
+    )
+    async with httpx.AsyncClient(
+        base_url=os.getenv("UPSTREAM_URL", "https://httpbin.org"),
+        limits=limits,
+        timeout=float(os.getenv("HTTP_TIMEOUT", "10")),
+    ) as client:
+        app.state.http_client = client
+        yield
+
+
+app = FastAPI(title="${project_name}", debug=APP_ENV == "development", lifespan=lifespan)
+
+
+@app.get("/")
+async def index():
+    return {"message": "Welcome to ${project_name}"}
+
+
+@app.get("/upstream")
+async def upstream(request: Request):
+    client: httpx.AsyncClient = request.app.state.http_client
+    response = await client.get("/get")
+    return {"status": response.status_code}
+
+
+@app.get("/fan-out")
+async def fan_out(request: Request, count: int = 3):
+    # The calls run concurrently on the event loop, over the shared pool
+    client: httpx.AsyncClient = request.app.state.http_client
+    responses = await asyncio.gather(
+        *(client.get("/get", params={"call": call}) for call in range(count))
+    )
+    return {"statuses": [response.status_code for response in responses]}
+
+
+if __name__ == "__main__":
+    # Development server, see the README for the production command
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        reload=APP_ENV == "development",
+    )
+"""
+        return self.render_template(template, project_name=project_info["name"].title())
+
+    def generate_dot_env_file(self) -> str:
+        """
+        Generate .env file content.
+
+        :return: Content of .env file
+        """
+        return """# development or production, read by app.py
+APP_ENV=development
+UPSTREAM_URL=https://httpbin.org
+HTTP_MAX_CONNECTIONS=100
+HTTP_MAX_KEEPALIVE=20
+HTTP_TIMEOUT=10
+"""
@@ -1,59 +1,48 @@
+import functools
+from typing import Dict, Tuple
 from boilrpy.file_generators.base_generator import BaseGenerator
 
-
-class GitignoreGenerator(BaseGenerator):
-    """
-    Generator for .gitignore file.
-    """
-
-    def generate(self, *args, **kwargs) -> str:
-        """
-        Generate the content for .gitignore file.
-
-        :return: Content of .gitignore file
-        """
-        return """# Python
+GITIGNORE_FRAGMENTS: Dict[str, str] = {
+    "python": """# Python
 __pycache__/
 *.py[cod]
 *$py.class
-
-# Virtual environments
-venv/
-.env
-.venv
-env/
-
-# Poetry
-.poetry/
-
-# PyCharm
-.idea/
-
-# VS Code
-.vscode/
-
-# Jupyter Notebook
-.ipynb_checkpoints
-
-# Distribution / packaging
 .Python
+""",
+    "packaging": """# Distribution / packaging
 build/
 develop-eggs/
 dist/
 downloads/
 eggs/
 .eggs/
-lib/
-lib64/
 parts/
 sdist/
-var/
 wheels/
 *.egg-info/
 .installed.cfg
 *.egg
-
-# Pytest
+""",
+    "environment": """# Environment variables
+.env
+""",
+    "pip": """# Virtual environments
+venv/
+.venv/
+env/
+""",
+    "poetry": """# Poetry
+.venv/
+.poetry/
+""",
+    "uv": """# uv
+.venv/
+""",
+    "conda": """# Conda
+.conda/
+envs/
+""",
+    "tests": """# Pytest
 .pytest_cache/
 
 # Coverage reports
@@ -61,16 +50,113 @@ htmlcov/
 .coverage
 .coverage.*
 .cache
+""",
+    "pylint": """# Pylint
+.pylint.d/
+""",
+    "flask": """# Flask
+instance/
+.webassets-cache
+static/dist/
+""",
+    "docker": """# Docker
+docker-compose.override.yml
+.docker/
+""",
+    "data_science": """# Jupyter Notebook
+.ipynb_checkpoints
 
-# Matplotlib
+# Data science artifacts
 *.png
+*.h5
+*.pkl
+mlruns/
+output/
+""",
+    "ide": """# PyCharm
+.idea/
 
-# macOS
+# VS Code
+.vscode/
+
+# Vim
+*.swp
+""",
+    "os": """# macOS
 .DS_Store
 
 # Windows
 Thumbs.db
+""",
+}
 
-# Output folder
-output/
-"""
+DEFAULT_FRAGMENTS = ("python", "packaging", "environment", "pip", "tests", "ide", "os")
+
+
+def select_fragments(project_info: dict) -> Tuple[str, ...]:
+    """
+    Select the .gitignore fragments matching the project features.
+
+    :param project_info: Dictionary containing project information
+    :return: Fragment names, in library order
+    """
+    dependencies_manager = project_info.get("dependencies_manager", "pip")
+    selected = {"python", "packaging", "environment", "ide", "os"}
+    selected.add(dependencies_manager)
+    if project_info.get("create_tests", False):
+        selected.add("tests")
+    if project_info.get("use_pylint", False):
+        selected.add("pylint")
+    if project_info.get("use_flask", False):
+        selected.add("flask")
+    if project_info.get("use_docker", False):
+        selected.add("docker")
+    if dependencies_manager == "conda":
+        selected.add("data_science")
+    return tuple(name for name in GITIGNORE_FRAGMENTS if name in selected)
+
+
+@functools.lru_cache(maxsize=None)
+def merge_fragments(fragment_names: Tuple[str, ...]) -> str:
+    """
+    Merge fragments, dropping the patterns already listed by a previous one.
+
+    The result is cached per fragment set.
+
+    :param fragment_names: Names of the fragments to merge
+    :return: Content of the .gitignore file
+    """
+    seen = set()
+    sections = []
+    for name in fragment_names:
+        for block in GITIGNORE_FRAGMENTS[name].strip().split("\n\n"):
+            comments = [line for line in block.splitlines() if line.startswith("#")]
+            patterns = [
+                line
+                for line in block.splitlines()
+                if not line.startswith("#") and line not in seen
+            ]
+            seen.update(patterns)
+            if patterns:
+                sections.append("\n".join(comments + patterns))
+    return "\n\n".join(sections) + "\n"
+
+
+class GitignoreGenerator(BaseGenerator):
+    """
+    Generator for .gitignore file.
+    """
+
+    def generate(self, *args, **kwargs) -> str:
+        """
+        Generate the content for .gitignore file.
+
+        :param project_info: Dictionary containing project information, used
+            to select the fragments. The common Python fragments are used
+            when it is omitted.
+        :return: Content of .gitignore file
+        """
+        project_info = args[0] if args else None
+        if project_info is None:
+            return merge_fragments(DEFAULT_FRAGMENTS)
+        return merge_fragments(select_fragments(project_info))
@@ -0,0 +1,157 @@
+from boilrpy.file_generators.base_generator import BaseGenerator
+
+
+class LoggingGenerator(BaseGenerator):
+    """
+    Generator for the logging configuration of the apps.
+    """
+
+    # Sections of logging_config.py tagging the records of Flask requests
+    REQUEST_ID_PARTS = {
+        "request_imports": "import uuid\n\nfrom flask import request\n",
+        "request_ids": '''
+
+def init_request_ids(app):
+    """Tag the records of each request with an id, sent back as X-Request-ID.
+
+    The id is read from the X-Request-ID header of the request, or generated.
+    """
+
+    @app.before_request
+    def set_request_id():
+        request_id.set(request.headers.get("X-Request-ID") or uuid.uuid4().hex)
+
+    @app.after_request
+    def send_request_id(response):
+        response.headers["X-Request-ID"] = request_id.get()
+        return response
+
+    @app.teardown_request
+    def clear_request_id(exception=None):
+        request_id.set("-")
+''',
+    }
+
+    def generate(self, *args, **kwargs) -> str:
+        """
+        Generate logging_config.py content.
+
+        The records are written by a QueueListener thread, so logging does not
+        block the threads handling the requests. With Flask, each record holds
+        the id of its request.
+
+        :return: Content of logging_config.py
+        """
+        project_info = args[0] if args else {}
+        template = '''"""Non-blocking logging of the app.
+
+The root logger only puts the records on a queue, and a QueueListener thread
+writes them, so the handler I/O happens off the request threads. LOG_LEVEL and
+LOG_FORMAT (json or text) are read from the environment.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+${request_imports}
+# Id of the request being handled, added to every record
+request_id = contextvars.ContextVar("request_id", default="-")
+
+# The running QueueListener
+_state = {}
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"
+
+
+class RequestIdFilter(logging.Filter):
+    """Add the id of the current request to the records."""
+
+    def filter(self, record):
+        record.request_id = request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format the records as JSON lines."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        return json.dumps(entry)
+
+
+def configure_logging(level=None, log_format=None, stream=None):
+    """Send the records of the root logger through a queue.
+
+    A listener thread writes the queued records to the stream, stdout by
+    default. Configuring the logging again replaces the previous listener.
+    """
+    level = level or os.getenv("LOG_LEVEL", "INFO")
+    log_format = log_format or os.getenv("LOG_FORMAT", "json")
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Filters of the queue handler run in the thread that logs the record
+    queue_handler.addFilter(RequestIdFilter())
+    root = logging.getLogger()
+    for previous_handler in root.handlers[:]:
+        root.removeHandler(previous_handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    _state["listener"] = logging.handlers.QueueListener(log_queue, handler)
+    _state["listener"].start()
+
+
+def stop_logging():
+    """Write the queued records and stop the listener thread."""
+    listener = _state.pop("listener", None)
+    if listener is not None:
+        listener.stop()
+
+
+def _restart_listener():
+    # Threads do not survive a fork, e.g. of the gunicorn workers
+    listener = _state.pop("listener", None)
+    if listener is not None:
+        _state["listener"] = logging.handlers.QueueListener(
+            listener.queue, *listener.handlers
+        )
+        _state["listener"].start()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener)
+${request_ids}'''
+        parts = dict.fromkeys(self.REQUEST_ID_PARTS, "")
+        if project_info.get("use_flask", False):
+            parts.update(self.REQUEST_ID_PARTS)
+        return self.render_template(template, **parts)
+
+    def generate_dot_env_file(self) -> str:
+        """
+        Generate the .env settings of the logging.
+
+        :return: Lines of the .env file
+        """
+        return """# DEBUG, INFO, WARNING or ERROR, and json or text
+LOG_LEVEL=INFO
+LOG_FORMAT=json
+"""
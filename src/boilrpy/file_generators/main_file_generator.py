@@ -10,8 +10,31 @@ class MainFileGenerator(BaseGenerator):
         """
         Generate the content for main.py file.
 
+        With the use_logging option, main.py configures the non-blocking
+        logging of logging_config.py and logs instead of printing.
+
         :return: Content of main.py file
         """
+        project_info = args[0] if args else {}
+        if project_info.get("use_logging", False):
+            return """import logging
+
+from dotenv import load_dotenv
+
+from logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logger.info("Welcome to your new project!")
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    configure_logging()
+    main()
+"""
         return """def main():
     print("Welcome to your new project!")
     pass
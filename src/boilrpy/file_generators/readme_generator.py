@@ -1,3 +1,4 @@
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.base_generator import BaseGenerator
 
 
@@ -21,6 +22,11 @@ class ReadmeGenerator(BaseGenerator):
             ),
             "run_command": "poetry run python main.py",
             "flask_command": "poetry run flask run",
+            "serve_command": "poetry run gunicorn --config gunicorn.conf.py wsgi:app",
+            "fastapi_command": "poetry run uvicorn app:app --reload",
+            "fastapi_serve_command": (
+                "poetry run uvicorn app:app --host 0.0.0.0 --port 8000 --workers 4"
+            ),
             "test_command": "poetry run pytest",
         },
         "pip": {
@@ -51,14 +57,19 @@ class ReadmeGenerator(BaseGenerator):
             ),
             "run_command": "python main.py",
             "flask_command": "flask run",
+            "serve_command": "gunicorn --config gunicorn.conf.py wsgi:app",
+            "fastapi_command": "uvicorn app:app --reload",
+            "fastapi_serve_command": (
+                "uvicorn app:app --host 0.0.0.0 --port 8000 --workers 4"
+            ),
             "test_command": "pytest",
         },
         "uv": {
             "setup": (
                 "### Using uv\n\n"
-                "Create a virtual environment and install dependencies:\n\n"
+                "Create a virtual environment and install the locked dependencies:\n\n"
                 "```bash\n"
-                "uv venv\n"
+                "uv sync\n"
                 "```\n\n"
                 "Activate the virtual environment:\n\n"
                 "On Linux and macOS:\n\n"
@@ -68,34 +79,36 @@ class ReadmeGenerator(BaseGenerator):
                 "On Windows:\n\n"
                 "```bash\n"
                 ".venv\\Scripts\\activate\n"
-                "```\n\n"
-                "Install dependencies:\n\n"
-                "```bash\n"
-                "uv pip install -r requirements.txt\n"
                 "```"
             ),
             "run_command": "uv run python main.py",
             "flask_command": "uv run flask run",
+            "serve_command": "uv run gunicorn --config gunicorn.conf.py wsgi:app",
+            "fastapi_command": "uv run uvicorn app:app --reload",
+            "fastapi_serve_command": (
+                "uv run uvicorn app:app --host 0.0.0.0 --port 8000 --workers 4"
+            ),
             "test_command": "uv run pytest",
         },
         "conda": {
             "setup": (
                 "### Using Conda\n\n"
-                "Create a conda environment:\n\n"
+                "Create the conda environment with its dependencies:\n\n"
                 "```bash\n"
-                "conda create -n myproject python=3.11\n"
+                "conda env create -f environment.yml\n"
                 "```\n\n"
                 "Activate the environment:\n\n"
                 "```bash\n"
                 "conda activate myproject\n"
-                "```\n\n"
-                "Install dependencies:\n\n"
-                "```bash\n"
-                "conda install --file requirements.txt\n"
                 "```"
             ),
             "run_command": "python main.py",
             "flask_command": "flask run",
+            "serve_command": "gunicorn --config gunicorn.conf.py wsgi:app",
+            "fastapi_command": "uvicorn app:app --reload",
+            "fastapi_serve_command": (
+                "uvicorn app:app --host 0.0.0.0 --port 8000 --workers 4"
+            ),
             "test_command": "pytest",
         },
     }
@@ -105,10 +118,16 @@ class ReadmeGenerator(BaseGenerator):
         Generate the content for README.md file.
 
         :param project_info: Dictionary containing project information
+        :param dependencies: The project dependencies, resolved from
+            project_info when omitted
         :param kwargs: Additional keyword arguments
         :return: Content of README.md file
         """
         project_info = args[0] if args else {}
+        dependencies = args[1] if len(args) > 1 else None
+        if dependencies is None:
+            dependencies = ProjectDependencies.from_project_info(project_info)
+        dependencies_info = self._generate_dependencies_info(dependencies)
 
         dep_manager = project_info.get("dependencies_manager", "pip").lower()
         manager_config = self.DEP_MANAGER_CONFIG.get(
@@ -119,7 +138,23 @@ class ReadmeGenerator(BaseGenerator):
         setup_instructions = manager_config["setup"]
 
         if project_info.get("use_flask"):
-            usage_instructions = manager_config["flask_command"]
+            usage_instructions = (
+                f"{manager_config['flask_command']}\n\n"
+                "To serve the application in production, set `APP_ENV=production` "
+                "in `.env` and start gunicorn, configured by `gunicorn.conf.py`:\n\n"
+                f"{manager_config['serve_command']}\n\n"
+                "In production, static URLs point to the minified, fingerprinted and "
+                "precompressed copies in `static/dist` (`.br` files need the optional "
+                "brotli package). Rebuild them after editing the static files:\n\n"
+                "python build_assets.py"
+            )
+        elif project_info.get("use_fastapi"):
+            usage_instructions = (
+                f"{manager_config['fastapi_command']}\n\n"
+                "To serve the application in production, set `APP_ENV=production` "
+                "in `.env` and start several uvicorn workers:\n\n"
+                f"{manager_config['fastapi_serve_command']}"
+            )
         else:
             usage_instructions = manager_config["run_command"]
 
@@ -148,7 +183,7 @@ ${description}
 ## Setup
 
 ${setup_instructions}
-
+${dependencies_info}
 ## Usage
 
 To run the project, use the following comand:
@@ -175,8 +210,31 @@ ${license_info}
             name=project_info["name"].title(),
             description=project_info["description"],
             setup_instructions=setup_instructions,
+            dependencies_info=dependencies_info,
             usage_instructions=usage_instructions,
             testing_instructions=testing_instructions,
             pylint_instructions=pylint_instructions,
             license_info=license_info,
         ).lstrip()
+
+    @staticmethod
+    def _generate_dependencies_info(dependencies: ProjectDependencies) -> str:
+        """
+        Generate the dependencies section listing the main and dev groups.
+
+        :param dependencies: The project dependencies
+        :return: The section, empty when the project has no dependencies
+        """
+        if not dependencies.main and not dependencies.dev:
+            return ""
+        dependencies_info = "\n## Dependencies\n"
+        for title, requirements in (
+            ("Main", dependencies.requirements()),
+            ("Development", dependencies.dev_requirements()),
+        ):
+            if requirements:
+                dependencies_info += f"\n{title}:\n\n"
+                dependencies_info += "".join(
+                    f"- `{requirement}`\n" for requirement in requirements
+                )
+        return dependencies_info
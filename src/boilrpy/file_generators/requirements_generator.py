@@ -1,3 +1,4 @@
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.base_generator import BaseGenerator
 
 
@@ -5,14 +6,12 @@ class RequirementsGenerator(BaseGenerator):
     """Generate the requirements.txt file."""
 
     def generate(self, *args, **kwargs) -> str:
-        project_info = args[0] if args else {}
-        package_map = {
-            "pylint": "use_pylint",
-            "flask": "use_flask",
-            "python-dotenv": "use_flask",
-            "pytest": "create_tests",
-        }
-        packages = [
-            pkg for pkg, key in package_map.items() if project_info.get(key, False)
-        ]
-        return "\n".join(packages)
+        """
+        Generate the content for requirements.txt file.
+
+        :param dependencies: The project dependencies
+        :return: Content of requirements.txt file, listing the main group
+        """
+        dependencies = args[0] if args else ProjectDependencies([], [])
+        requirements = dependencies.requirements()
+        return "".join(f"{requirement}\n" for requirement in requirements)
@@ -1,7 +1,8 @@
 from contextlib import contextmanager
 import os
-from typing import Generator
+from typing import Dict, Generator, Optional
 from boilrpy.config import Config
+from boilrpy.utils.content_hasher import ContentHasher
 
 
 class FileWriterError(Exception):
@@ -13,6 +14,7 @@ class FileWriter:
 
     def __init__(self, charset: str = Config().get_charset()) -> None:
         self.charset = charset
+        self.written_files: Dict[str, str] = {}
 
     @contextmanager
     def open_file(self, filename: str, mode: str = "w") -> Generator:
@@ -47,6 +49,7 @@ class FileWriter:
                 file.write(content)
         except FileWriterError as e:
             raise FileWriterError(f"Error writing to file {filename}: {e}") from e
+        self.written_files[filename] = ContentHasher.hash_text(content, self.charset)
 
     def create_directory(self, directory: str, exist_ok: bool = True) -> None:
         """Create a directory.
@@ -60,3 +63,55 @@ class FileWriter:
             os.makedirs(directory, exist_ok=exist_ok)
         except OSError as e:
             raise FileWriterError(f"Error creating directory {directory}: {e}") from e
+
+
+class IncrementalFileWriter(FileWriter):
+    """FileWriter that only rewrites the generated files whose content changed.
+
+    Files edited by the user since the last generation are detected by
+    comparing their hash with the recorded one and are left untouched.
+    """
+
+    def __init__(
+        self,
+        charset: str = Config().get_charset(),
+        recorded_files: Optional[Dict[str, str]] = None,
+    ) -> None:
+        super().__init__(charset)
+        self.recorded_files = recorded_files or {}
+        self.created_files: list = []
+        self.updated_files: list = []
+        self.unchanged_files: list = []
+        self.modified_files: list = []
+
+    def write_file(self, filename: str, content: str) -> None:
+        """Write content to a file only if it differs from the file on disk.
+
+        Args:
+            filename (str): The name of the file to write to.
+            content (str): The content to write to the file.
+        """
+        recorded_hash = self.recorded_files.get(filename)
+        new_hash = ContentHasher.hash_text(content, self.charset)
+        try:
+            disk_hash = ContentHasher.hash_file(filename, self.charset)
+        except FileNotFoundError:
+            disk_hash = None
+        except (OSError, UnicodeDecodeError) as e:
+            raise FileWriterError(f"Error reading file {filename}: {e}") from e
+
+        if disk_hash == new_hash:
+            self.written_files[filename] = new_hash
+            self.unchanged_files.append(filename)
+        elif disk_hash != recorded_hash:
+            # Edited (or deleted) by the user: keep the recorded hash so the
+            # file keeps being reported on the next update.
+            if recorded_hash:
+                self.written_files[filename] = recorded_hash
+            self.modified_files.append(filename)
+        else:
+            super().write_file(filename, content)
+            if disk_hash is None:
+                self.created_files.append(filename)
+            else:
+                self.updated_files.append(filename)
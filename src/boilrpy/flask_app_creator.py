@@ -1,3 +1,5 @@
+from typing import Optional
+from boilrpy.asset_pipeline import build_assets
 from boilrpy.config import Config
 from boilrpy.file_generator import FileGenerator
 from boilrpy.file_writer import FileWriter
@@ -6,10 +8,10 @@ from boilrpy.file_writer import FileWriter
 class FlaskAppCreator:
     """Class to create a new Flask app."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, file_writer: Optional[FileWriter] = None):
         self.config = config
         self.file_generator = FileGenerator(config)
-        self.file_writer = FileWriter(self.config.get_charset())
+        self.file_writer = file_writer or FileWriter(self.config.get_charset())
 
     def create_flask_project(self, project_info: dict) -> None:
         """Create a new Flask app.
@@ -18,22 +20,54 @@ class FlaskAppCreator:
             project_info (dict): Dictionary containing project information
         """
         self._create_flask_folders()
-        self._create_flask_app_file()
-        self._create_flask_dot_env()
+        self._create_flask_app_file(project_info)
+        self._create_flask_server_files()
+        self._create_flask_metrics_files(project_info)
+        self._create_flask_database_files(project_info)
+        self._create_flask_dot_env(project_info)
         self._create_flask_template_files(project_info)
         self._create_flask_static_files()
+        self._build_flask_assets()
 
     def _create_flask_folders(self) -> None:
         self.file_writer.create_directory("templates")
         self.file_writer.create_directory("static/css")
         self.file_writer.create_directory("static/js")
 
-    def _create_flask_app_file(self) -> None:
-        content = self.file_generator.generate_flask_app_file()
+    def _create_flask_app_file(self, project_info: dict) -> None:
+        content = self.file_generator.generate_flask_app_file(project_info)
         self.file_writer.write_file("app.py", content)
 
-    def _create_flask_dot_env(self) -> None:
-        content = self.file_generator.generate_dot_env_file()
+    def _create_flask_server_files(self) -> None:
+        content = self.file_generator.generate_wsgi_file()
+        self.file_writer.write_file("wsgi.py", content)
+        content = self.file_generator.generate_gunicorn_conf()
+        self.file_writer.write_file("gunicorn.conf.py", content)
+        content = self.file_generator.generate_build_assets_script()
+        self.file_writer.write_file("build_assets.py", content)
+
+    def _create_flask_metrics_files(self, project_info: dict) -> None:
+        if not project_info.get("use_metrics", False):
+            return
+        content = self.file_generator.generate_metrics_module()
+        self.file_writer.write_file("metrics.py", content)
+        if project_info.get("create_tests", False):
+            content = self.file_generator.generate_metrics_test()
+            self.file_writer.write_file("tests/test_metrics.py", content)
+
+    def _create_flask_database_files(self, project_info: dict) -> None:
+        if not project_info.get("use_database", False):
+            return
+        content = self.file_generator.generate_database_module()
+        self.file_writer.write_file("database.py", content)
+        if project_info.get("create_tests", False):
+            content = self.file_generator.generate_database_fixture()
+            self.file_writer.write_file("tests/conftest.py", content)
+            content = self.file_generator.generate_database_test()
+            self.file_writer.write_file("tests/test_database.py", content)
+
+    def _create_flask_dot_env(self, project_info: dict) -> None:
+        content = self.file_generator.generate_dot_env_file(project_info)
         self.file_writer.write_file(".env", content)
 
     def _create_flask_template_files(self, project_info: dict) -> None:
@@ -47,3 +81,11 @@ class FlaskAppCreator:
         self.file_writer.write_file("static/css/style.css", css_content)
         js_content = self.file_generator.generate_script_file()
         self.file_writer.write_file("static/js/script.js", js_content)
+
+    def _build_flask_assets(self) -> None:
+        """Minify, fingerprint and precompress the static files.
+
+        The build output is not tracked in the project manifest: it is
+        derived from the static files and rebuilt by build_assets.py.
+        """
+        build_assets("static")
@@ -0,0 +1,347 @@
+"""Write a git repository in-process, without spawning git."""
+
+import configparser
+import fnmatch
+import hashlib
+import os
+import stat
+import struct
+import subprocess
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+REGULAR_FILE_MODE = 0o100644
+EXECUTABLE_FILE_MODE = 0o100755
+SYMLINK_MODE = 0o120000
+TREE_MODE = 0o40000
+
+
+class GitWriterError(Exception):
+    """Exception raised when the git repository cannot be written."""
+
+
+class GitIdentity:
+    """Name and email used for author and committer lines."""
+
+    def __init__(self, name: str, email: str = ""):
+        self.name = name
+        self.email = email
+
+    @classmethod
+    def from_environment(cls, default_name: str = "") -> "GitIdentity":
+        """Resolve the identity like git does, without spawning git.
+
+        The GIT_AUTHOR_* environment variables take precedence over the user
+        section of the global git configuration files.
+
+        Args:
+            default_name (str): Name used when no identity is configured.
+
+        Returns:
+            GitIdentity: The resolved identity.
+        """
+        name = os.environ.get("GIT_AUTHOR_NAME")
+        email = os.environ.get("GIT_AUTHOR_EMAIL")
+        if name and email:
+            return cls(name, email)
+
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        parser.read(
+            [
+                os.path.join(
+                    os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
+                    "git",
+                    "config",
+                ),
+                os.path.expanduser("~/.gitconfig"),
+            ]
+        )
+        if parser.has_section("user"):
+            name = name or parser.get("user", "name", fallback=None)
+            email = email or parser.get("user", "email", fallback=None)
+        return cls(name or default_name or "boilrpy", email or "")
+
+    def signature(self, timestamp: Optional[int] = None) -> str:
+        """Format the identity as a git signature line."""
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        offset = time.localtime(timestamp).tm_gmtoff // 60
+        sign = "+" if offset >= 0 else "-"
+        hours, minutes = divmod(abs(offset), 60)
+        return f"{self.name} <{self.email}> {timestamp} {sign}{hours:02d}{minutes:02d}"
+
+
+class GitignoreMatcher:
+    """Minimal .gitignore matcher for the patterns boilrpy generates."""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = []
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith(("#", "!")):
+                continue
+            directory_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            self.patterns.append((pattern.lstrip("/"), anchored, directory_only))
+
+    @classmethod
+    def from_file(cls, path: str) -> "GitignoreMatcher":
+        """Read the patterns of a .gitignore file, if it exists."""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return cls(file.read().splitlines())
+        except FileNotFoundError:
+            return cls([])
+
+    def is_ignored(self, relative_path: str, is_directory: bool = False) -> bool:
+        """Return whether a path relative to the repository root is ignored."""
+        name = relative_path.rsplit("/", 1)[-1]
+        for pattern, anchored, directory_only in self.patterns:
+            if directory_only and not is_directory:
+                continue
+            candidate = relative_path if anchored else name
+            if fnmatch.fnmatchcase(candidate, pattern):
+                return True
+        return False
+
+
+class GitWriter:
+    """
+    Create a git repository in-process.
+
+    The writer creates HEAD, config and refs, stores loose objects and writes
+    the index, so a freshly generated project gets its repository and initial
+    commit without spawning git. When the objects cannot be written natively,
+    the commit is created by a single `git fast-import` process instead.
+    """
+
+    def __init__(self, repo_path: str = ".", branch: str = "main"):
+        self.repo_path = repo_path
+        self.git_dir = os.path.join(repo_path, ".git")
+        self.branch = branch
+
+    def init(self, config: Optional[Dict[str, Dict[str, str]]] = None) -> None:
+        """Create the .git directory.
+
+        Args:
+            config (dict): Additional repository configuration, as a mapping
+                of section names to key/value pairs.
+
+        Raises:
+            GitWriterError: If the repository already exists or cannot be written.
+        """
+        if os.path.exists(self.git_dir):
+            raise GitWriterError(f"A git repository already exists in {self.repo_path}")
+
+        repository_config = {
+            "core": {
+                "repositoryformatversion": "0",
+                "filemode": "false" if os.name == "nt" else "true",
+                "bare": "false",
+                "logallrefupdates": "true",
+            }
+        }
+        for section, values in (config or {}).items():
+            repository_config.setdefault(section, {}).update(values)
+
+        try:
+            for directory in (
+                "objects/info",
+                "objects/pack",
+                "refs/heads",
+                "refs/tags",
+            ):
+                os.makedirs(os.path.join(self.git_dir, directory))
+            self._write(".git/HEAD", f"ref: refs/heads/{self.branch}\n".encode())
+            self._write(".git/config", self._format_config(repository_config).encode())
+            self._write(
+                ".git/description",
+                b"Unnamed repository; edit this file 'description' to name the "
+                b"repository.\n",
+            )
+        except OSError as e:
+            raise GitWriterError(f"Error initializing git repository: {e}") from e
+
+    def commit_all(self, message: str, identity: GitIdentity) -> str:
+        """Commit every file of the working tree that is not ignored.
+
+        Args:
+            message (str): The commit message.
+            identity (GitIdentity): Author and committer of the commit.
+
+        Returns:
+            str: The hexadecimal id of the commit.
+        """
+        files = self._collect_files()
+        signature = identity.signature()
+        try:
+            commit_id = self._commit_natively(files, message, signature)
+        except OSError:
+            commit_id = self._commit_with_fast_import(files, message, signature)
+        self._write_index(files)
+        return commit_id
+
+    def _collect_files(self) -> List[Tuple[str, int, bytes]]:
+        """Return the (path, mode, content) of the files to commit, sorted."""
+        matcher = GitignoreMatcher.from_file(os.path.join(self.repo_path, ".gitignore"))
+        files = []
+        for root, directories, filenames in os.walk(self.repo_path):
+            relative_root = os.path.relpath(root, self.repo_path).replace(os.sep, "/")
+            prefix = "" if relative_root == "." else f"{relative_root}/"
+            directories[:] = [
+                directory
+                for directory in directories
+                if directory != ".git"
+                and not matcher.is_ignored(prefix + directory, is_directory=True)
+            ]
+            # Symbolic links to directories are committed as links, not walked
+            filenames += [
+                directory
+                for directory in directories
+                if os.path.islink(os.path.join(root, directory))
+            ]
+            directories[:] = [
+                directory for directory in directories if directory not in filenames
+            ]
+            for filename in filenames:
+                relative_path = prefix + filename
+                if matcher.is_ignored(relative_path):
+                    continue
+                path = os.path.join(root, filename)
+                if os.path.islink(path):
+                    files.append(
+                        (relative_path, SYMLINK_MODE, os.readlink(path).encode())
+                    )
+                    continue
+                mode = (
+                    EXECUTABLE_FILE_MODE
+                    if os.stat(path).st_mode & stat.S_IXUSR
+                    else REGULAR_FILE_MODE
+                )
+                with open(path, "rb") as file:
+                    files.append((relative_path, mode, file.read()))
+        return sorted(files, key=lambda entry: entry[0].encode())
+
+    def _commit_natively(
+        self, files: List[Tuple[str, int, bytes]], message: str, signature: str
+    ) -> str:
+        tree: dict = {}
+        for path, mode, content in files:
+            *directories, filename = path.split("/")
+            node = tree
+            for directory in directories:
+                node = node.setdefault(directory, {})
+            node[filename] = (mode, self._write_object("blob", content))
+
+        commit = (
+            f"tree {self._write_tree(tree)}\n"
+            f"author {signature}\n"
+            f"committer {signature}\n\n"
+            f"{message}\n"
+        )
+        commit_id = self._write_object("commit", commit.encode())
+        self._write(f".git/refs/heads/{self.branch}", f"{commit_id}\n".encode())
+        return commit_id
+
+    def _write_tree(self, tree: dict) -> str:
+        entries = []
+        for name, value in tree.items():
+            if isinstance(value, dict):
+                entries.append((name + "/", TREE_MODE, name, self._write_tree(value)))
+            else:
+                mode, object_id = value
+                entries.append((name, mode, name, object_id))
+
+        content = b""
+        for _, mode, name, object_id in sorted(entries, key=lambda e: e[0].encode()):
+            content += f"{mode:o} {name}".encode() + b"\0" + bytes.fromhex(object_id)
+        return self._write_object("tree", content)
+
+    def _write_object(self, object_type: str, content: bytes) -> str:
+        data = f"{object_type} {len(content)}".encode() + b"\0" + content
+        object_id = hashlib.sha1(data).hexdigest()
+        path = os.path.join(self.git_dir, "objects", object_id[:2], object_id[2:])
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(zlib.compress(data))
+        return object_id
+
+    def _commit_with_fast_import(
+        self, files: List[Tuple[str, int, bytes]], message: str, signature: str
+    ) -> str:
+        message_data = f"{message}\n".encode()
+        stream = [
+            f"commit refs/heads/{self.branch}\nmark :1\n".encode(),
+            f"author {signature}\ncommitter {signature}\n".encode(),
+            f"data {len(message_data)}\n".encode() + message_data,
+        ]
+        for path, mode, content in files:
+            stream.append(f"M {mode:o} inline {path}\ndata {len(content)}\n".encode())
+            stream.append(content + b"\n")
+        stream.append(b"get-mark :1\n")
+
+        try:
+            result = subprocess.run(
+                ["git", "fast-import", "--quiet"],
+                input=b"".join(stream),
+                cwd=self.repo_path,
+                capture_output=True,
+                check=True,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError) as e:
+            raise GitWriterError(f"Error creating initial commit: {e}") from e
+        return result.stdout.decode().strip()
+
+    def _write_index(self, files: List[Tuple[str, int, bytes]]) -> None:
+        """Write a version 2 index so the committed files show as clean."""
+        entries = []
+        for path, mode, content in files:
+            file_stat = os.lstat(os.path.join(self.repo_path, path))
+            object_id = hashlib.sha1(
+                f"blob {len(content)}".encode() + b"\0" + content
+            ).digest()
+            name = path.encode()
+            entry = (
+                struct.pack(
+                    ">10I",
+                    *(
+                        value & 0xFFFFFFFF
+                        for value in (
+                            int(file_stat.st_ctime),
+                            file_stat.st_ctime_ns % 1_000_000_000,
+                            int(file_stat.st_mtime),
+                            file_stat.st_mtime_ns % 1_000_000_000,
+                            file_stat.st_dev,
+                            file_stat.st_ino,
+                            mode,
+                            file_stat.st_uid,
+                            file_stat.st_gid,
+                            file_stat.st_size,
+                        )
+                    ),
+                )
+                + object_id
+                + struct.pack(">H", min(len(name), 0xFFF))
+                + name
+            )
+            entries.append(entry + b"\0" * (8 - len(entry) % 8))
+
+        data = b"DIRC" + struct.pack(">II", 2, len(entries)) + b"".join(entries)
+        try:
+            self._write(".git/index", data + hashlib.sha1(data).digest())
+        except OSError as e:
+            raise GitWriterError(f"Error writing git index: {e}") from e
+
+    def _write(self, relative_path: str, content: bytes) -> None:
+        with open(os.path.join(self.repo_path, relative_path), "wb") as file:
+            file.write(content)
+
+    @staticmethod
+    def _format_config(config: Dict[str, Dict[str, str]]) -> str:
+        lines = []
+        for section, values in config.items():
+            lines.append(f"[{section}]")
+            lines.extend(f"\t{key} = {value}" for key, value in values.items())
+        return "\n".join(lines) + "\n"
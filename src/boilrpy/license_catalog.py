@@ -0,0 +1,126 @@
+"""Indexed SPDX license catalog bundled with boilrpy."""
+
+import functools
+import json
+import os
+import re
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "data", "spdx_licenses.zip")
+
+VAR_PATTERN = re.compile(
+    r"<<var;name=[^;]*;original=(?P<original>.*?);match=.*?>>", re.DOTALL
+)
+OPTIONAL_PATTERN = re.compile(r"<<(?:beginOptional[^>]*|endOptional)>>")
+YEAR_PLACEHOLDERS = ("<year>", "[yyyy]", "[year]")
+AUTHOR_PLACEHOLDERS = (
+    "<copyright holders>",
+    "<copyright holder>",
+    "<owner>",
+    "<name of author>",
+    "[name of copyright owner]",
+)
+
+
+class UnknownLicenseError(ValueError):
+    """Exception raised when a license is not in the catalog."""
+
+
+class LicenseCatalog:
+    """
+    SPDX license catalog stored as a zip archive.
+
+    The archive holds a small index of license ids, names and aliases, and one
+    compressed member per license text. Only the index and the requested texts
+    are read, and nothing is read before the first lookup.
+    """
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._index: Optional[dict] = None
+        self._lookup: Dict[str, str] = {}
+        self._rendered: Dict[Tuple[str, str, str], str] = {}
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            with zipfile.ZipFile(self.path) as archive:
+                self._index = json.loads(archive.read("index.json"))
+            self._lookup = {
+                license_id.lower(): license_id for license_id in self._index["licenses"]
+            }
+            self._lookup.update(
+                {
+                    alias.lower(): license_id
+                    for alias, license_id in self._index["aliases"].items()
+                }
+            )
+        return self._index
+
+    def get_license_ids(self) -> List[str]:
+        """Returns the sorted list of SPDX license ids in the catalog."""
+        return sorted(self._load_index()["licenses"])
+
+    def resolve(self, license_name: str) -> str:
+        """
+        Resolve a license id or alias to its SPDX id.
+
+        Args:
+            license_name (str): SPDX id or alias, case-insensitive.
+
+        Returns:
+            str: The SPDX license id.
+
+        Raises:
+            UnknownLicenseError: If the license is not in the catalog.
+        """
+        self._load_index()
+        license_id = self._lookup.get(license_name.strip().lower())
+        if license_id is None:
+            raise UnknownLicenseError(f"Unknown SPDX license: '{license_name}'")
+        return license_id
+
+    def get_name(self, license_name: str) -> str:
+        """Returns the full name of a license."""
+        return self._load_index()["licenses"][self.resolve(license_name)]["name"]
+
+    def get_template(self, license_name: str) -> str:
+        """Returns the raw SPDX template of a license."""
+        license_id = self.resolve(license_name)
+        with zipfile.ZipFile(self.path) as archive:
+            return archive.read(f"licenses/{license_id}.txt").decode("utf-8")
+
+    def render(self, license_name: str, year: str, author: str) -> str:
+        """
+        Render a license text for a copyright year and holder.
+
+        Rendered texts are cached per (license id, year, author).
+
+        Args:
+            license_name (str): SPDX id or alias, case-insensitive.
+            year (str): Copyright year.
+            author (str): Copyright holder.
+
+        Returns:
+            str: The license text.
+        """
+        key = (self.resolve(license_name), year, author)
+        if key not in self._rendered:
+            text = VAR_PATTERN.sub(
+                lambda match: match.group("original").strip(),
+                self.get_template(key[0]),
+            )
+            text = OPTIONAL_PATTERN.sub("", text)
+            for placeholder in YEAR_PLACEHOLDERS:
+                text = text.replace(placeholder, year)
+            for placeholder in AUTHOR_PLACEHOLDERS:
+                text = text.replace(placeholder, author)
+            self._rendered[key] = "\n".join(line.rstrip() for line in text.splitlines())
+            self._rendered[key] += "\n"
+        return self._rendered[key]
+
+
+@functools.lru_cache(maxsize=1)
+def get_license_catalog() -> LicenseCatalog:
+    """Returns the shared license catalog."""
+    return LicenseCatalog()
@@ -0,0 +1,176 @@
+import json
+import os
+from importlib import metadata
+from typing import Dict, Optional
+from boilrpy.config import Config
+from boilrpy.utils.content_hasher import ContentHasher
+
+MANIFEST_FILENAME = ".boilrpy.json"
+
+FILE_UNCHANGED = "unchanged"
+FILE_MODIFIED = "modified"
+FILE_MISSING = "missing"
+
+
+class ManifestError(Exception):
+    """Exception raised when a project manifest cannot be read or written."""
+
+
+def get_boilrpy_version() -> str:
+    """Return the installed boilrpy version."""
+    try:
+        return metadata.version("boilrpy")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class ProjectManifest:
+    """
+    Record of the project information and of the files generated by boilrpy.
+
+    Every generated file is recorded with its content hash, size and
+    modification time, so drift can be detected without hashing the files
+    whose size and modification time did not change.
+    """
+
+    def __init__(
+        self,
+        project_info: dict,
+        files: Optional[Dict[str, str]] = None,
+        boilrpy_version: Optional[str] = None,
+    ):
+        self.project_info = project_info
+        self.files = files or {}
+        self.boilrpy_version = boilrpy_version or get_boilrpy_version()
+        self.file_stats: Dict[str, dict] = {}
+
+    def to_dict(self) -> dict:
+        """Return the manifest as a JSON serializable dictionary."""
+        files = {}
+        for filename, file_hash in sorted(self.files.items()):
+            files[filename] = {"sha256": file_hash, **self.file_stats.get(filename, {})}
+        return {
+            "boilrpy_version": self.boilrpy_version,
+            "project_info": self.project_info,
+            "files": files,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectManifest":
+        """Build a manifest from its dictionary representation.
+
+        Args:
+            data (dict): Dictionary read from a manifest file.
+
+        Returns:
+            ProjectManifest: The manifest.
+        """
+        entries = data.get("files", {})
+        manifest = cls(
+            data["project_info"],
+            {filename: entry["sha256"] for filename, entry in entries.items()},
+            data.get("boilrpy_version", "unknown"),
+        )
+        manifest.file_stats = {
+            filename: {"size": entry["size"], "mtime_ns": entry["mtime_ns"]}
+            for filename, entry in entries.items()
+            if "size" in entry and "mtime_ns" in entry
+        }
+        return manifest
+
+    def save(self, project_path: str, charset: str = Config().get_charset()) -> None:
+        """Write the manifest in the project directory.
+
+        The size and modification time of every recorded file are refreshed
+        before writing.
+
+        Args:
+            project_path (str): Path of the project directory.
+            charset (str): Charset of the manifest file.
+        """
+        self.boilrpy_version = get_boilrpy_version()
+        self.file_stats = {}
+        for filename in self.files:
+            try:
+                stat = os.stat(os.path.join(project_path, filename))
+            except OSError:
+                continue
+            self.file_stats[filename] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+
+        manifest_path = os.path.join(project_path, MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, "w", encoding=charset) as file:
+                json.dump(self.to_dict(), file, indent=2)
+                file.write("\n")
+        except OSError as e:
+            raise ManifestError(f"Error writing manifest {manifest_path}: {e}") from e
+
+    @classmethod
+    def load(
+        cls, project_path: str, charset: str = Config().get_charset()
+    ) -> "ProjectManifest":
+        """Read the manifest of a generated project.
+
+        Args:
+            project_path (str): Path of the project directory.
+            charset (str): Charset of the manifest file.
+
+        Returns:
+            ProjectManifest: The manifest.
+
+        Raises:
+            ManifestError: If the manifest is missing or invalid.
+        """
+        manifest_path = os.path.join(project_path, MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, "r", encoding=charset) as file:
+                return cls.from_dict(json.load(file))
+        except FileNotFoundError as e:
+            raise ManifestError(
+                f"No {MANIFEST_FILENAME} found in {project_path}. "
+                "Was this project generated by boilrpy?"
+            ) from e
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ManifestError(f"Invalid manifest {manifest_path}: {e}") from e
+
+    def check_drift(
+        self, project_path: str, charset: str = Config().get_charset()
+    ) -> Dict[str, str]:
+        """Compare the recorded files with the files on disk.
+
+        Files whose size and modification time match the recorded ones are
+        considered unchanged without being read.
+
+        Args:
+            project_path (str): Path of the project directory.
+            charset (str): Charset of the generated files.
+
+        Returns:
+            dict: Mapping of each recorded file to its status
+            (unchanged, modified or missing).
+        """
+        statuses = {}
+        for filename, file_hash in sorted(self.files.items()):
+            path = os.path.join(project_path, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                statuses[filename] = FILE_MISSING
+                continue
+
+            recorded_stat = self.file_stats.get(filename)
+            if recorded_stat == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+                statuses[filename] = FILE_UNCHANGED
+                continue
+
+            try:
+                disk_hash = ContentHasher.hash_file(path, charset)
+            except (OSError, UnicodeDecodeError):
+                disk_hash = None
+            statuses[filename] = (
+                FILE_UNCHANGED if disk_hash == file_hash else FILE_MODIFIED
+            )
+        return statuses
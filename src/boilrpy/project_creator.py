@@ -1,11 +1,14 @@
 import os
-import subprocess
 from colorama import Fore, Style
 from boilrpy.config import Config
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generator import FileGenerator
-from boilrpy.file_writer import FileWriter
+from boilrpy.file_writer import FileWriter, IncrementalFileWriter
+from boilrpy.git_writer import GitIdentity, GitWriter, GitWriterError
+from boilrpy.manifest import FILE_UNCHANGED, ProjectManifest
 from boilrpy.utils.string_formatter import StringFormatter
 from boilrpy.flask_app_creator import FlaskAppCreator
+from boilrpy.fastapi_app_creator import FastAPIAppCreator
 from boilrpy.dependency_creators import DependencyCreatorFactory
 
 
@@ -20,6 +23,7 @@ class ProjectCreator:
         self.charset = config.get_charset()
         self.file_generator = FileGenerator(config)
         self.file_writer = FileWriter(self.charset)
+        self.dependencies = None
 
     def create_project(self, project_info: dict) -> None:
         """
@@ -37,6 +41,7 @@ class ProjectCreator:
 
         project_info["name"] = self.project_name
         project_info["version"] = project_info.get("version") or "0.1.0"
+        self.dependencies = ProjectDependencies.from_project_info(project_info)
 
         if self._check_directory_exist(self.project_name):
             raise FileExistsError(f"Directory {self.project_name} already exists.")
@@ -45,21 +50,96 @@ class ProjectCreator:
         project_path = self._create_project_directory()
         os.chdir(project_path)
 
+        self._create_dependency_files(project_info)
+
+        self._generate_project_files(project_info)
+
+        self._write_manifest(project_info)
+
+        self._initialize_git_repository(project_info)
+
+    def update_project(self, project_path: str) -> IncrementalFileWriter:
+        """
+        Regenerate the files of an existing project.
+
+        The generators are run again against the project information recorded
+        in the project manifest, and only the files whose content changed are
+        rewritten. Files edited by the user are left untouched and reported.
+
+        Args:
+            project_path (str): Path of the project directory
+
+        Returns:
+            IncrementalFileWriter: The writer holding the update report.
+        """
+        manifest = ProjectManifest.load(project_path, self.charset)
+        project_info = manifest.project_info
+        self.project_name = project_info["name"]
+        self.dependencies = ProjectDependencies.from_project_info(project_info)
+
+        print(f"Updating project {self.project_name}...")
+        os.chdir(project_path)
+        self.file_writer = IncrementalFileWriter(self.charset, manifest.files)
+
+        self._generate_project_files(project_info)
+
+        self._write_manifest(project_info)
+
+        self._display_update_summary()
+        return self.file_writer
+
+    def check_project(self, project_path: str) -> dict:
+        """
+        Report the generated files that drifted from the project manifest.
+
+        Only the files recorded in the manifest are inspected, and files whose
+        size and modification time did not change are not read.
+
+        Args:
+            project_path (str): Path of the project directory
+
+        Returns:
+            dict: Mapping of each drifted file to its status
+        """
+        manifest = ProjectManifest.load(project_path, self.charset)
+        statuses = manifest.check_drift(project_path, self.charset)
+        drifted = {
+            filename: status
+            for filename, status in statuses.items()
+            if status != FILE_UNCHANGED
+        }
+
+        if not drifted:
+            print(f"{Fore.GREEN}{project_path}: up to date{Style.RESET_ALL}")
+        for filename, status in drifted.items():
+            print(f"{Fore.YELLOW}{project_path}: {filename} {status}{Style.RESET_ALL}")
+        return drifted
+
+    def _generate_project_files(self, project_info: dict) -> None:
+        """
+        Generate every file produced by boilrpy generators.
+
+        Args:
+            project_info (dict): Dictionary containing project information
+        """
         self._create_readme(project_info)
 
         self._create_license(project_info)
 
-        self._create_gitignore()
+        self._create_gitignore(project_info)
 
         self._create_changelog(project_info["version"])
 
-        self._create_dependency_files(project_info)
-
         self._create_dockerfile(project_info)
 
         self._create_test_folder(project_info["create_tests"])
 
-        self._create_main_file(project_info["use_flask"])
+        self._create_main_file(
+            project_info["use_flask"] or project_info.get("use_fastapi", False),
+            project_info,
+        )
+
+        self._create_logging_files(project_info)
 
         self._create_requirements_txt(project_info)
 
@@ -67,7 +147,7 @@ class ProjectCreator:
 
         self._create_flask_app(project_info)
 
-        self._initialize_git_repository()
+        self._create_fastapi_app(project_info)
 
     def _create_project_directory(self) -> str:
         """
@@ -90,7 +170,9 @@ class ProjectCreator:
         Returns:
             None
         """
-        content = self.file_generator.generate_readme(project_info)
+        content = self.file_generator.generate_readme(
+            project_info, self._resolve_dependencies(project_info)
+        )
         self.file_writer.write_file("README.md", content)
 
     def _create_license(self, project_info: dict) -> None:
@@ -101,8 +183,8 @@ class ProjectCreator:
         )
         self.file_writer.write_file("LICENSE", content)
 
-    def _create_gitignore(self) -> None:
-        content = self.file_generator.generate_gitignore()
+    def _create_gitignore(self, project_info: dict) -> None:
+        content = self.file_generator.generate_gitignore(project_info)
         self.file_writer.write_file(".gitignore", content)
 
     def _create_changelog(self, version: str) -> None:
@@ -116,21 +198,22 @@ class ProjectCreator:
             project_info (dict): Dictionary containing project information
         """
         dep_manager = project_info.get("dependencies_manager", "pip")
+        dependencies = self._resolve_dependencies(project_info)
 
         try:
             creator = DependencyCreatorFactory.create(dep_manager, self.config)
-            creator.create_dependency_file(project_info)
+            creator.create_dependency_file(project_info, dependencies)
         except ValueError as e:
             print(f"\n {e}")
             print("Falling back to pip...")
             creator = DependencyCreatorFactory.create("pip", self.config)
-            creator.create_dependency_file(project_info)
+            creator.create_dependency_file(project_info, dependencies)
 
     def _create_dockerfile(self, project_info: dict) -> None:
         if not project_info["use_docker"]:
             return
         content = self.file_generator.generate_dockerfile(
-            self.project_name, project_info["use_flask"]
+            project_info, self._resolve_dependencies(project_info)
         )
         self.file_writer.write_file("Dockerfile", content)
         ignore_content = self.file_generator.generate_dockerignore()
@@ -142,14 +225,31 @@ class ProjectCreator:
         self.file_writer.create_directory("tests")
         self.file_writer.write_file("tests/__init__.py", "")
 
-    def _create_main_file(self, use_flask: bool) -> None:
-        if use_flask:
+    def _create_main_file(self, use_web_app: bool, project_info: dict = None) -> None:
+        if use_web_app:
             return
-        content = self.file_generator.generate_main_file()
+        content = self.file_generator.generate_main_file(project_info)
         self.file_writer.write_file("main.py", content)
 
+    def _create_logging_files(self, project_info: dict) -> None:
+        if not project_info.get("use_logging", False):
+            return
+        if project_info.get("use_fastapi", False):
+            return
+        content = self.file_generator.generate_logging_config(project_info)
+        self.file_writer.write_file("logging_config.py", content)
+        if not project_info["use_flask"]:
+            # The .env file of Flask apps holds the logging settings
+            content = self.file_generator.generate_logging_dot_env_file()
+            self.file_writer.write_file(".env", content)
+
     def _create_requirements_txt(self, project_info: dict) -> None:
-        content = self.file_generator.generate_requirements_txt(project_info)
+        dep_manager = project_info.get("dependencies_manager", "pip")
+        if DependencyCreatorFactory.writes_requirements_txt(dep_manager):
+            return
+        content = self.file_generator.generate_requirements_txt(
+            self._resolve_dependencies(project_info)
+        )
         self.file_writer.write_file("requirements.txt", content)
 
     def _create_linter_file(self, use_pylint: bool) -> None:
@@ -161,28 +261,53 @@ class ProjectCreator:
     def _create_flask_app(self, project_info: dict) -> None:
         if not project_info["use_flask"]:
             return
-        flask_creator = FlaskAppCreator(self.config)
+        flask_creator = FlaskAppCreator(self.config, self.file_writer)
         flask_creator.create_flask_project(project_info)
 
-    def _initialize_git_repository(self) -> None:
+    def _create_fastapi_app(self, project_info: dict) -> None:
+        if not project_info.get("use_fastapi", False):
+            return
+        fastapi_creator = FastAPIAppCreator(self.config, self.file_writer)
+        fastapi_creator.create_fastapi_project(project_info)
+
+    def _write_manifest(self, project_info: dict) -> None:
+        manifest = ProjectManifest(project_info, self.file_writer.written_files)
+        manifest.save(os.getcwd(), self.charset)
+
+    def _display_update_summary(self) -> None:
+        report = [
+            ("Created", self.file_writer.created_files, Fore.GREEN),
+            ("Updated", self.file_writer.updated_files, Fore.GREEN),
+            (
+                "Modified by user, left untouched",
+                self.file_writer.modified_files,
+                Fore.YELLOW,
+            ),
+        ]
+        for label, files, color in report:
+            for filename in files:
+                print(f"{color}{label}: {filename}{Style.RESET_ALL}")
+        print(f"{len(self.file_writer.unchanged_files)} file(s) already up to date.")
+
+    def _initialize_git_repository(self, project_info: dict) -> None:
+        git_writer = GitWriter(os.getcwd(), self.config.get_git_default_branch())
         try:
-            subprocess.run(["git", "--version"], check=True, capture_output=True)
-            subprocess.run(["git", "init"], check=True)
-        except FileNotFoundError:
-            print(
-                f"{Fore.YELLOW}Git not found on your system. "
-                f"Skipping Git initialization.{Style.RESET_ALL}"
-            )
-            print(
-                f"{Fore.YELLOW}To use Git with this project, please install Git "
-                f"and run 'git init' manually in the project directory.{Style.RESET_ALL}"
-            )
-        except subprocess.CalledProcessError as e:
+            git_writer.init()
+            if project_info.get("initial_commit"):
+                identity = GitIdentity.from_environment(project_info.get("author", ""))
+                git_writer.commit_all("Initial commit", identity)
+        except GitWriterError as e:
             print(f"{Fore.RED}Error initializing Git repository: {e}{Style.RESET_ALL}")
             print(
                 f"{Fore.YELLOW}You may need to initialize the Git repository manually."
                 f"{Style.RESET_ALL}"
             )
 
+    def _resolve_dependencies(self, project_info: dict) -> ProjectDependencies:
+        """Return the project dependencies, resolving them on first use."""
+        if self.dependencies is None:
+            self.dependencies = ProjectDependencies.from_project_info(project_info)
+        return self.dependencies
+
     def _check_directory_exist(self, directory: str) -> bool:
         return os.path.exists(directory) and os.path.isdir(directory)
@@ -1,3 +1,4 @@
 from .string_formatter import StringFormatter
+from .content_hasher import ContentHasher
 
-__all__ = ["StringFormatter"]
+__all__ = ["StringFormatter", "ContentHasher"]
@@ -0,0 +1,39 @@
+import hashlib
+
+
+class ContentHasher:
+    """
+    A utility class for hashing generated file contents.
+    """
+
+    @staticmethod
+    def hash_text(content: str, charset: str = "utf-8") -> str:
+        """
+        Hash a text content.
+
+        Args:
+            content (str): The text to hash.
+            charset (str): The charset used to encode the text.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the content.
+        """
+        return hashlib.sha256(content.encode(charset)).hexdigest()
+
+    @staticmethod
+    def hash_file(filename: str, charset: str = "utf-8") -> str:
+        """
+        Hash the content of a text file.
+
+        The file is decoded with the given charset so that the digest matches
+        the one computed by hash_text for the content that was written.
+
+        Args:
+            filename (str): The path of the file to hash.
+            charset (str): The charset of the file.
+
+        Returns:
+            str: The hexadecimal digest of the file content.
+        """
+        with open(filename, "r", encoding=charset) as file:
+            return ContentHasher.hash_text(file.read(), charset)
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import patch, mock_open, MagicMock
 import subprocess
 from boilrpy.config import Config
+from boilrpy.dependencies import Dependency, ProjectDependencies
 from boilrpy.dependency_creators.conda_creator import CondaCreator
 from boilrpy.dependency_creators.base_dependency_creator import (
     DependencyCreatorNotFoundError,
@@ -115,12 +116,11 @@ class TestCondaCreator:
     def test_create_environment_file_basic(self, mock_config, base_project_info):
         """Test creating basic environment.yml file."""
         creator = CondaCreator(mock_config)
-        packages = ["flask"]
-        dev_packages = ["pytest"]
+        dependencies = ProjectDependencies([Dependency("flask")], [Dependency("pytest")])
         
         mock_file = mock_open()
         with patch("builtins.open", mock_file):
-            creator._create_environment_file(base_project_info, packages, dev_packages)
+            creator._create_environment_file(base_project_info, dependencies)
             
             # Get written content
             write_calls = mock_file().write.call_args_list
@@ -133,7 +133,8 @@ class TestCondaCreator:
             assert "python=" in content
             assert "flask" in content
             assert "pytest" in content
-            assert "pip:" in content
+            assert "  - pip\n" in content
+            assert "pip:" not in content
     
     def test_create_environment_file_with_python_version(self, mock_config):
         """Test creating environment.yml with specific Python version."""
@@ -145,7 +146,7 @@ class TestCondaCreator:
         
         mock_file = mock_open()
         with patch("builtins.open", mock_file):
-            creator._create_environment_file(project_info, [], [])
+            creator._create_environment_file(project_info, ProjectDependencies([], []))
             
             write_calls = mock_file().write.call_args_list
             content = "".join(call[0][0] for call in write_calls)
@@ -159,7 +160,7 @@ class TestCondaCreator:
         
         mock_file = mock_open()
         with patch("builtins.open", mock_file):
-            creator._create_environment_file(project_info, [], [])
+            creator._create_environment_file(project_info, ProjectDependencies([], []))
             
             write_calls = mock_file().write.call_args_list
             content = "".join(call[0][0] for call in write_calls)
@@ -173,10 +174,14 @@ class TestCondaCreator:
         project_info = {"name": "data-science-project"}
         packages = ["numpy", "pandas", "scikit-learn", "matplotlib"]
         dev_packages = ["pytest", "pylint", "black"]
+        dependencies = ProjectDependencies(
+            [Dependency(package) for package in packages],
+            [Dependency(package) for package in dev_packages],
+        )
         
         mock_file = mock_open()
         with patch("builtins.open", mock_file):
-            creator._create_environment_file(project_info, packages, dev_packages)
+            creator._create_environment_file(project_info, dependencies)
             
             write_calls = mock_file().write.call_args_list
             content = "".join(call[0][0] for call in write_calls)
@@ -192,7 +197,7 @@ class TestCondaCreator:
         
         mock_file = mock_open()
         with patch("builtins.open", mock_file):
-            creator._create_environment_file(project_info, [], [])
+            creator._create_environment_file(project_info, ProjectDependencies([], []))
             
             write_calls = mock_file().write.call_args_list
             content = "".join(call[0][0] for call in write_calls)
@@ -201,3 +206,36 @@ class TestCondaCreator:
             assert "name: minimal-project" in content
             assert "dependencies:" in content
             assert "python=" in content
+
+    def test_create_environment_file_with_channel_hints(self, mock_config):
+        """Test pip-only and channel hints in environment.yml."""
+        creator = CondaCreator(mock_config)
+        project_info = {"name": "hinted-project"}
+        dependencies = ProjectDependencies(
+            [Dependency("samtools", ">=1.9", "bioconda"), Dependency("foo", "==1.0", "pip")],
+            [],
+        )
+
+        mock_file = mock_open()
+        with patch("builtins.open", mock_file):
+            creator._create_environment_file(project_info, dependencies)
+
+            write_calls = mock_file().write.call_args_list
+            content = "".join(call[0][0] for call in write_calls)
+
+            assert "  - bioconda\ndependencies:" in content
+            assert "  - bioconda::samtools>=1.9\n" in content
+            assert "  - pip:\n      - foo==1.0\n" in content
+
+    def test_create_dependency_file_uses_given_dependencies(
+        self, mock_config, base_project_info
+    ):
+        """Test that already resolved dependencies are not resolved again."""
+        creator = CondaCreator(mock_config)
+        dependencies = ProjectDependencies([Dependency("numpy")], [])
+
+        with patch.object(creator, "_create_environment_file") as mock_create, \
+             patch("builtins.print"):
+            creator.create_dependency_file(base_project_info, dependencies)
+
+        mock_create.assert_called_once_with(base_project_info, dependencies)
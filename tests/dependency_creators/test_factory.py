@@ -87,6 +87,16 @@ class TestDependencyCreatorFactory:
         assert DependencyCreatorFactory.is_supported("pipenv") is False
         assert DependencyCreatorFactory.is_supported("") is False
     
+    def test_writes_requirements_txt(self):
+        """Test which managers write requirements.txt themselves."""
+        assert DependencyCreatorFactory.writes_requirements_txt("pip") is True
+        assert DependencyCreatorFactory.writes_requirements_txt("PIP") is True
+        assert DependencyCreatorFactory.writes_requirements_txt("uv") is False
+        assert DependencyCreatorFactory.writes_requirements_txt("poetry") is False
+        assert DependencyCreatorFactory.writes_requirements_txt("conda") is False
+        # Unsupported managers fall back to pip
+        assert DependencyCreatorFactory.writes_requirements_txt("pipenv") is True
+    
     def test_is_supported_case_insensitive(self):
         """Test that is_supported is case-insensitive."""
         assert DependencyCreatorFactory.is_supported("POETRY") is True
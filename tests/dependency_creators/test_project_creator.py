@@ -58,7 +58,9 @@ class TestProjectCreatorMissingCoverage:
             mock_factory.assert_any_call("pip", project_creator.config)
             
             # Verify pip creator was used
-            mock_pip_creator.create_dependency_file.assert_called_once_with(project_info)
+            mock_pip_creator.create_dependency_file.assert_called_once_with(
+                project_info, project_creator.dependencies
+            )
     
     def test_create_dependency_files_with_valid_manager(
         self, 
@@ -87,7 +89,9 @@ class TestProjectCreatorMissingCoverage:
             mock_factory.assert_called_once_with("poetry", project_creator.config)
             
             # Verify creator was used
-            mock_creator.create_dependency_file.assert_called_once_with(project_info)
+            mock_creator.create_dependency_file.assert_called_once_with(
+                project_info, project_creator.dependencies
+            )
     
     
     # def test_create_poetry_file_with_use_poetry_false(
@@ -1,7 +1,7 @@
 """Tests for UvCreator."""
 
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import call, patch, mock_open, MagicMock
 import subprocess
 from boilrpy.dependency_creators.uv_creator import UvCreator
 from boilrpy.dependency_creators.base_dependency_creator import (
@@ -26,7 +26,7 @@ class TestUvCreator:
         with patch("subprocess.run") as mock_run, \
              patch("builtins.open", mock_open()):
             
-            # Mock uv --version check (success) and uv venv
+            # Mock uv --version check (success) and uv init
             mock_run.return_value = MagicMock(stdout="uv 0.1.0", returncode=0)
             
             creator.create_dependency_file(base_project_info)
@@ -35,11 +35,13 @@ class TestUvCreator:
             first_call = mock_run.call_args_list[0]
             assert first_call[0][0] == ["uv", "--version"]
             
-            # Verify uv venv was called
-            assert any(
-                call[0][0] == ["uv", "venv"]
-                for call in mock_run.call_args_list
-            )
+            # Verify the project was initialized and its dependencies added
+            commands = [call[0][0] for call in mock_run.call_args_list]
+            assert [
+                "uv", "init", "--bare", "--no-workspace", "--name", "test-project"
+            ] in commands
+            assert ["uv", "add", "--dev", "pytest", "pylint"] in commands
+            assert ["uv", "lock"] not in commands
     
     def test_create_dependency_file_uv_not_found(self, mock_config, base_project_info):
         """Test when uv is not installed."""
@@ -71,12 +73,41 @@ class TestUvCreator:
             error_msg = str(exc_info.value)
             assert "uv not found or not working properly" in error_msg
     
+    def test_create_dependency_file_locks_without_packages(
+        self,
+        mock_config,
+        project_info_minimal
+    ):
+        """Test that uv.lock is created when there is nothing to add."""
+        creator = UvCreator(mock_config)
+
+        with patch("subprocess.run") as mock_run, \
+             patch("builtins.open", mock_open()):
+            creator.create_dependency_file(project_info_minimal)
+
+            assert mock_run.call_args_list[-1][0][0] == ["uv", "lock"]
+
+    def test_update_pyproject_toml(self, mock_config, base_project_info):
+        """Test pyproject.toml is updated with project information."""
+        creator = UvCreator(mock_config)
+
+        with patch(
+            "builtins.open",
+            mock_open(read_data='[project]\nname = "test-project"\nversion = "0.1.0"\n'),
+        ), patch("toml.dump") as mock_dump:
+            creator._update_pyproject_toml(base_project_info)
+
+        project = mock_dump.call_args[0][0]["project"]
+        assert project["name"] == "test-project"
+        assert project["description"] == "A test project"
+        assert project["authors"] == [{"name": "Test Author"}]
+
     def test_create_dependency_file_venv_creation_fails(
         self, 
         mock_config, 
         base_project_info
     ):
-        """Test when uv venv command fails."""
+        """Test when uv init command fails."""
         creator = UvCreator(mock_config)
         
         call_count = [0]
@@ -87,9 +118,9 @@ class TestUvCreator:
             if cmd == ["uv", "--version"]:
                 # First call: version check succeeds
                 return MagicMock(stdout="uv 0.1.0", returncode=0)
-            elif cmd == ["uv", "venv"]:
-                # Second call: venv creation fails
-                raise subprocess.CalledProcessError(1, "uv venv")
+            elif cmd[:2] == ["uv", "init"]:
+                # Second call: project creation fails
+                raise subprocess.CalledProcessError(1, "uv init")
             return MagicMock(returncode=0)
         
         with patch("subprocess.run", side_effect=run_side_effect), \
@@ -109,10 +140,10 @@ class TestUvCreator:
         with patch("subprocess.run") as mock_run:
             creator.install_dependencies(packages, dev_packages)
             
-            mock_run.assert_called_once_with(
-                ["uv", "pip", "install", "flask", "requests", "pytest"],
-                check=True
-            )
+            assert mock_run.call_args_list == [
+                call(["uv", "add", "flask", "requests"], check=True),
+                call(["uv", "add", "--dev", "pytest"], check=True),
+            ]
     
     def test_install_dependencies_empty_lists(self, mock_config):
         """Test installing with empty package lists."""
@@ -132,7 +163,7 @@ class TestUvCreator:
             creator.install_dependencies(packages, [])
             
             mock_run.assert_called_once_with(
-                ["uv", "pip", "install", "flask", "requests"],
+                ["uv", "add", "flask", "requests"],
                 check=True
             )
     
@@ -145,7 +176,7 @@ class TestUvCreator:
             creator.install_dependencies([], dev_packages)
             
             mock_run.assert_called_once_with(
-                ["uv", "pip", "install", "pytest", "pylint"],
+                ["uv", "add", "--dev", "pytest", "pylint"],
                 check=True
             )
     
@@ -249,7 +280,7 @@ class TestUvCreator:
             # Verify install was called with flask
             install_call = [
                 call for call in mock_run.call_args_list 
-                if call[0][0][0:3] == ["uv", "pip", "install"]
+                if call[0][0][0:2] == ["uv", "add"]
             ]
             assert len(install_call) > 0
             packages = install_call[0][0][0]
@@ -273,7 +304,7 @@ class TestUvCreator:
             # Verify install was called with additional libraries
             install_call = [
                 call for call in mock_run.call_args_list 
-                if call[0][0][0:3] == ["uv", "pip", "install"]
+                if call[0][0][0:2] == ["uv", "add"]
             ]
             assert len(install_call) > 0
             packages = install_call[0][0][0]
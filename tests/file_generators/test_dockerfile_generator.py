@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, Mock
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.dockerfile_generator import DockerfileGenerator
 from boilrpy.config import Config
 
@@ -47,6 +48,7 @@ def test_generate_dockerignore(dockerfile_generator):
         ".mypy_cache",
         ".pytest_cache",
         ".hypothesis",
+        "static/dist",
     ]
 
     for entry in expected_entries:
@@ -54,33 +56,177 @@ def test_generate_dockerignore(dockerfile_generator):
 
 
 def test_generate_dockerfile(dockerfile_generator, mock_config):
-    project_name = "test_project"
-    use_flask = False
+    project_info = {"name": "test_project", "use_flask": False}
     dockerfile_content = dockerfile_generator.generate_dockerfile(
-        project_name, use_flask
+        project_info, ProjectDependencies.from_project_info({"libraries": ["attrs"]})
     )
 
+    assert dockerfile_content.startswith("# syntax=docker/dockerfile:1\n")
     assert f"FROM python:{mock_config.python_version}-slim" in dockerfile_content
     assert "WORKDIR /app" in dockerfile_content
-    assert "COPY requirements.txt ." in dockerfile_content
-    assert "RUN pip install --no-cache-dir -r requirements.txt" in dockerfile_content
-    assert "COPY . ." in dockerfile_content
+    assert (
+        "COPY requirements.txt .\n"
+        "RUN --mount=type=cache,target=/root/.cache/pip \\\n"
+        "    pip install -r requirements.txt\n\n"
+        "COPY . ."
+    ) in dockerfile_content
     assert f'CMD ["python", "main.py"]' in dockerfile_content
-    use_flask = True
+    assert "EXPOSE" not in dockerfile_content
+    assert "build_assets.py" not in dockerfile_content
+    project_info["use_flask"] = True
+    dockerfile_content = dockerfile_generator.generate_dockerfile(project_info)
+    assert "COPY . .\n\nRUN python build_assets.py\n\n" in dockerfile_content
+    assert (
+        "ENV APP_ENV=production\n\n"
+        "EXPOSE 8000\n\n"
+        'CMD ["gunicorn", "--config", "gunicorn.conf.py", "wsgi:app"]\n'
+    ) in dockerfile_content
+
+
+@pytest.mark.parametrize("docker_profile", ["default", "runtime"])
+def test_generate_dockerfile_with_fastapi(dockerfile_generator, docker_profile):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"use_fastapi": True, "docker_profile": docker_profile}
+    )
+    assert "APP_ENV=production" in dockerfile_content
+    assert (
+        "EXPOSE 8000\n\n"
+        'CMD ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", '
+        '"--proxy-headers"]\n'
+    ) in dockerfile_content
+
+
+def test_generate_dockerfile_without_main_dependencies(dockerfile_generator):
+    dependencies = ProjectDependencies.from_project_info({"create_tests": True})
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"name": "test_project"}, dependencies
+    )
+    assert "requirements.txt" not in dockerfile_content
+    assert "WORKDIR /app\n\nCOPY . ." in dockerfile_content
+
+
+def test_generate_dockerfile_with_poetry(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"name": "test_project", "dependencies_manager": "poetry"}
+    )
+    assert "POETRY_VIRTUALENVS_IN_PROJECT=1" in dockerfile_content
+    assert (
+        "COPY pyproject.toml poetry.lock* ./\n"
+        "RUN --mount=type=cache,target=/root/.cache/pypoetry \\\n"
+        "    poetry install --no-root --only main\n\n"
+        "COPY . ."
+    ) in dockerfile_content
+    assert 'ENV PATH="/app/.venv/bin:$PATH"' in dockerfile_content
+
+
+def test_generate_dockerfile_with_uv(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"name": "test_project", "dependencies_manager": "uv"}
+    )
+    assert (
+        "COPY --from=ghcr.io/astral-sh/uv:latest /uv /uvx /bin/" in dockerfile_content
+    )
+    assert (
+        "COPY pyproject.toml uv.lock ./\n"
+        "RUN --mount=type=cache,target=/root/.cache/uv \\\n"
+        "    uv sync --frozen --no-dev --no-install-project\n\n"
+        "COPY . ."
+    ) in dockerfile_content
+    assert "requirements.txt" not in dockerfile_content
+
+
+def test_generate_dockerfile_with_conda(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"name": "test_project", "dependencies_manager": "conda"}
+    )
+    assert "FROM mambaorg/micromamba:" in dockerfile_content
+    assert (
+        "COPY --chown=$MAMBA_USER:$MAMBA_USER environment.yml ." in dockerfile_content
+    )
+    assert "micromamba install -y -n base -f environment.yml" in dockerfile_content
+    assert "COPY --chown=$MAMBA_USER:$MAMBA_USER . ." in dockerfile_content
+
+
+def test_generate_dockerfile_unknown_manager_uses_pip(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"dependencies_manager": "pipenv", "use_flask": True}
+    )
+    assert "pip install -r requirements.txt" in dockerfile_content
+
+
+@pytest.mark.parametrize("dep_manager", ["pip", "poetry", "uv"])
+def test_generate_runtime_dockerfile(dockerfile_generator, dep_manager):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {
+            "name": "test_project",
+            "dependencies_manager": dep_manager,
+            "docker_profile": "runtime",
+        },
+        ProjectDependencies.from_project_info({"use_flask": True}),
+    )
+    builder, runtime = dockerfile_content.split("FROM python:3.11-slim AS runtime")
+    assert "FROM python:3.11-slim AS builder" in builder
+    assert (
+        "RUN python -m compileall -q --invalidation-mode unchecked-hash /app"
+    ) in builder
+    assert (
+        "ENV PYTHONDONTWRITEBYTECODE=1 \\\n"
+        "    PYTHONUNBUFFERED=1 \\\n"
+        '    PATH="/app/.venv/bin:$PATH"'
+    ) in runtime
+    assert "COPY --from=builder /app /app" in runtime
+    assert "RUN useradd --create-home --uid 10001 app" in runtime
+    assert "USER app\n\nCMD" in runtime
+    assert "--mount" not in runtime
+
+
+def test_generate_runtime_dockerfile_with_flask(dockerfile_generator):
     dockerfile_content = dockerfile_generator.generate_dockerfile(
-        project_name, use_flask
+        {"docker_profile": "runtime", "use_flask": True}
     )
-    assert f'CMD ["flask", "run"]' in dockerfile_content
+    builder, runtime = dockerfile_content.split("AS runtime")
+    assert "RUN python build_assets.py\n\nRUN python -m compileall" in builder
+    assert '    PATH="/app/.venv/bin:$PATH" \\\n    APP_ENV=production\n' in runtime
+    assert (
+        "USER app\n\n"
+        "EXPOSE 8000\n\n"
+        'CMD ["gunicorn", "--config", "gunicorn.conf.py", "wsgi:app"]\n'
+    ) in runtime
+
+
+def test_generate_runtime_dockerfile_with_pip(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"docker_profile": "runtime", "libraries": ["attrs"]}
+    )
+    assert "RUN python -m venv /app/.venv" in dockerfile_content
+    assert "pip install -r requirements.txt" in dockerfile_content
+
+
+def test_generate_runtime_dockerfile_with_uv(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"dependencies_manager": "uv", "docker_profile": "runtime"}
+    )
+    assert "ENV UV_COMPILE_BYTECODE=1" in dockerfile_content
+
+
+def test_generate_runtime_dockerfile_with_conda(dockerfile_generator):
+    dockerfile_content = dockerfile_generator.generate_dockerfile(
+        {"dependencies_manager": "conda", "docker_profile": "runtime"}
+    )
+    builder, runtime = dockerfile_content.split(
+        "FROM mambaorg/micromamba:1.5.8 AS runtime"
+    )
+    assert "USER root" in builder
+    assert "COPY --from=builder /opt/conda /opt/conda" in runtime
+    assert "PYTHONDONTWRITEBYTECODE=1" in runtime
+    assert "USER $MAMBA_USER" in runtime
 
 
 def test_generate(dockerfile_generator):
-    project_name = "test_project"
-    use_flask = False
+    project_info = {"name": "test_project", "use_flask": False}
     dockerfile_generator.generate_dockerfile = MagicMock()
     dockerfile_generator.generate_dockerignore = MagicMock()
 
-    dockerfile_generator.generate(project_name, use_flask)
-    dockerfile_generator.generate_dockerfile.assert_called_once_with(
-        project_name, use_flask
-    )
+    dockerfile_generator.generate(project_info)
+    dockerfile_generator.generate_dockerfile.assert_called_once_with(project_info)
     dockerfile_generator.generate_dockerignore.assert_called_once()
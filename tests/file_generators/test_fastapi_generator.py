@@ -0,0 +1,39 @@
+import ast
+from unittest.mock import MagicMock
+import pytest
+from boilrpy.file_generators.fastapi_generator import FastAPIGenerator
+
+
+@pytest.fixture
+def fastapi_generator():
+    return FastAPIGenerator(None)
+
+
+def test_generate(fastapi_generator):
+    project_info = {"name": "Test Project", "description": "A test FastAPI project"}
+
+    fastapi_generator.generate_app_file = MagicMock()
+    fastapi_generator.generate_dot_env_file = MagicMock()
+
+    fastapi_generator.generate(project_info)
+    fastapi_generator.generate_app_file.assert_called_once_with(project_info)
+    fastapi_generator.generate_dot_env_file.assert_called_once()
+
+
+def test_generate_app_file(fastapi_generator):
+    app_file_content = fastapi_generator.generate_app_file({"name": "test project"})
+    ast.parse(app_file_content)
+    assert "from fastapi import FastAPI, Request" in app_file_content
+    assert "async with httpx.AsyncClient(" in app_file_content
+    assert "app.state.http_client = client" in app_file_content
+    assert 'FastAPI(title="Test Project"' in app_file_content
+    assert "async def fan_out(request: Request, count: int = 3):" in app_file_content
+    assert "await asyncio.gather(" in app_file_content
+    assert 'reload=APP_ENV == "development"' in app_file_content
+
+
+def test_generate_dot_env_file(fastapi_generator):
+    dot_env_content = fastapi_generator.generate_dot_env_file()
+    assert "APP_ENV=development" in dot_env_content
+    assert "UPSTREAM_URL=https://httpbin.org" in dot_env_content
+    assert "HTTP_MAX_CONNECTIONS=100" in dot_env_content
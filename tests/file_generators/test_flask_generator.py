@@ -1,5 +1,9 @@
 from unittest.mock import MagicMock
+import importlib
+import inspect
+import sys
 import pytest
+from boilrpy import asset_pipeline
 from boilrpy.file_generators.flask_generator import FlaskGenerator
 
 
@@ -12,6 +16,14 @@ def test_generate(flask_generator):
     project_info = {"name": "Test Project", "description": "A test Flask project"}
 
     flask_generator.generate_app_file = MagicMock()
+    flask_generator.generate_wsgi_file = MagicMock()
+    flask_generator.generate_gunicorn_conf = MagicMock()
+    flask_generator.generate_build_assets_script = MagicMock()
+    flask_generator.generate_metrics_module = MagicMock()
+    flask_generator.generate_metrics_test = MagicMock()
+    flask_generator.generate_database_module = MagicMock()
+    flask_generator.generate_database_fixture = MagicMock()
+    flask_generator.generate_database_test = MagicMock()
     flask_generator.generate_base_template = MagicMock()
     flask_generator.generate_index_template = MagicMock()
     flask_generator.generate_dot_env_file = MagicMock()
@@ -19,10 +31,18 @@ def test_generate(flask_generator):
     flask_generator.generate_script_file = MagicMock()
 
     flask_generator.generate(project_info)
-    flask_generator.generate_app_file.assert_called_once()
+    flask_generator.generate_app_file.assert_called_once_with(project_info)
+    flask_generator.generate_wsgi_file.assert_called_once()
+    flask_generator.generate_gunicorn_conf.assert_called_once()
+    flask_generator.generate_build_assets_script.assert_called_once()
+    flask_generator.generate_metrics_module.assert_called_once()
+    flask_generator.generate_metrics_test.assert_called_once()
+    flask_generator.generate_database_module.assert_called_once()
+    flask_generator.generate_database_fixture.assert_called_once()
+    flask_generator.generate_database_test.assert_called_once()
     flask_generator.generate_base_template.assert_called_once_with(project_info)
     flask_generator.generate_index_template.assert_called_once_with(project_info)
-    flask_generator.generate_dot_env_file.assert_called_once()
+    flask_generator.generate_dot_env_file.assert_called_once_with(project_info)
     flask_generator.generate_style_file.assert_called_once()
     flask_generator.generate_script_file.assert_called_once()
 
@@ -34,7 +54,232 @@ def test_generate_app_file(flask_generator):
     assert "app = Flask(__name__)" in app_file_content
     assert "def index():" in app_file_content
     assert "return render_template('index.html')" in app_file_content
-    assert 'app.run(host="0.0.0.0", port=5000, debug=True)' in app_file_content
+    assert 'APP_ENV = os.getenv("APP_ENV", "production")' in app_file_content
+    assert 'app.config["DEBUG"] = APP_ENV == "development"' in app_file_content
+    assert (
+        'app.run(host="0.0.0.0", port=5000, debug=app.config["DEBUG"])'
+        in app_file_content
+    )
+
+
+def test_generate_app_file_with_cache(flask_generator):
+    app_file_content = flask_generator.generate_app_file({"use_flask_cache": True})
+    compile(app_file_content, "app.py", "exec")
+    assert "from flask import Flask, render_template, request" in app_file_content
+    assert "cache = Cache(app)" in app_file_content
+    assert "Compress(app)" in app_file_content
+    assert 'COMPRESS_ALGORITHM=["br", "gzip"]' in app_file_content
+    assert "@app.route('/')\n@cache.cached()\ndef index():" in app_file_content
+    assert "@cache.memoize()" in app_file_content
+    assert "response.cache_control.immutable = True" in app_file_content
+    assert 're.compile(r"\\.[0-9a-f]{8,}\\.\\w+$")' in app_file_content
+
+
+def test_generate_app_file_without_cache(flask_generator):
+    app_file_content = flask_generator.generate_app_file({"use_flask_cache": False})
+    assert app_file_content == flask_generator.generate_app_file()
+    assert "Cache" not in app_file_content
+    assert "import json\nimport os\n\nfrom flask import" in app_file_content
+    assert 'os.getenv("APP_ENV", "production")\n\napp = Flask' in app_file_content
+
+
+def test_generate_app_file_with_metrics(flask_generator):
+    app_file_content = flask_generator.generate_app_file({"use_metrics": True})
+    compile(app_file_content, "app.py", "exec")
+    assert "from metrics import init_metrics" in app_file_content
+    assert "init_metrics(app)" in app_file_content
+
+
+def test_generate_app_file_with_cache_and_metrics(flask_generator):
+    app_file_content = flask_generator.generate_app_file(
+        {"use_flask_cache": True, "use_metrics": True}
+    )
+    compile(app_file_content, "app.py", "exec")
+    assert (
+        "from flask_compress import Compress\nfrom metrics import init_metrics\n"
+        in app_file_content
+    )
+    assert "cache = Cache(app)" in app_file_content
+    assert app_file_content.index("Compress(app)") < app_file_content.index(
+        "init_metrics(app)"
+    )
+
+
+def test_generate_app_file_with_database(flask_generator):
+    app_file_content = flask_generator.generate_app_file(
+        {"use_metrics": True, "use_database": True}
+    )
+    compile(app_file_content, "app.py", "exec")
+    assert (
+        "from metrics import init_metrics\nfrom database import init_db\n"
+        in app_file_content
+    )
+    assert "init_db(app)" in app_file_content
+
+
+def test_generate_app_file_with_logging(flask_generator):
+    app_file_content = flask_generator.generate_app_file({"use_logging": True})
+    compile(app_file_content, "app.py", "exec")
+    assert (
+        "from logging_config import configure_logging, init_request_ids\n"
+        in app_file_content
+    )
+    assert (
+        'APP_ENV = os.getenv("APP_ENV", "production")\nconfigure_logging()\n\n'
+        "app = Flask(__name__)" in app_file_content
+    )
+    assert "init_request_ids(app)" in app_file_content
+
+
+def test_generate_app_file_uses_asset_manifest(flask_generator):
+    app_file_content = flask_generator.generate_app_file()
+    compile(app_file_content, "app.py", "exec")
+    assert 'os.path.join(app.static_folder, "dist", "manifest.json")' in (
+        app_file_content
+    )
+    assert 'ASSETS = {} if app.config["DEBUG"] else load_asset_manifest()' in (
+        app_file_content
+    )
+    assert "@app.url_defaults\ndef fingerprint_static_urls(endpoint, values):" in (
+        app_file_content
+    )
+
+
+def test_generate_build_assets_script(flask_generator):
+    script = flask_generator.generate_build_assets_script()
+    assert script == inspect.getsource(asset_pipeline)
+    assert "from boilrpy" not in script
+    assert 'if __name__ == "__main__":' in script
+
+
+def test_generate_metrics_module(flask_generator):
+    metrics_content = flask_generator.generate_metrics_module()
+    compile(metrics_content, "metrics.py", "exec")
+    assert "def init_metrics(app, metrics=None):" in metrics_content
+    assert '@app.route("/metrics")' in metrics_content
+    assert 'os.getenv("SLOW_REQUEST_SECONDS", "1.0")' in metrics_content
+    assert "http_request_duration_seconds" in metrics_content
+
+
+def test_generated_metrics_module(flask_generator, tmp_path, monkeypatch):
+    pytest.importorskip("flask")
+    metrics_path = tmp_path / "metrics.py"
+    metrics_path.write_text(flask_generator.generate_metrics_module())
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "metrics", raising=False)
+    metrics = importlib.import_module("metrics")
+
+    request_metrics = metrics.RequestMetrics(buckets=(0.1, 1.0))
+    request_metrics.observe("GET", "/items/<int:item_id>", 200, 0.05)
+    request_metrics.observe("GET", "/items/<int:item_id>", 500, 2.0)
+
+    text = request_metrics.render()
+    labels = 'method="GET",route="/items/<int:item_id>"'
+    assert f'http_requests_total{{{labels},status="200"}} 1' in text
+    assert f'http_requests_total{{{labels},status="500"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"http_request_duration_seconds_sum{{{labels}}} 2.05" in text
+
+
+def test_generate_metrics_test(flask_generator):
+    test_content = flask_generator.generate_metrics_test()
+    compile(test_content, "test_metrics.py", "exec")
+    assert "from metrics import RequestMetrics, init_metrics" in test_content
+    assert "def test_metrics_endpoint():" in test_content
+
+
+def test_generate_database_module(flask_generator):
+    database_content = flask_generator.generate_database_module()
+    compile(database_content, "database.py", "exec")
+    assert "def init_db(app, url=None):" in database_content
+    assert "@app.teardown_appcontext" in database_content
+    assert "db_session.remove()" in database_content
+    assert 'pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "1") == "1"' in (
+        database_content
+    )
+
+
+def test_generated_database_module(flask_generator, tmp_path, monkeypatch):
+    pytest.importorskip("flask")
+    pytest.importorskip("sqlalchemy")
+    (tmp_path / "database.py").write_text(flask_generator.generate_database_module())
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "database", raising=False)
+    database = importlib.import_module("database")
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "0")
+
+    options = database.engine_options("postgresql://localhost/app")
+    assert options["pool_size"] == 8
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is False
+    assert options["pool_recycle"] == 1800
+    assert "poolclass" in database.engine_options("sqlite://")
+
+    flask = importlib.import_module("flask")
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    app = flask.Flask("app", instance_path=str(tmp_path / "instance"))
+    engine = database.init_db(app)
+    assert engine.url.database == str(tmp_path / "instance" / "app.db")
+    assert engine.pool.size() == 8
+    assert app.extensions["database"] is engine
+    engine.dispose()
+
+
+def test_generate_database_fixture(flask_generator):
+    fixture_content = flask_generator.generate_database_fixture()
+    compile(fixture_content, "conftest.py", "exec")
+    assert 'init_db(app, "sqlite://")' in fixture_content
+    assert "def database():" in fixture_content
+
+
+def test_generate_database_test(flask_generator):
+    test_content = flask_generator.generate_database_test()
+    compile(test_content, "test_database.py", "exec")
+    assert "def test_database_session(database):" in test_content
+
+
+def test_generate_wsgi_file(flask_generator):
+    wsgi_content = flask_generator.generate_wsgi_file()
+    assert "from app import app" in wsgi_content
+    compile(wsgi_content, "wsgi.py", "exec")
+
+
+def test_generate_gunicorn_conf(flask_generator):
+    gunicorn_content = flask_generator.generate_gunicorn_conf()
+    compile(gunicorn_content, "gunicorn.conf.py", "exec")
+    assert "workers = int(os.getenv(\"GUNICORN_WORKERS\", _cpu_count() * 2 + 1))" in (
+        gunicorn_content
+    )
+    assert "preload_app = APP_ENV == \"production\"" in gunicorn_content
+
+
+def test_gunicorn_conf_settings(flask_generator, monkeypatch):
+    pytest.importorskip("dotenv")
+    gunicorn_content = flask_generator.generate_gunicorn_conf()
+    monkeypatch.setenv("APP_ENV", "production")
+    monkeypatch.setenv("GUNICORN_WORKERS", "3")
+    settings = {}
+    exec(gunicorn_content, settings)
+    assert settings["workers"] == 3
+    assert settings["worker_class"] == "gthread"
+    assert settings["threads"] == 2
+    assert settings["keepalive"] == 5
+    assert settings["max_requests"] == 1000
+    assert settings["max_requests_jitter"] == 100
+    assert settings["preload_app"] is True
+    assert settings["reload"] is False
+
+    monkeypatch.setenv("APP_ENV", "development")
+    monkeypatch.delenv("GUNICORN_WORKERS")
+    settings = {}
+    exec(gunicorn_content, settings)
+    assert settings["workers"] >= 3
+    assert settings["preload_app"] is False
+    assert settings["reload"] is True
+    assert settings["loglevel"] == "debug"
 
 
 def test_generate_base_template(flask_generator):
@@ -63,10 +308,41 @@ def test_generate_index_template(flask_generator):
 def test_generate_dot_env_file(flask_generator):
     dot_env_content = flask_generator.generate_dot_env_file()
     assert "FLASK_APP=app.py" in dot_env_content
-    assert "FLASK_ENV=development" in dot_env_content
+    assert "APP_ENV=development" in dot_env_content
+    assert "CACHE_TYPE" not in dot_env_content
+
+
+def test_generate_dot_env_file_with_cache(flask_generator):
+    dot_env_content = flask_generator.generate_dot_env_file({"use_flask_cache": True})
+    assert "CACHE_TYPE=SimpleCache" in dot_env_content
+    assert "CACHE_DIR=instance/cache" in dot_env_content
+    assert "CACHE_DEFAULT_TIMEOUT=300" in dot_env_content
     assert "FLASK_DEBUG=1" in dot_env_content
 
 
+def test_generate_dot_env_file_with_metrics(flask_generator):
+    dot_env_content = flask_generator.generate_dot_env_file({"use_metrics": True})
+    assert "SLOW_REQUEST_SECONDS=1.0" in dot_env_content
+    assert "SLOW_REQUEST_SECONDS" not in flask_generator.generate_dot_env_file()
+
+
+def test_generate_dot_env_file_with_database(flask_generator):
+    dot_env_content = flask_generator.generate_dot_env_file({"use_database": True})
+    assert "# DATABASE_URL=" in dot_env_content
+    assert "DB_POOL_SIZE=5" in dot_env_content
+    assert "DB_MAX_OVERFLOW=10" in dot_env_content
+    assert "DB_POOL_PRE_PING=1" in dot_env_content
+    assert "DB_POOL_RECYCLE=1800" in dot_env_content
+    assert "DB_POOL_SIZE" not in flask_generator.generate_dot_env_file()
+
+
+def test_generate_dot_env_file_with_logging(flask_generator):
+    dot_env_content = flask_generator.generate_dot_env_file({"use_logging": True})
+    assert "LOG_LEVEL=INFO" in dot_env_content
+    assert "LOG_FORMAT=json" in dot_env_content
+    assert "LOG_LEVEL" not in flask_generator.generate_dot_env_file()
+
+
 def test_generate_style_file(flask_generator):
     style_content = flask_generator.generate_style_file()
     assert "body {" in style_content
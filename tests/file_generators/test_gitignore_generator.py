@@ -1,5 +1,10 @@
 import pytest
-from boilrpy.file_generators.gitignore_generator import GitignoreGenerator
+from boilrpy.file_generators.gitignore_generator import (
+    GITIGNORE_FRAGMENTS,
+    GitignoreGenerator,
+    merge_fragments,
+    select_fragments,
+)
 
 
 @pytest.fixture
@@ -12,14 +17,64 @@ def test_gitignore_generator(gitignore_generator):
     assert isinstance(gitignore, str)
     assert "# Python" in gitignore
     assert "# Virtual environments" in gitignore
-    assert "# Poetry" in gitignore
     assert "# PyCharm" in gitignore
     assert "# VS Code" in gitignore
-    assert "# Jupyter Notebook" in gitignore
     assert "# Distribution / packaging" in gitignore
     assert "# Pytest" in gitignore
     assert "# Coverage reports" in gitignore
-    assert "# Matplotlib" in gitignore
     assert "# macOS" in gitignore
     assert "# Windows" in gitignore
-    assert "# Output folder" in gitignore
+    assert "# Flask" not in gitignore
+
+
+def test_gitignore_generator_selects_fragments(gitignore_generator):
+    gitignore = gitignore_generator.generate(
+        {
+            "dependencies_manager": "poetry",
+            "use_flask": True,
+            "use_docker": True,
+            "use_pylint": True,
+            "create_tests": False,
+        }
+    )
+    assert "# Poetry" in gitignore
+    assert "# Flask\ninstance/" in gitignore
+    assert "# Docker" in gitignore
+    assert "# Pylint" in gitignore
+    assert "# Pytest" not in gitignore
+    assert "# Virtual environments" not in gitignore
+
+
+def test_select_fragments():
+    assert select_fragments({"dependencies_manager": "conda"}) == (
+        "python",
+        "packaging",
+        "environment",
+        "conda",
+        "data_science",
+        "ide",
+        "os",
+    )
+    assert "tests" in select_fragments({"create_tests": True})
+    assert "pip" in select_fragments({})
+
+
+def test_merge_fragments_removes_duplicate_patterns():
+    gitignore = merge_fragments(("pip", "poetry", "uv"))
+    patterns = [
+        line for line in gitignore.splitlines() if line and not line.startswith("#")
+    ]
+    assert len(patterns) == len(set(patterns))
+    assert patterns.count(".venv/") == 1
+    # uv only adds .venv/, which is already listed
+    assert "# uv" not in gitignore
+    assert "# Poetry\n.poetry/" in gitignore
+
+
+def test_merge_fragments_is_cached():
+    assert merge_fragments(("python", "flask")) is merge_fragments(("python", "flask"))
+
+
+def test_every_fragment_has_patterns():
+    for name in GITIGNORE_FRAGMENTS:
+        assert merge_fragments((name,)).strip()
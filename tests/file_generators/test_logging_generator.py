@@ -0,0 +1,98 @@
+import importlib
+import io
+import json
+import logging
+import sys
+import pytest
+from boilrpy.file_generators.logging_generator import LoggingGenerator
+
+
+@pytest.fixture
+def logging_generator():
+    return LoggingGenerator(None)
+
+
+@pytest.fixture
+def logging_config(logging_generator, tmp_path, monkeypatch):
+    (tmp_path / "logging_config.py").write_text(logging_generator.generate())
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "logging_config", raising=False)
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    module = importlib.import_module("logging_config")
+    yield module
+    module.stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_generate(logging_generator):
+    content = logging_generator.generate()
+    compile(content, "logging_config.py", "exec")
+    assert "logging.handlers.QueueHandler(log_queue)" in content
+    assert "logging.handlers.QueueListener(log_queue, handler)" in content
+    assert 'os.getenv("LOG_LEVEL", "INFO")' in content
+    assert 'os.getenv("LOG_FORMAT", "json")' in content
+    assert "os.register_at_fork(after_in_child=_restart_listener)" in content
+    assert "flask" not in content
+    assert "import sys\n\n# Id of the request" in content
+
+
+def test_generate_with_flask(logging_generator):
+    content = logging_generator.generate({"use_flask": True})
+    compile(content, "logging_config.py", "exec")
+    assert "import sys\nimport uuid\n\nfrom flask import request\n" in content
+    assert "def init_request_ids(app):" in content
+    assert 'response.headers["X-Request-ID"] = request_id.get()' in content
+    assert content.endswith('        request_id.set("-")\n')
+
+
+def test_generated_json_logging(logging_config):
+    stream = io.StringIO()
+    logging_config.configure_logging("debug", "json", stream)
+    token = logging_config.request_id.set("abc123")
+    logging.getLogger("app").debug("Hello %s", "world")
+    logging_config.request_id.reset(token)
+    logging_config.stop_logging()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["level"] == "DEBUG"
+    assert entry["logger"] == "app"
+    assert entry["request_id"] == "abc123"
+    assert entry["message"] == "Hello world"
+    assert isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+
+
+def test_generated_text_logging(logging_config, monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    monkeypatch.setenv("LOG_FORMAT", "text")
+    stream = io.StringIO()
+    logging_config.configure_logging(stream=stream)
+    logging_config.configure_logging(stream=stream)
+    logging.getLogger("app").info("Hidden")
+    logging.getLogger("app").warning("Shown")
+    logging_config.stop_logging()
+
+    assert stream.getvalue().count("WARNING [-] app: Shown") == 1
+    assert "Hidden" not in stream.getvalue()
+    assert len(logging.getLogger().handlers) == 1
+
+
+def test_generated_listener_restart(logging_config):
+    stream = io.StringIO()
+    logging_config.configure_logging("info", "json", stream)
+    listener = logging_config._state["listener"]
+    logging_config._restart_listener()
+    logging.getLogger("app").info("After fork")
+    logging_config.stop_logging()
+    logging_config._restart_listener()
+
+    assert logging_config._state == {}
+    assert logging_config._state.get("listener") is not listener
+    assert json.loads(stream.getvalue())["message"] == "After fork"
+
+
+def test_generate_dot_env_file(logging_generator):
+    content = logging_generator.generate_dot_env_file()
+    assert "LOG_LEVEL=INFO\n" in content
+    assert "LOG_FORMAT=json\n" in content
@@ -12,3 +12,12 @@ def test_generate_main_file(main_file_generator):
     assert "def main():" in main_file
     assert "if __name__ == '__main__':" in main_file
     assert "main()" in main_file
+    assert "logging" not in main_file
+
+
+def test_generate_main_file_with_logging(main_file_generator):
+    main_file = main_file_generator.generate({"use_logging": True})
+    compile(main_file, "main.py", "exec")
+    assert "from logging_config import configure_logging" in main_file
+    assert "    load_dotenv()\n    configure_logging()\n    main()\n" in main_file
+    assert 'logger.info("Welcome to your new project!")' in main_file
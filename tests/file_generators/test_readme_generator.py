@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.readme_generator import ReadmeGenerator
 
 
@@ -84,6 +85,9 @@ class TestReadmeGenerator:
         
         assert "Flask-Poetry-Project" in content or "flask-poetry" in content.lower()
         assert "poetry run flask run" in content.lower()
+        assert "poetry run gunicorn --config gunicorn.conf.py wsgi:app" in content
+        assert "`APP_ENV=production`" in content
+        assert "python build_assets.py" in content
     
     def test_generate_with_uv(self, readme_generator):
         """Test README generation with uv."""
@@ -98,7 +102,7 @@ class TestReadmeGenerator:
         content = readme_generator.generate(project_info)
         
         assert "Uv-Project" in content or "uv" in content.lower()
-        assert "uv venv" in content or "uv pip install" in content
+        assert "uv sync" in content
     
     def test_generate_with_conda(self, readme_generator):
         """Test README generation with conda."""
@@ -113,8 +117,50 @@ class TestReadmeGenerator:
         content = readme_generator.generate(project_info)
         
         assert "Conda-Project" in content or "conda" in content.lower()
-        assert "conda" in content
+        assert "conda env create -f environment.yml" in content
+
+    def test_generate_lists_dependencies(self, readme_generator):
+        """Test README lists the resolved dependencies."""
+        project_info = {
+            "name": "deps-project",
+            "description": "A project",
+            "use_flask": True,
+            "create_tests": True,
+        }
+        dependencies = ProjectDependencies.from_project_info(
+            {"libraries": ["requests>=2.31"], "use_pylint": True}
+        )
+
+        content = readme_generator.generate(project_info, dependencies)
+
+        assert "## Dependencies\n\nMain:\n\n- `requests>=2.31`\n" in content
+        assert "Development:\n\n- `pylint`\n" in content
+        assert "`flask`" not in content
+
+    def test_generate_without_dependencies(self, readme_generator):
+        """Test README has no dependencies section without dependencies."""
+        project_info = {"name": "bare-project", "description": "A project"}
+
+        content = readme_generator.generate(project_info)
+
+        assert "## Dependencies" not in content
     
+    def test_generate_with_fastapi(self, readme_generator):
+        """Test README generation with FastAPI using uv."""
+        project_info = {
+            "name": "async-project",
+            "description": "An async project",
+            "dependencies_manager": "uv",
+            "use_flask": False,
+            "use_fastapi": True,
+        }
+
+        content = readme_generator.generate(project_info)
+
+        assert "uv run uvicorn app:app --reload" in content
+        assert "uv run uvicorn app:app --host 0.0.0.0 --port 8000 --workers 4" in content
+        assert "`uvicorn[standard]`" in content
+
     def test_generate_with_flask_different_managers(self, readme_generator):
         """Test Flask instructions differ based on dependency manager."""
         managers = ["pip", "poetry", "uv", "conda"]
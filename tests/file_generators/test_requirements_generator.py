@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import Mock
+from boilrpy.dependencies import ProjectDependencies
 from boilrpy.file_generators.requirements_generator import RequirementsGenerator
 
 
@@ -8,44 +9,33 @@ def mock_base_generator():
     return Mock()
 
 
+def test_requirements_generator_without_dependencies(mock_base_generator):
+    generator = RequirementsGenerator(mock_base_generator)
+    assert generator.generate() == ""
+
+
 def test_requirements_generator_empty_project_info(mock_base_generator):
     generator = RequirementsGenerator(mock_base_generator)
-    result = generator.generate({})
+    result = generator.generate(ProjectDependencies.from_project_info({}))
     assert result == ""
 
 
 def test_requirements_generator_all_options_true(mock_base_generator):
     generator = RequirementsGenerator(mock_base_generator)
     project_info = {"use_pylint": True, "use_flask": True, "create_tests": True}
-    result = generator.generate(project_info)
-    assert "pylint" in result
-    assert "flask" in result
-    assert "python-dotenv" in result
-    assert "pytest" in result
+    result = generator.generate(ProjectDependencies.from_project_info(project_info))
+    assert result == "flask\npython-dotenv\ngunicorn\n"
 
 
-def test_requirements_generator_some_options_true(mock_base_generator):
+def test_requirements_generator_excludes_dev_dependencies(mock_base_generator):
     generator = RequirementsGenerator(mock_base_generator)
     project_info = {"use_pylint": True, "use_flask": False, "create_tests": True}
-    result = generator.generate(project_info)
-    assert "pylint" in result
-    assert "pytest" in result
-    assert "flask" not in result
-    assert "python-dotenv" not in result
-
-
-def test_requirements_generator_no_options_true(mock_base_generator):
-    generator = RequirementsGenerator(mock_base_generator)
-    project_info = {"use_pylint": False, "use_flask": False, "create_tests": False}
-    result = generator.generate(project_info)
+    result = generator.generate(ProjectDependencies.from_project_info(project_info))
     assert result == ""
 
 
-def test_requirements_generator_only_flask_true(mock_base_generator):
+def test_requirements_generator_with_pins(mock_base_generator):
     generator = RequirementsGenerator(mock_base_generator)
-    project_info = {"use_pylint": False, "use_flask": True, "create_tests": False}
-    result = generator.generate(project_info)
-    assert "flask" in result
-    assert "python-dotenv" in result
-    assert "pylint" not in result
-    assert "pytest" not in result
+    project_info = {"libraries": ["requests>=2.31", "pip::foo == 1.0"]}
+    result = generator.generate(ProjectDependencies.from_project_info(project_info))
+    assert result == "requests>=2.31\nfoo==1.0\n"
@@ -0,0 +1,107 @@
+import gzip
+import json
+from unittest.mock import Mock, patch
+import pytest
+from boilrpy import asset_pipeline
+from boilrpy.asset_pipeline import (
+    build_assets,
+    compress,
+    fingerprint,
+    main,
+    minify_css,
+    minify_js,
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    (static / "js").mkdir()
+    (static / "img").mkdir()
+    (static / "css" / "style.css").write_text(
+        "/* Styles */\nbody {\n    margin: 0;\n    color: white;\n}\n"
+    )
+    (static / "js" / "script.js").write_text(
+        "// Script\nconsole.log('loaded');\n\n/* done */\n"
+    )
+    (static / "img" / "logo.png").write_bytes(b"\x89PNG")
+    return static
+
+
+def test_minify_css():
+    css = (
+        "/* comment */\nh1 > a,\nh2 {\n    font-size: 2.5rem;\n    margin: 0 auto;\n}\n"
+    )
+    assert minify_css(css) == "h1>a,h2{font-size:2.5rem;margin:0 auto}"
+
+
+def test_minify_css_keeps_pseudo_classes():
+    assert minify_css("a:hover {\n  color: red;\n}") == "a:hover{color:red}"
+
+
+def test_minify_js():
+    script = "// comment\nfunction f() {\n    /* inline */ return 1;\n}\n\n"
+    assert minify_js(script) == "function f() {\nreturn 1;\n}"
+
+
+def test_fingerprint():
+    name = fingerprint("css/style.css", b"body{}")
+    assert name.startswith("css/style.")
+    assert name.endswith(".css")
+    assert len(name.split(".")[1]) == 12
+    assert name == fingerprint("css/style.css", b"body{}")
+    assert name != fingerprint("css/style.css", b"body{margin:0}")
+
+
+def test_compress_is_reproducible():
+    variants = compress(b"body{}" * 100)
+    assert gzip.decompress(variants[".gz"]) == b"body{}" * 100
+    assert variants == compress(b"body{}" * 100)
+
+
+def test_compress_without_brotli():
+    with patch.object(asset_pipeline, "brotli", None):
+        assert set(compress(b"body{}")) == {".gz"}
+
+
+def test_compress_with_brotli():
+    fake_brotli = Mock()
+    fake_brotli.compress.return_value = b"br"
+    with patch.object(asset_pipeline, "brotli", fake_brotli):
+        variants = compress(b"body{}")
+    assert variants[".br"] == b"br"
+    fake_brotli.compress.assert_called_once_with(b"body{}", quality=11)
+
+
+def test_build_assets(static_dir):
+    manifest = build_assets(str(static_dir))
+
+    assert set(manifest) == {"css/style.css", "js/script.js"}
+    css_target = static_dir / manifest["css/style.css"]
+    assert manifest["css/style.css"].startswith("dist/css/style.")
+    assert css_target.read_text() == "body{margin:0;color:white}"
+    assert (
+        gzip.decompress((static_dir / (manifest["css/style.css"] + ".gz")).read_bytes())
+        == css_target.read_bytes()
+    )
+    assert (static_dir / manifest["js/script.js"]).read_text() == (
+        "console.log('loaded');"
+    )
+    assert json.loads((static_dir / "dist" / "manifest.json").read_text()) == manifest
+
+
+def test_build_assets_replaces_previous_build(static_dir):
+    first = build_assets(str(static_dir))
+    (static_dir / "css" / "style.css").write_text("body { margin: 1px; }")
+
+    second = build_assets(str(static_dir))
+
+    assert second["css/style.css"] != first["css/style.css"]
+    assert not (static_dir / first["css/style.css"]).exists()
+    assert "dist/" not in "".join(second)
+
+
+def test_main(static_dir, capsys):
+    main([str(static_dir)])
+    assert "css/style.css -> dist/css/style." in capsys.readouterr().out
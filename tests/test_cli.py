@@ -30,7 +30,7 @@ def test_gather_project_info(mock_config):
             "1.0.0",  # version
             "John Doe",  # author
             "1",  # license
-            "2", # dep manager
+            "2",  # dep manager
             "y",  # use docker
             "y",  # create tests
             "y",  # use pylint
@@ -50,6 +50,30 @@ def test_gather_project_info(mock_config):
     assert project_info["use_pylint"] is True
     assert project_info["use_flask"] is True
 
+
+def test_gather_project_info_with_options(mock_config):
+    cli = CLI(mock_config)
+    with patch(
+        "builtins.input",
+        side_effect=["TestProject", "", "", "", "1", "1", "n", "n", "n", "n"],
+    ), patch("builtins.print"):
+        project_info = cli.gather_project_info({"initial_commit": True})
+
+    assert project_info["initial_commit"] is True
+
+
+def test_gather_project_info_with_fastapi(mock_config):
+    cli = CLI(mock_config)
+    with patch(
+        "builtins.input",
+        side_effect=["TestProject", "", "", "", "1", "1", "n", "n", "n"],
+    ), patch("builtins.print"):
+        project_info = cli.gather_project_info({"use_fastapi": True})
+
+    assert project_info["use_fastapi"] is True
+    assert project_info["use_flask"] is False
+
+
 def test_get_valid_input(mock_config):
     cli = CLI(mock_config)
     with patch("builtins.input", return_value="TestProject"):
@@ -112,6 +136,19 @@ def test_choose_license(mock_config):
         ]
 
 
+def test_choose_other_spdx_license(mock_config):
+    cli = CLI(mock_config)
+    with patch(
+        "builtins.input", side_effect=["6", "Unknown-1.0", "mpl-2.0"]
+    ) as mocked_input:
+        assert cli._choose_license() == "MPL-2.0"
+        assert mocked_input.call_args_list == [
+            call("Choose a license (enter the number): "),
+            call("Enter an SPDX license id (e.g. MPL-2.0): "),
+            call("Enter an SPDX license id (e.g. MPL-2.0): "),
+        ]
+
+
 def test_choose_dep_managers(mock_config):
     cli = CLI(mock_config)
     with patch("builtins.input", return_value="2"):
@@ -126,6 +163,7 @@ def test_choose_dep_managers(mock_config):
             call("Choose a dependencies manager (enter the number): "),
         ]
 
+
 def mock_input(prompt):
     return prompt
 
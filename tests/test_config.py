@@ -40,3 +40,7 @@ def test_get_use_camel_case(config):
 def test_get_default_vrsion(config):
     default_version = config().get_default_version()
     assert isinstance(default_version, str)
+
+
+def test_get_git_default_branch(config):
+    assert config().get_git_default_branch() == "main"
@@ -0,0 +1,19 @@
+import hashlib
+from boilrpy.utils.content_hasher import ContentHasher
+
+
+def test_hash_text():
+    expected = hashlib.sha256("content".encode("utf-8")).hexdigest()
+    assert ContentHasher.hash_text("content") == expected
+
+
+def test_hash_text_charset():
+    assert ContentHasher.hash_text("é", "latin-1") != ContentHasher.hash_text("é")
+
+
+def test_hash_file_matches_hash_text(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("line 1\nline 2\n", encoding="utf-8")
+    assert ContentHasher.hash_file(str(path)) == ContentHasher.hash_text(
+        "line 1\nline 2\n"
+    )
@@ -0,0 +1,125 @@
+import pytest
+from boilrpy.dependencies import Dependency, ProjectDependencies
+
+
+@pytest.mark.parametrize(
+    "requirement, expected",
+    [
+        ("requests", Dependency("requests")),
+        ("requests>=2.31", Dependency("requests", ">=2.31")),
+        ("requests >= 2.31, < 3", Dependency("requests", ">=2.31,<3")),
+        ("pip::foo==1.0", Dependency("foo", "==1.0", "pip")),
+        ("bioconda::samtools", Dependency("samtools", "", "bioconda")),
+        ("uvicorn[standard]", Dependency("uvicorn[standard]")),
+    ],
+)
+def test_parse(requirement, expected):
+    assert Dependency.parse(requirement) == expected
+
+
+def test_parse_invalid_requirement():
+    with pytest.raises(ValueError, match="Invalid requirement: '>=1.0'"):
+        Dependency.parse(">=1.0")
+
+
+def test_requirements():
+    dependency = Dependency("uvicorn[standard]", "~=0.30")
+    assert dependency.requirement == "uvicorn[standard]~=0.30"
+    assert dependency.conda_requirement == "uvicorn>=0.30"
+    assert Dependency("samtools", "", "bioconda").conda_requirement == (
+        "bioconda::samtools"
+    )
+
+
+def test_pip_only():
+    assert Dependency("foo", channel="pip").pip_only
+    assert not Dependency("foo", channel="bioconda").pip_only
+    assert not Dependency("foo").pip_only
+
+
+def test_equality_and_repr():
+    assert Dependency("flask") != "flask"
+    assert len({Dependency("flask"), Dependency("flask")}) == 1
+    assert repr(Dependency("flask", ">=3")) == "Dependency('flask', '>=3', None)"
+
+
+def test_from_project_info():
+    dependencies = ProjectDependencies.from_project_info(
+        {
+            "use_flask": True,
+            "create_tests": True,
+            "use_pylint": True,
+            "libraries": ["requests>=2.31", "Flask", "pip::foo"],
+        }
+    )
+    assert dependencies.requirements() == [
+        "flask",
+        "python-dotenv",
+        "gunicorn",
+        "requests>=2.31",
+        "foo",
+    ]
+    assert dependencies.dev_requirements() == ["pytest", "pylint"]
+
+
+def test_from_project_info_with_flask_cache():
+    dependencies = ProjectDependencies.from_project_info(
+        {"use_flask": True, "use_flask_cache": True}
+    )
+    assert dependencies.requirements()[-2:] == ["flask-caching", "flask-compress"]
+    dependencies = ProjectDependencies.from_project_info({"use_flask_cache": True})
+    assert dependencies.requirements() == []
+
+
+def test_from_project_info_with_database():
+    dependencies = ProjectDependencies.from_project_info(
+        {"use_flask": True, "use_database": True}
+    )
+    assert dependencies.requirements()[-1] == "sqlalchemy"
+    dependencies = ProjectDependencies.from_project_info({"use_database": True})
+    assert dependencies.requirements() == []
+
+
+def test_from_project_info_with_logging():
+    dependencies = ProjectDependencies.from_project_info({"use_logging": True})
+    assert dependencies.requirements() == ["python-dotenv"]
+    dependencies = ProjectDependencies.from_project_info(
+        {"use_flask": True, "use_logging": True}
+    )
+    assert dependencies.requirements() == ["flask", "python-dotenv", "gunicorn"]
+
+
+def test_from_project_info_with_fastapi():
+    dependencies = ProjectDependencies.from_project_info({"use_fastapi": True})
+    assert dependencies.requirements() == [
+        "fastapi",
+        "uvicorn[standard]",
+        "httpx",
+        "python-dotenv",
+    ]
+    assert "uvicorn" in dependencies.conda_requirements()
+
+
+def test_from_empty_project_info():
+    dependencies = ProjectDependencies.from_project_info({})
+    assert dependencies.main == []
+    assert dependencies.dev == []
+
+
+def test_conda_requirements_and_channels():
+    dependencies = ProjectDependencies(
+        [
+            Dependency("flask"),
+            Dependency("samtools", ">=1.9", "bioconda"),
+            Dependency("foo", "", "pip"),
+        ],
+        [Dependency("pytest"), Dependency("bar", "", "bioconda")],
+    )
+    assert dependencies.conda_requirements() == [
+        "flask",
+        "bioconda::samtools>=1.9",
+        "pytest",
+        "bioconda::bar",
+    ]
+    assert dependencies.pip_only_requirements() == ["foo"]
+    assert dependencies.conda_channels() == ("conda-forge", "defaults", "bioconda")
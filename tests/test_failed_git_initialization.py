@@ -1,6 +1,6 @@
 from unittest.mock import patch, MagicMock
-from subprocess import CalledProcessError
 import pytest
+from boilrpy.git_writer import GitWriterError
 from boilrpy.project_creator import ProjectCreator
 
 
@@ -11,18 +11,24 @@ def project_creator():
 
 
 @pytest.fixture
-def mock_run():
-    with patch('subprocess.run', new_callable=MagicMock) as mock:
-        yield mock
-
-def test_git_not_found(mock_run, project_creator):
-    with patch('subprocess.run', side_effect=FileNotFoundError()) as mock_run:
-        project_creator._initialize_git_repository()
-        assert mock_run.call_count == 1
-        mock_run.assert_called_once_with(["git", "--version"], check=True, capture_output=True)
-
-def test_git_initialization_error(mock_run, project_creator):
-    with patch('subprocess.run', side_effect=CalledProcessError(0, "git", output="Git init failded")) as mock_run:
-        project_creator._initialize_git_repository()
-    
-        assert mock_run.call_count == 1
\ No newline at end of file
+def mock_git_writer():
+    with patch("boilrpy.project_creator.GitWriter") as mock:
+        yield mock.return_value
+
+
+def test_git_repository_already_exists(mock_git_writer, project_creator):
+    mock_git_writer.init.side_effect = GitWriterError("already exists")
+    with patch("builtins.print") as mock_print:
+        project_creator._initialize_git_repository({"initial_commit": True})
+
+    mock_git_writer.commit_all.assert_not_called()
+    assert "already exists" in mock_print.call_args_list[0].args[0]
+
+
+def test_git_initial_commit_error(mock_git_writer, project_creator):
+    mock_git_writer.commit_all.side_effect = GitWriterError("Git not found")
+    with patch("builtins.print") as mock_print:
+        project_creator._initialize_git_repository({"initial_commit": True})
+
+    assert mock_print.call_count == 2
+    assert "Git not found" in mock_print.call_args_list[0].args[0]
@@ -0,0 +1,38 @@
+import pytest
+from unittest.mock import Mock, patch
+from boilrpy.config import Config
+from boilrpy.fastapi_app_creator import FastAPIAppCreator
+from boilrpy.file_generator import FileGenerator
+from boilrpy.file_writer import FileWriter
+
+
+@pytest.fixture
+def fastapi_app_creator():
+    with patch(
+        "boilrpy.fastapi_app_creator.FileGenerator",
+        return_value=Mock(spec=FileGenerator),
+    ), patch(
+        "boilrpy.fastapi_app_creator.FileWriter", return_value=Mock(spec=FileWriter)
+    ):
+        return FastAPIAppCreator(Mock(spec=Config))
+
+
+def test_create_fastapi_project(fastapi_app_creator):
+    project_info = {"name": "Test Project", "description": "A test FastAPI project"}
+    fastapi_app_creator.create_fastapi_project(project_info)
+
+    file_generator = fastapi_app_creator.file_generator
+    assert fastapi_app_creator.file_writer.write_file.call_count == 2
+    file_generator.generate_fastapi_app_file.assert_called_once_with(project_info)
+    fastapi_app_creator.file_writer.write_file.assert_any_call(
+        "app.py", file_generator.generate_fastapi_app_file.return_value
+    )
+    fastapi_app_creator.file_writer.write_file.assert_any_call(
+        ".env", file_generator.generate_fastapi_dot_env_file.return_value
+    )
+
+
+def test_uses_given_file_writer():
+    file_writer = Mock(spec=FileWriter)
+    creator = FastAPIAppCreator(Mock(spec=Config), file_writer)
+    assert creator.file_writer is file_writer
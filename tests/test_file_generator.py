@@ -22,6 +22,8 @@ def mock_generator_factory():
             "main_file": Mock(),
             "requirements": Mock(),
             "flask": Mock(),
+            "fastapi": Mock(),
+            "logging": Mock(),
         }
         mock_factory.create_generator.side_effect = (
             lambda generator_type, config: mock_generators[generator_type]
@@ -35,6 +37,28 @@ def mock_generator_factory():
             "Mock .dockerignore content"
         )
         mock_generators["flask"].generate_app_file.return_value = "Mock flask content"
+        mock_generators["flask"].generate_wsgi_file.return_value = "Mock flask content"
+        mock_generators["flask"].generate_build_assets_script.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_metrics_module.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_metrics_test.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_database_module.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_database_fixture.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_database_test.return_value = (
+            "Mock flask content"
+        )
+        mock_generators["flask"].generate_gunicorn_conf.return_value = (
+            "Mock flask content"
+        )
         mock_generators["flask"].generate_base_template.return_value = (
             "Mock flask content"
         )
@@ -48,6 +72,15 @@ def mock_generator_factory():
         mock_generators["flask"].generate_script_file.return_value = (
             "Mock flask content"
         )
+        mock_generators["fastapi"].generate_app_file.return_value = (
+            "Mock fastapi content"
+        )
+        mock_generators["fastapi"].generate_dot_env_file.return_value = (
+            "Mock fastapi content"
+        )
+        mock_generators["logging"].generate_dot_env_file.return_value = (
+            "Mock logging content"
+        )
         yield mock_factory
 
 
@@ -77,7 +110,7 @@ def test_generate_license(file_generator, mock_generator_factory):
 
 
 def test_generate_gitignore(file_generator, mock_generator_factory):
-    result = file_generator.generate_gitignore()
+    result = file_generator.generate_gitignore({"use_flask": True})
     assert result == "Mock gitignore content"
     mock_generator_factory.create_generator.assert_called_with(
         "gitignore", file_generator.config
@@ -93,7 +126,7 @@ def test_generate_changelog(file_generator, mock_generator_factory):
 
 
 def test_generate_dockerfile(file_generator, mock_generator_factory):
-    result = file_generator.generate_dockerfile("test_project", False)
+    result = file_generator.generate_dockerfile({"name": "test_project"})
     assert result == "Mock Dockerfile content"
     mock_generator_factory.create_generator.assert_called_with(
         "dockerfile", file_generator.config
@@ -132,6 +165,102 @@ def test_generate_flask_app_file(file_generator, mock_generator_factory):
     )
 
 
+def test_generate_wsgi_file(file_generator, mock_generator_factory):
+    result = file_generator.generate_wsgi_file()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_gunicorn_conf(file_generator, mock_generator_factory):
+    result = file_generator.generate_gunicorn_conf()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_build_assets_script(file_generator, mock_generator_factory):
+    result = file_generator.generate_build_assets_script()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_metrics_module(file_generator, mock_generator_factory):
+    result = file_generator.generate_metrics_module()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_metrics_test(file_generator, mock_generator_factory):
+    result = file_generator.generate_metrics_test()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_database_module(file_generator, mock_generator_factory):
+    result = file_generator.generate_database_module()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_database_fixture(file_generator, mock_generator_factory):
+    result = file_generator.generate_database_fixture()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_database_test(file_generator, mock_generator_factory):
+    result = file_generator.generate_database_test()
+    assert result == "Mock flask content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "flask", file_generator.config
+    )
+
+
+def test_generate_logging_config(file_generator, mock_generator_factory):
+    result = file_generator.generate_logging_config({"use_flask": True})
+    assert result == "Mock logging content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "logging", file_generator.config
+    )
+
+
+def test_generate_logging_dot_env_file(file_generator, mock_generator_factory):
+    result = file_generator.generate_logging_dot_env_file()
+    assert result == "Mock logging content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "logging", file_generator.config
+    )
+
+
+def test_generate_fastapi_app_file(file_generator, mock_generator_factory):
+    result = file_generator.generate_fastapi_app_file({"name": "Test Project"})
+    assert result == "Mock fastapi content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "fastapi", file_generator.config
+    )
+
+
+def test_generate_fastapi_dot_env_file(file_generator, mock_generator_factory):
+    result = file_generator.generate_fastapi_dot_env_file()
+    assert result == "Mock fastapi content"
+    mock_generator_factory.create_generator.assert_called_with(
+        "fastapi", file_generator.config
+    )
+
+
 def test_generate_base_template(file_generator, mock_generator_factory):
     project_info = {"name": "Test Project", "description": "A test project"}
     result = file_generator.generate_base_template(project_info)
@@ -203,6 +332,8 @@ def test_generator_factory():
         "pylint",
         "requirements",
         "flask",
+        "fastapi",
+        "logging",
     ]:
         generator = factory.create_generator(generator_type, config)
         assert hasattr(generator, "generate")
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import mock_open, patch
-from boilrpy.file_writer import FileWriter, FileWriterError
+from boilrpy.file_writer import FileWriter, FileWriterError, IncrementalFileWriter
+from boilrpy.utils.content_hasher import ContentHasher
 
 
 @pytest.fixture
@@ -70,3 +71,71 @@ def test_create_directory_oserror(mock_makedirs, file_writer):
 def test_file_writer_error():
     error = FileWriterError("Test error message")
     assert str(error) == "Test error message"
+
+
+@patch("builtins.open", new_callable=mock_open)
+def test_write_file_records_hash(mock_file, file_writer):
+    file_writer.write_file("test.txt", "content")
+    assert file_writer.written_files == {
+        "test.txt": ContentHasher.hash_text("content", "utf-8")
+    }
+
+
+@pytest.fixture
+def generated_file(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text("original", encoding="utf-8")
+    return str(path)
+
+
+def test_incremental_write_creates_missing_file(tmp_path):
+    writer = IncrementalFileWriter("utf-8")
+    path = str(tmp_path / "new.txt")
+    writer.write_file(path, "content")
+    assert writer.created_files == [path]
+    assert open(path, encoding="utf-8").read() == "content"
+
+
+def test_incremental_write_skips_unchanged_file(generated_file):
+    recorded = {generated_file: ContentHasher.hash_text("original")}
+    writer = IncrementalFileWriter("utf-8", recorded)
+    with patch.object(FileWriter, "write_file") as mock_write:
+        writer.write_file(generated_file, "original")
+    mock_write.assert_not_called()
+    assert writer.unchanged_files == [generated_file]
+    assert writer.written_files == recorded
+
+
+def test_incremental_write_updates_stale_file(generated_file):
+    recorded = {generated_file: ContentHasher.hash_text("original")}
+    writer = IncrementalFileWriter("utf-8", recorded)
+    writer.write_file(generated_file, "updated")
+    assert writer.updated_files == [generated_file]
+    assert open(generated_file, encoding="utf-8").read() == "updated"
+    assert writer.written_files[generated_file] == ContentHasher.hash_text("updated")
+
+
+def test_incremental_write_keeps_user_edits(generated_file):
+    recorded = {generated_file: ContentHasher.hash_text("previous template")}
+    writer = IncrementalFileWriter("utf-8", recorded)
+    writer.write_file(generated_file, "new template")
+    assert writer.modified_files == [generated_file]
+    assert open(generated_file, encoding="utf-8").read() == "original"
+    assert writer.written_files == recorded
+
+
+def test_incremental_write_keeps_unrecorded_user_file(generated_file):
+    writer = IncrementalFileWriter("utf-8")
+    writer.write_file(generated_file, "generated")
+    assert writer.modified_files == [generated_file]
+    assert writer.written_files == {}
+    assert open(generated_file, encoding="utf-8").read() == "original"
+
+
+def test_incremental_write_read_error(generated_file):
+    writer = IncrementalFileWriter("utf-8")
+    with patch(
+        "boilrpy.file_writer.ContentHasher.hash_file",
+        side_effect=PermissionError("denied"),
+    ), pytest.raises(FileWriterError, match="Error reading file"):
+        writer.write_file(generated_file, "generated")
@@ -29,19 +29,32 @@ def flask_app_creator(mock_config, mock_file_generator, mock_file_writer):
         return FlaskAppCreator(mock_config)
 
 
-def test_create_flask_project(flask_app_creator):
+@patch("boilrpy.flask_app_creator.build_assets")
+def test_create_flask_project(mock_build_assets, flask_app_creator):
     project_info = {"name": "Test Project", "description": "A test Flask project"}
     flask_app_creator.create_flask_project(project_info)
 
+    mock_build_assets.assert_called_once_with("static")
+
     assert flask_app_creator.file_writer.create_directory.call_count == 3
     flask_app_creator.file_writer.create_directory.assert_any_call("templates")
     flask_app_creator.file_writer.create_directory.assert_any_call("static/css")
     flask_app_creator.file_writer.create_directory.assert_any_call("static/js")
 
-    assert flask_app_creator.file_writer.write_file.call_count == 6
+    assert flask_app_creator.file_writer.write_file.call_count == 9
     flask_app_creator.file_writer.write_file.assert_any_call(
         "app.py", flask_app_creator.file_generator.generate_flask_app_file()
     )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "wsgi.py", flask_app_creator.file_generator.generate_wsgi_file()
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "gunicorn.conf.py", flask_app_creator.file_generator.generate_gunicorn_conf()
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "build_assets.py",
+        flask_app_creator.file_generator.generate_build_assets_script(),
+    )
     flask_app_creator.file_writer.write_file.assert_any_call(
         ".env", flask_app_creator.file_generator.generate_dot_env_file()
     )
@@ -69,14 +82,88 @@ def test_create_flask_folders(flask_app_creator):
 
 
 def test_create_flask_app_file(flask_app_creator):
-    flask_app_creator._create_flask_app_file()
+    project_info = {"use_flask_cache": True}
+    flask_app_creator._create_flask_app_file(project_info)
+    flask_app_creator.file_generator.generate_flask_app_file.assert_called_once_with(
+        project_info
+    )
     flask_app_creator.file_writer.write_file.assert_called_once_with(
         "app.py", flask_app_creator.file_generator.generate_flask_app_file()
     )
 
 
+def test_create_flask_server_files(flask_app_creator):
+    flask_app_creator._create_flask_server_files()
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "build_assets.py",
+        flask_app_creator.file_generator.generate_build_assets_script(),
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "wsgi.py", flask_app_creator.file_generator.generate_wsgi_file()
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "gunicorn.conf.py", flask_app_creator.file_generator.generate_gunicorn_conf()
+    )
+
+
+def test_create_flask_metrics_files(flask_app_creator):
+    flask_app_creator._create_flask_metrics_files(
+        {"use_metrics": True, "create_tests": True}
+    )
+    assert flask_app_creator.file_writer.write_file.call_count == 2
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "metrics.py", flask_app_creator.file_generator.generate_metrics_module()
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "tests/test_metrics.py",
+        flask_app_creator.file_generator.generate_metrics_test(),
+    )
+
+
+def test_create_flask_metrics_files_without_tests(flask_app_creator):
+    flask_app_creator._create_flask_metrics_files({"use_metrics": True})
+    flask_app_creator.file_writer.write_file.assert_called_once_with(
+        "metrics.py", flask_app_creator.file_generator.generate_metrics_module()
+    )
+
+
+def test_create_flask_metrics_files_without_metrics(flask_app_creator):
+    flask_app_creator._create_flask_metrics_files({"create_tests": True})
+    flask_app_creator.file_writer.write_file.assert_not_called()
+
+
+def test_create_flask_database_files(flask_app_creator):
+    flask_app_creator._create_flask_database_files(
+        {"use_database": True, "create_tests": True}
+    )
+    assert flask_app_creator.file_writer.write_file.call_count == 3
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "database.py", flask_app_creator.file_generator.generate_database_module()
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "tests/conftest.py",
+        flask_app_creator.file_generator.generate_database_fixture(),
+    )
+    flask_app_creator.file_writer.write_file.assert_any_call(
+        "tests/test_database.py",
+        flask_app_creator.file_generator.generate_database_test(),
+    )
+
+
+def test_create_flask_database_files_without_tests(flask_app_creator):
+    flask_app_creator._create_flask_database_files({"use_database": True})
+    flask_app_creator.file_writer.write_file.assert_called_once_with(
+        "database.py", flask_app_creator.file_generator.generate_database_module()
+    )
+
+
+def test_create_flask_database_files_without_database(flask_app_creator):
+    flask_app_creator._create_flask_database_files({"create_tests": True})
+    flask_app_creator.file_writer.write_file.assert_not_called()
+
+
 def test_create_flask_dot_env(flask_app_creator):
-    flask_app_creator._create_flask_dot_env()
+    flask_app_creator._create_flask_dot_env({})
     flask_app_creator.file_writer.write_file.assert_called_once_with(
         ".env", flask_app_creator.file_generator.generate_dot_env_file()
     )
@@ -103,3 +190,13 @@ def test_create_flask_static_files(flask_app_creator):
     flask_app_creator.file_writer.write_file.assert_any_call(
         "static/js/script.js", flask_app_creator.file_generator.generate_script_file()
     )
+
+
+def test_build_flask_assets(flask_app_creator, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "static" / "css").mkdir(parents=True)
+    (tmp_path / "static" / "css" / "style.css").write_text("body { margin: 0; }")
+
+    flask_app_creator._build_flask_assets()
+
+    assert (tmp_path / "static" / "dist" / "manifest.json").exists()
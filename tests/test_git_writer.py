@@ -0,0 +1,197 @@
+import os
+import shutil
+import struct
+import subprocess
+import zlib
+import pytest
+from unittest.mock import patch
+from boilrpy.git_writer import (
+    GitIdentity,
+    GitignoreMatcher,
+    GitWriter,
+    GitWriterError,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "README.md").write_text("# Test\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "__init__.py").write_text("")
+    (tmp_path / ".env").write_text("SECRET=1\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "pyvenv.cfg").write_text("home = /usr\n")
+    (tmp_path / ".gitignore").write_text("# Python\n.env\n.venv\n__pycache__/\n")
+    return tmp_path
+
+
+@pytest.fixture
+def identity():
+    return GitIdentity("Test Author", "test@example.com")
+
+
+def read_object(repo_path, object_id):
+    path = os.path.join(repo_path, ".git", "objects", object_id[:2], object_id[2:])
+    with open(path, "rb") as file:
+        header, content = zlib.decompress(file.read()).split(b"\0", 1)
+    return header.decode(), content
+
+
+def test_init(project):
+    GitWriter(str(project), "main").init({"core": {"untrackedCache": "true"}})
+
+    assert (project / ".git" / "HEAD").read_text() == "ref: refs/heads/main\n"
+    assert (project / ".git" / "refs" / "heads").is_dir()
+    assert (project / ".git" / "objects" / "pack").is_dir()
+    config = (project / ".git" / "config").read_text()
+    assert "[core]\n\trepositoryformatversion = 0\n" in config
+    assert "\tuntrackedCache = true\n" in config
+
+
+def test_init_existing_repository(project):
+    (project / ".git").mkdir()
+    with pytest.raises(GitWriterError, match="already exists"):
+        GitWriter(str(project)).init()
+
+
+def test_init_write_error(project):
+    with patch("boilrpy.git_writer.os.makedirs", side_effect=OSError("denied")):
+        with pytest.raises(GitWriterError, match="Error initializing git repository"):
+            GitWriter(str(project)).init()
+
+
+def test_commit_all(project, identity):
+    writer = GitWriter(str(project), "main")
+    writer.init()
+    commit_id = writer.commit_all("Initial commit", identity)
+
+    assert (project / ".git" / "refs" / "heads" / "main").read_text() == (
+        f"{commit_id}\n"
+    )
+    object_type, commit = read_object(project, commit_id)
+    assert object_type.startswith("commit ")
+    assert b"author Test Author <test@example.com>" in commit
+    assert commit.endswith(b"\n\nInitial commit\n")
+
+    tree_id = commit.split(b"\n")[0].split()[1].decode()
+    _, tree = read_object(project, tree_id)
+    assert b"100644 README.md\0" in tree
+    assert b"40000 tests\0" in tree
+    assert b".env" not in tree
+    assert b".venv" not in tree
+
+
+def test_commit_all_writes_index(project, identity):
+    writer = GitWriter(str(project))
+    writer.init()
+    writer.commit_all("Initial commit", identity)
+
+    index = (project / ".git" / "index").read_bytes()
+    signature, version, count = struct.unpack(">4sII", index[:12])
+    assert (signature, version, count) == (b"DIRC", 2, 3)
+    assert b".gitignore\0" in index
+    assert b"tests/__init__.py\0" in index
+
+
+def test_commit_all_falls_back_to_fast_import(project, identity):
+    writer = GitWriter(str(project))
+    writer.init()
+    completed = subprocess.CompletedProcess([], 0, stdout=b"abc123\n")
+    with patch.object(
+        writer, "_commit_natively", side_effect=OSError("no space left")
+    ), patch("boilrpy.git_writer.subprocess.run", return_value=completed) as mock_run:
+        commit_id = writer.commit_all("Initial commit", identity)
+
+    assert commit_id == "abc123"
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] == ["git", "fast-import", "--quiet"]
+    stream = mock_run.call_args.kwargs["input"]
+    assert b"commit refs/heads/main\n" in stream
+    assert b"M 100644 inline README.md\ndata 7\n# Test\n" in stream
+
+
+def test_fast_import_without_git(project, identity):
+    writer = GitWriter(str(project))
+    writer.init()
+    with patch.object(writer, "_commit_natively", side_effect=OSError()), patch(
+        "boilrpy.git_writer.subprocess.run", side_effect=FileNotFoundError()
+    ), pytest.raises(GitWriterError, match="Error creating initial commit"):
+        writer.commit_all("Initial commit", identity)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_repository_is_valid_for_git(project, identity):
+    os.symlink("README.md", project / "link")
+    (project / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(project / "run.sh", 0o755)
+    writer = GitWriter(str(project), "main")
+    writer.init()
+    writer.commit_all("Initial commit", identity)
+
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=project, capture_output=True, text=True, check=True
+        ).stdout
+
+    git("fsck", "--strict")
+    assert git("status", "--porcelain") == ""
+    assert git("log", "--format=%s") == "Initial commit\n"
+    assert "120000" in git("ls-files", "-s", "link")
+    assert "100755" in git("ls-files", "-s", "run.sh")
+
+
+def test_identity_from_environment(monkeypatch):
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Env Author")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "env@example.com")
+    identity = GitIdentity.from_environment("Default")
+    assert (identity.name, identity.email) == ("Env Author", "env@example.com")
+
+
+def test_identity_from_git_config(monkeypatch, tmp_path):
+    monkeypatch.delenv("GIT_AUTHOR_NAME", raising=False)
+    monkeypatch.delenv("GIT_AUTHOR_EMAIL", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+    (tmp_path / ".gitconfig").write_text(
+        "[user]\n\tname = Config Author\n\temail = config@example.com\n"
+    )
+    identity = GitIdentity.from_environment("Default")
+    assert (identity.name, identity.email) == ("Config Author", "config@example.com")
+
+
+def test_identity_default_name(monkeypatch, tmp_path):
+    monkeypatch.delenv("GIT_AUTHOR_NAME", raising=False)
+    monkeypatch.delenv("GIT_AUTHOR_EMAIL", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+    identity = GitIdentity.from_environment("Default")
+    assert (identity.name, identity.email) == ("Default", "")
+
+
+def test_identity_signature():
+    signature = GitIdentity("Me", "me@example.com").signature(0)
+    assert signature.startswith("Me <me@example.com> 0 ")
+    assert len(signature.rsplit(" ", 1)[-1]) == 5
+
+
+def test_gitignore_matcher():
+    matcher = GitignoreMatcher(["# comment", "*.py[cod]", "build/", "/dist", "!keep"])
+    assert matcher.is_ignored("pkg/module.pyc")
+    assert matcher.is_ignored("build", is_directory=True)
+    assert not matcher.is_ignored("build")
+    assert matcher.is_ignored("dist")
+    assert not matcher.is_ignored("pkg/dist")
+    assert not matcher.is_ignored("keep")
+
+
+def test_gitignore_matcher_missing_file(tmp_path):
+    matcher = GitignoreMatcher.from_file(str(tmp_path / ".gitignore"))
+    assert not matcher.is_ignored("anything")
+
+
+def test_write_index_error(project, identity):
+    writer = GitWriter(str(project))
+    writer.init()
+    with patch.object(writer, "_write", side_effect=OSError("denied")):
+        with pytest.raises(GitWriterError, match="Error writing git index"):
+            writer._write_index([])
@@ -0,0 +1,94 @@
+import zipfile
+import pytest
+from unittest.mock import patch
+from boilrpy.license_catalog import (
+    CATALOG_PATH,
+    LicenseCatalog,
+    UnknownLicenseError,
+    get_license_catalog,
+)
+
+
+@pytest.fixture
+def catalog():
+    return LicenseCatalog()
+
+
+def test_catalog_is_not_read_before_first_lookup():
+    with patch("zipfile.ZipFile") as mock_zip:
+        LicenseCatalog()
+    mock_zip.assert_not_called()
+
+
+def test_index_is_read_once(catalog):
+    with patch("zipfile.ZipFile", wraps=zipfile.ZipFile) as mock_zip:
+        catalog.resolve("MIT")
+        catalog.resolve("Apache-2.0")
+        catalog.get_license_ids()
+    assert mock_zip.call_count == 1
+
+
+def test_get_license_ids(catalog):
+    license_ids = catalog.get_license_ids()
+    assert len(license_ids) > 300
+    assert license_ids == sorted(license_ids)
+    assert {"MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause"} <= set(license_ids)
+
+
+@pytest.mark.parametrize(
+    "license_name, expected",
+    [
+        ("MIT", "MIT"),
+        ("mit", "MIT"),
+        (" apache-2.0 ", "Apache-2.0"),
+        ("Apache", "Apache-2.0"),
+        ("GPL", "GPL-3.0"),
+        ("GPL-3.0-or-later", "GPL-3.0"),
+        ("LGPL-2.1-only", "LGPL-2.1"),
+        ("BSD", "BSD-3-Clause"),
+        ("Expat", "MIT"),
+    ],
+)
+def test_resolve(catalog, license_name, expected):
+    assert catalog.resolve(license_name) == expected
+
+
+def test_resolve_unknown_license(catalog):
+    with pytest.raises(UnknownLicenseError, match="Unknown SPDX license: 'Nope'"):
+        catalog.resolve("Nope")
+
+
+def test_get_name(catalog):
+    assert catalog.get_name("Apache") == "Apache License 2.0"
+
+
+def test_get_template_reads_one_member(catalog):
+    catalog.resolve("MIT")
+    with patch.object(zipfile.ZipFile, "read", autospec=True) as mock_read:
+        mock_read.return_value = b"template"
+        assert catalog.get_template("MIT") == "template"
+    mock_read.assert_called_once()
+    assert mock_read.call_args[0][1] == "licenses/MIT.txt"
+
+
+def test_render_is_cached(catalog):
+    first = catalog.render("MIT", "2024", "John Doe")
+    with patch.object(
+        catalog, "get_template", return_value="Copyright <year>"
+    ) as mock_get_template:
+        assert catalog.render("mit", "2024", "John Doe") is first
+        assert catalog.render("MIT", "2025", "John Doe") == "Copyright 2025\n"
+    mock_get_template.assert_called_once_with("MIT")
+
+
+def test_render_substitutes_placeholders(catalog):
+    license_text = catalog.render("BSD-2-Clause", "2024", "Jane Doe")
+    assert "Copyright (c) 2024 Jane Doe" in license_text
+    assert "<<" not in license_text
+    assert license_text.endswith("\n")
+
+
+def test_get_license_catalog_is_shared():
+    catalog = get_license_catalog()
+    assert catalog is get_license_catalog()
+    assert catalog.path == CATALOG_PATH
@@ -1,11 +1,18 @@
 import pytest
 import sys
 from unittest.mock import Mock, patch
-from boilrpy.__main__ import run_cli, main
+from boilrpy.__main__ import run_cli, main, check_projects, project_options
+from boilrpy.manifest import ManifestError
 
 class DummyArgs:
-    def __init__(self, check_deps=False):
+    def __init__(
+        self, check_deps=False, command=None, path=".", paths=None, **options
+    ):
         self.check_deps = check_deps
+        self.command = command
+        self.path = path
+        self.paths = paths or ["."]
+        self.__dict__.update(options)
 
 # ✅ Test du chemin --check-deps
 def test_run_cli_check_deps(monkeypatch):
@@ -75,3 +82,137 @@ def test_main_invocation(mock_run_cli, monkeypatch):
     monkeypatch.setattr(sys, "argv", ["boilrpy"])
     main()
     mock_run_cli.assert_called_once()
+
+
+@patch("boilrpy.__main__.Config")
+@patch("boilrpy.__main__.CLI")
+@patch("boilrpy.__main__.ProjectCreator")
+def test_run_cli_update(MockProjectCreator, MockCLI, MockConfig):
+    args = DummyArgs(command="update", path="/path/to/project")
+    run_cli(args)
+
+    MockCLI.assert_not_called()
+    MockProjectCreator.assert_called_once_with(MockConfig.return_value)
+    MockProjectCreator.return_value.update_project.assert_called_once_with(
+        "/path/to/project"
+    )
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_update_invocation(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "update", "my_project"])
+    main()
+    args = mock_run_cli.call_args.args[0]
+    assert args.command == "update"
+    assert args.path == "my_project"
+
+
+@patch("boilrpy.__main__.Config")
+@patch("boilrpy.__main__.check_projects")
+def test_run_cli_check(mock_check_projects, MockConfig):
+    args = DummyArgs(command="check", paths=["a", "b"])
+    run_cli(args)
+    mock_check_projects.assert_called_once_with(MockConfig.return_value, ["a", "b"])
+
+
+@patch("boilrpy.__main__.ProjectCreator")
+def test_check_projects_up_to_date(MockProjectCreator):
+    MockProjectCreator.return_value.check_project.return_value = {}
+    check_projects(Mock(), ["a", "b"])
+    assert MockProjectCreator.return_value.check_project.call_count == 2
+
+
+@patch("boilrpy.__main__.ProjectCreator")
+def test_check_projects_drift_exits_with_error(MockProjectCreator):
+    MockProjectCreator.return_value.check_project.side_effect = [
+        {"README.md": "modified"},
+        {},
+    ]
+    with pytest.raises(SystemExit) as excinfo:
+        check_projects(Mock(), ["a", "b"])
+    assert excinfo.value.code == 1
+    assert MockProjectCreator.return_value.check_project.call_count == 2
+
+
+@patch("builtins.print")
+@patch("boilrpy.__main__.ProjectCreator")
+def test_check_projects_missing_manifest(MockProjectCreator, mock_print):
+    MockProjectCreator.return_value.check_project.side_effect = ManifestError(
+        "No manifest"
+    )
+    with pytest.raises(SystemExit):
+        check_projects(Mock(), ["a"])
+    mock_print.assert_called_once()
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_check_invocation(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "check", "a", "b"])
+    main()
+    args = mock_run_cli.call_args.args[0]
+    assert args.command == "check"
+    assert args.paths == ["a", "b"]
+
+
+def test_project_options():
+    assert project_options(DummyArgs()) == {}
+    assert project_options(DummyArgs(initial_commit=True)) == {"initial_commit": True}
+    assert project_options(DummyArgs(docker_profile="runtime")) == {
+        "docker_profile": "runtime"
+    }
+    assert project_options(DummyArgs(use_fastapi=True)) == {"use_fastapi": True}
+    assert project_options(DummyArgs(use_flask_cache=True)) == {
+        "use_flask_cache": True
+    }
+    assert project_options(DummyArgs(use_metrics=True)) == {"use_metrics": True}
+    assert project_options(DummyArgs(use_database=True)) == {"use_database": True}
+    assert project_options(DummyArgs(use_logging=True)) == {"use_logging": True}
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_initial_commit_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--initial-commit"])
+    main()
+    assert mock_run_cli.call_args.args[0].initial_commit is True
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_docker_profile_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--docker-profile=runtime"])
+    main()
+    assert mock_run_cli.call_args.args[0].docker_profile == "runtime"
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_fastapi_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--fastapi"])
+    main()
+    assert mock_run_cli.call_args.args[0].use_fastapi is True
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_flask_cache_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--flask-cache"])
+    main()
+    assert mock_run_cli.call_args.args[0].use_flask_cache is True
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_metrics_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--metrics"])
+    main()
+    assert mock_run_cli.call_args.args[0].use_metrics is True
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_database_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--database"])
+    main()
+    assert mock_run_cli.call_args.args[0].use_database is True
+
+
+@patch("boilrpy.__main__.run_cli")
+def test_main_logging_flag(mock_run_cli, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["boilrpy", "--logging"])
+    main()
+    assert mock_run_cli.call_args.args[0].use_logging is True
@@ -0,0 +1,135 @@
+import json
+import os
+import pytest
+from importlib import metadata
+from unittest.mock import patch
+from boilrpy.manifest import (
+    FILE_MISSING,
+    FILE_MODIFIED,
+    FILE_UNCHANGED,
+    MANIFEST_FILENAME,
+    ManifestError,
+    ProjectManifest,
+    get_boilrpy_version,
+)
+from boilrpy.utils.content_hasher import ContentHasher
+
+
+@pytest.fixture
+def project_info():
+    return {
+        "name": "test_project",
+        "version": "0.1.0",
+        "license": "MIT",
+        "use_flask": False,
+    }
+
+
+def test_save_and_load(tmp_path, project_info):
+    manifest = ProjectManifest(project_info, {"README.md": "abc", ".gitignore": "def"})
+    manifest.save(str(tmp_path))
+
+    loaded = ProjectManifest.load(str(tmp_path))
+
+    assert loaded.project_info == project_info
+    assert loaded.files == {"README.md": "abc", ".gitignore": "def"}
+
+
+def test_to_dict_sorts_files(project_info):
+    manifest = ProjectManifest(project_info, {"b": "2", "a": "1"})
+    assert list(manifest.to_dict()["files"]) == ["a", "b"]
+
+
+def test_load_missing_manifest(tmp_path):
+    with pytest.raises(ManifestError, match=f"No {MANIFEST_FILENAME} found"):
+        ProjectManifest.load(str(tmp_path))
+
+
+def test_load_invalid_manifest(tmp_path):
+    (tmp_path / MANIFEST_FILENAME).write_text(json.dumps({"files": {}}))
+    with pytest.raises(ManifestError, match="Invalid manifest"):
+        ProjectManifest.load(str(tmp_path))
+
+
+def test_save_error(tmp_path, project_info):
+    with patch("builtins.open", side_effect=PermissionError("denied")):
+        with pytest.raises(ManifestError, match="Error writing manifest"):
+            ProjectManifest(project_info).save(str(tmp_path))
+
+
+@pytest.fixture
+def generated_project(tmp_path, project_info):
+    files = {"README.md": "# Test", "main.py": "print()", "Dockerfile": "FROM x"}
+    for filename, content in files.items():
+        (tmp_path / filename).write_text(content, encoding="utf-8")
+    hashes = {
+        filename: ContentHasher.hash_text(content)
+        for filename, content in files.items()
+    }
+    ProjectManifest(project_info, hashes).save(str(tmp_path))
+    return tmp_path
+
+
+def test_get_boilrpy_version():
+    with patch("boilrpy.manifest.metadata.version", return_value="1.2.3"):
+        assert get_boilrpy_version() == "1.2.3"
+
+
+def test_get_boilrpy_version_not_installed():
+    with patch(
+        "boilrpy.manifest.metadata.version",
+        side_effect=metadata.PackageNotFoundError("boilrpy"),
+    ):
+        assert get_boilrpy_version() == "unknown"
+
+
+def test_save_records_version_and_stats(generated_project):
+    data = json.loads((generated_project / MANIFEST_FILENAME).read_text())
+    stat = os.stat(generated_project / "README.md")
+    assert data["boilrpy_version"] == get_boilrpy_version()
+    assert data["files"]["README.md"] == {
+        "sha256": ContentHasher.hash_text("# Test"),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def test_save_skips_stats_of_missing_files(tmp_path, project_info):
+    ProjectManifest(project_info, {"README.md": "abc"}).save(str(tmp_path))
+    loaded = ProjectManifest.load(str(tmp_path))
+    assert loaded.files == {"README.md": "abc"}
+    assert loaded.file_stats == {}
+
+
+def test_check_drift_unchanged_files_are_not_hashed(generated_project):
+    manifest = ProjectManifest.load(str(generated_project))
+    with patch("boilrpy.manifest.ContentHasher.hash_file") as mock_hash:
+        statuses = manifest.check_drift(str(generated_project))
+    mock_hash.assert_not_called()
+    assert set(statuses.values()) == {FILE_UNCHANGED}
+
+
+def test_check_drift_touched_file_with_same_content(generated_project):
+    os.utime(generated_project / "main.py", ns=(0, 0))
+    manifest = ProjectManifest.load(str(generated_project))
+    assert manifest.check_drift(str(generated_project))["main.py"] == FILE_UNCHANGED
+
+
+def test_check_drift_modified_and_missing_files(generated_project):
+    (generated_project / "README.md").write_text("# Edited by hand", encoding="utf-8")
+    (generated_project / "Dockerfile").unlink()
+    manifest = ProjectManifest.load(str(generated_project))
+
+    statuses = manifest.check_drift(str(generated_project))
+
+    assert statuses == {
+        "Dockerfile": FILE_MISSING,
+        "README.md": FILE_MODIFIED,
+        "main.py": FILE_UNCHANGED,
+    }
+
+
+def test_check_drift_undecodable_file(generated_project):
+    (generated_project / "main.py").write_bytes(b"\xff\xfe\x00")
+    manifest = ProjectManifest.load(str(generated_project))
+    assert manifest.check_drift(str(generated_project))["main.py"] == FILE_MODIFIED
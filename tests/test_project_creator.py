@@ -4,13 +4,13 @@ from unittest.mock import Mock, patch, mock_open
 from boilrpy.project_creator import ProjectCreator
 from boilrpy.config import Config
 from boilrpy.file_generator import FileGenerator
-from boilrpy.file_writer import FileWriter, FileWriterError
+from boilrpy.file_writer import FileWriter, FileWriterError, IncrementalFileWriter
 from boilrpy.dependency_creators import (
     DependencyCreatorFactory,
     PoetryCreator,
     PipCreator,
     UvCreator,
-    CondaCreator
+    CondaCreator,
 )
 
 
@@ -35,6 +35,7 @@ def mock_poetry_creator(mock_config):
     creator.create_dependency_file = Mock()
     return creator
 
+
 @pytest.fixture
 def mock_pip_creator(mock_config):
     """Create a mock PipCreator."""
@@ -42,6 +43,7 @@ def mock_pip_creator(mock_config):
     creator.create_dependency_file = Mock()
     return creator
 
+
 @pytest.fixture
 def mock_uv_creator(mock_config):
     """Create a mock UvCreator."""
@@ -84,6 +86,7 @@ def project_info():
         "use_flask": True,
     }
 
+
 @pytest.fixture
 def project_info_with_poetry(project_info):
     """Project info configured for Poetry."""
@@ -91,6 +94,7 @@ def project_info_with_poetry(project_info):
     info["dependencies_manager"] = "poetry"
     return info
 
+
 @pytest.fixture
 def project_info_with_pip(project_info):
     """Project info configured for pip."""
@@ -106,6 +110,7 @@ def project_info_with_uv(project_info):
     info["dependencies_manager"] = "uv"
     return info
 
+
 @pytest.fixture
 def project_info_with_conda(project_info):
     """Project info configured for Conda."""
@@ -148,6 +153,8 @@ def test_create_project_success(
     ) as mock_create_requirements, patch.object(
         project_creator, "_create_requirements_txt"
     ) as mock_create_main, patch.object(
+        project_creator, "_write_manifest"
+    ) as mock_write_manifest, patch.object(
         project_creator, "_initialize_git_repository"
     ) as mock_init_git:
 
@@ -160,13 +167,16 @@ def test_create_project_success(
     mock_create_readme.assert_called_once_with(project_info)
     mock_create_license.assert_called_once_with(project_info)
     mock_poetry_creator.assert_called_once_with(project_info)
-    mock_create_gitignore.assert_called_once()
+    mock_create_gitignore.assert_called_once_with(project_info)
     mock_create_changelog.assert_called_once_with("0.1.0")
     mock_create_dockerfile.assert_called_once_with(project_info)
     mock_create_pylint.assert_called_once_with(project_info["use_pylint"])
     mock_create_test.assert_called_once_with(project_info["create_tests"])
     mock_create_flask.assert_called_once_with(project_info)
-    mock_create_requirements.assert_called_once_with(project_info["use_flask"])
+    mock_create_requirements.assert_called_once_with(
+        project_info["use_flask"], project_info
+    )
+    mock_write_manifest.assert_called_once_with(project_info)
     mock_init_git.assert_called_once()
 
 
@@ -209,6 +219,8 @@ def test_create_project_no_version(project_creator, project_info):
         project_creator, "_create_requirements_txt"
     ), patch.object(
         project_creator, "_create_main_file"
+    ), patch.object(
+        project_creator, "_write_manifest"
     ), patch.object(
         project_creator, "_initialize_git_repository"
     ), patch(
@@ -248,6 +260,8 @@ def test_create_project_print_message(mock_print, project_creator, project_info)
         project_creator, "_create_linter_file"
     ), patch.object(
         project_creator, "_create_main_file"
+    ), patch.object(
+        project_creator, "_write_manifest"
     ), patch.object(
         project_creator, "_initialize_git_repository"
     ), patch(
@@ -296,9 +310,14 @@ def test_create_gitignore(project_creator):
         ".gitignore content"
     )
 
+    project_info = {"dependencies_manager": "uv", "use_flask": True}
+
     with patch("builtins.open", mock_open()) as mock_file:
-        project_creator._create_gitignore()
+        project_creator._create_gitignore(project_info)
 
+    project_creator.file_generator.generate_gitignore.assert_called_once_with(
+        project_info
+    )
     mock_file.assert_called_once_with(".gitignore", "w", encoding="utf-8")
     mock_file().write.assert_called_once_with(".gitignore content")
 
@@ -350,7 +369,7 @@ def test_create_main_file(project_creator, project_info):
 def test_create_main_file_when_using_flask(project_creator):
     mock_file_writer = Mock(spec=FileWriter)
     project_creator.file_writer = mock_file_writer
-    project_creator._create_main_file(use_flask=True)
+    project_creator._create_main_file(use_web_app=True)
     project_creator.file_generator.generate_main_file.assert_not_called()
     mock_file_writer.write_file.assert_not_called()
 
@@ -358,13 +377,64 @@ def test_create_main_file_when_using_flask(project_creator):
 def test_create_main_file_when_not_using_flask(project_creator):
     mock_file_writer = Mock(spec=FileWriter)
     project_creator.file_writer = mock_file_writer
-    project_creator._create_main_file(use_flask=False)
+    project_creator._create_main_file(use_web_app=False)
     project_creator.file_generator.generate_main_file.assert_called_once()
     mock_file_writer.write_file.assert_called_once_with(
         "main.py", project_creator.file_generator.generate_main_file.return_value
     )
 
 
+def test_create_main_file_with_logging(project_creator):
+    project_creator.file_writer = Mock(spec=FileWriter)
+    project_info = {"use_logging": True}
+    project_creator._create_main_file(False, project_info)
+    project_creator.file_generator.generate_main_file.assert_called_once_with(
+        project_info
+    )
+
+
+def test_create_logging_files(project_creator):
+    mock_file_writer = Mock(spec=FileWriter)
+    project_creator.file_writer = mock_file_writer
+    project_info = {"use_logging": True, "use_flask": False}
+    project_creator._create_logging_files(project_info)
+    project_creator.file_generator.generate_logging_config.assert_called_once_with(
+        project_info
+    )
+    mock_file_writer.write_file.assert_any_call(
+        "logging_config.py",
+        project_creator.file_generator.generate_logging_config.return_value,
+    )
+    mock_file_writer.write_file.assert_any_call(
+        ".env",
+        project_creator.file_generator.generate_logging_dot_env_file.return_value,
+    )
+
+
+def test_create_logging_files_with_flask(project_creator):
+    mock_file_writer = Mock(spec=FileWriter)
+    project_creator.file_writer = mock_file_writer
+    project_creator._create_logging_files({"use_logging": True, "use_flask": True})
+    mock_file_writer.write_file.assert_called_once_with(
+        "logging_config.py",
+        project_creator.file_generator.generate_logging_config.return_value,
+    )
+
+
+@pytest.mark.parametrize(
+    "project_info",
+    [
+        {"use_logging": False, "use_flask": False},
+        {"use_logging": True, "use_flask": False, "use_fastapi": True},
+    ],
+)
+def test_create_logging_files_skipped(project_creator, project_info):
+    mock_file_writer = Mock(spec=FileWriter)
+    project_creator.file_writer = mock_file_writer
+    project_creator._create_logging_files(project_info)
+    mock_file_writer.write_file.assert_not_called()
+
+
 def test_create_flask_app_when_not_using_flask(project_creator):
     project_info = {"use_flask": False}
     with patch("boilrpy.project_creator.FlaskAppCreator") as MockFlaskAppCreator:
@@ -380,17 +450,58 @@ def test_create_flask_app_when_using_flask(project_creator):
 
         project_creator._create_flask_app(project_info)
 
-        MockFlaskAppCreator.assert_called_once_with(project_creator.config)
+        MockFlaskAppCreator.assert_called_once_with(
+            project_creator.config, project_creator.file_writer
+        )
         mock_flask_creator.create_flask_project.assert_called_once_with(project_info)
 
 
+def test_create_fastapi_app_when_not_using_fastapi(project_creator):
+    with patch("boilrpy.project_creator.FastAPIAppCreator") as MockFastAPIAppCreator:
+        project_creator._create_fastapi_app({"use_flask": False})
+        MockFastAPIAppCreator.assert_not_called()
+
+
+def test_create_fastapi_app_when_using_fastapi(project_creator):
+    project_info = {"use_flask": False, "use_fastapi": True}
+    with patch("boilrpy.project_creator.FastAPIAppCreator") as MockFastAPIAppCreator:
+        project_creator._create_fastapi_app(project_info)
+
+        MockFastAPIAppCreator.assert_called_once_with(
+            project_creator.config, project_creator.file_writer
+        )
+        MockFastAPIAppCreator.return_value.create_fastapi_project.assert_called_once_with(
+            project_info
+        )
+
+
 @patch("boilrpy.project_creator.os")
-def test_initialize_git_repository(mock_os, project_creator):
+def test_initialize_git_repository(mock_os, project_creator, project_info):
     mock_os.getcwd.return_value = "/test"
-    mock_os.path.join.return_value = "/test/.git"
-    with patch("subprocess.run") as mock_run:
-        project_creator._initialize_git_repository()
-        assert mock_run.call_count == 2
+    project_creator.config.get_git_default_branch.return_value = "main"
+    with patch("boilrpy.project_creator.GitWriter") as MockGitWriter, patch(
+        "subprocess.run"
+    ) as mock_run:
+        project_creator._initialize_git_repository(project_info)
+
+    MockGitWriter.assert_called_once_with("/test", "main")
+    MockGitWriter.return_value.init.assert_called_once()
+    MockGitWriter.return_value.commit_all.assert_not_called()
+    mock_run.assert_not_called()
+
+
+def test_initialize_git_repository_with_initial_commit(project_creator, project_info):
+    project_info["initial_commit"] = True
+    with patch("boilrpy.project_creator.GitWriter") as MockGitWriter, patch(
+        "boilrpy.project_creator.GitIdentity.from_environment"
+    ) as mock_identity:
+        project_creator._initialize_git_repository(project_info)
+
+    mock_identity.assert_called_once_with("Test Author")
+    MockGitWriter.return_value.commit_all.assert_called_once_with(
+        "Initial commit", mock_identity.return_value
+    )
+
 
 def test_create_project_directory(project_creator):
     project_creator.project_name = "test_project"
@@ -464,6 +575,8 @@ def test_check_directory_exist_false_not_dir(mock_isdir, mock_exists, project_cr
 
 def test_create_dockerfile_with_docker(project_creator):
     project_info = {"name": "test_project", "use_docker": True, "use_flask": True}
+    project_creator.file_generator.generate_dockerfile.return_value = "Dockerfile"
+    project_creator.file_generator.generate_dockerignore.return_value = "ignore"
 
     with patch("builtins.open", mock_open()) as mock_file:
         project_creator._create_dockerfile(project_info)
@@ -500,6 +613,7 @@ def test_create_pylintrc(project_creator):
         mock_file.assert_called_once_with(".pylintrc", "w", encoding="utf-8")
         mock_file().write.assert_called_once_with("Pylintrc content")
 
+
 def test_not_create_pylintrc(project_creator):
     project_creator.file_generator.generate_pylint.return_value = "Pylintrc content"
 
@@ -509,7 +623,11 @@ def test_not_create_pylintrc(project_creator):
 
 
 def test_create_requirments_txt(project_creator):
-    project_info = {"name": "test_project", "use_flask": False}
+    project_info = {
+        "name": "test_project",
+        "use_flask": True,
+        "dependencies_manager": "poetry",
+    }
     project_creator.file_generator.generate_requirements_txt.return_value = (
         "Requirements content"
     )
@@ -517,5 +635,165 @@ def test_create_requirments_txt(project_creator):
     with patch("builtins.open", mock_open()) as mock_file:
         project_creator._create_requirements_txt(project_info)
 
+    project_creator.file_generator.generate_requirements_txt.assert_called_once_with(
+        project_creator.dependencies
+    )
+    assert project_creator.dependencies.requirements() == [
+        "flask",
+        "python-dotenv",
+        "gunicorn",
+    ]
     mock_file.assert_called_once_with("requirements.txt", "w", encoding="utf-8")
     mock_file().write.assert_called_once_with("Requirements content")
+
+
+def test_create_requirments_txt_written_by_dependency_creator(project_creator):
+    project_info = {"name": "test_project", "dependencies_manager": "pip"}
+
+    with patch("builtins.open", mock_open()) as mock_file:
+        project_creator._create_requirements_txt(project_info)
+
+    mock_file.assert_not_called()
+    project_creator.file_generator.generate_requirements_txt.assert_not_called()
+
+
+def test_dependencies_resolved_once(project_creator):
+    project_info = {
+        "name": "test_project",
+        "use_flask": True,
+        "use_docker": True,
+        "dependencies_manager": "conda",
+    }
+    project_creator.file_generator.generate_readme.return_value = "README"
+    project_creator.file_generator.generate_dockerfile.return_value = "Dockerfile"
+    project_creator.file_generator.generate_dockerignore.return_value = "ignore"
+    project_creator.file_generator.generate_requirements_txt.return_value = "flask"
+
+    with patch(
+        "boilrpy.project_creator.ProjectDependencies.from_project_info"
+    ) as mock_resolve, patch("builtins.open", mock_open()):
+        project_creator._create_readme(project_info)
+        project_creator._create_dockerfile(project_info)
+        project_creator._create_requirements_txt(project_info)
+
+    mock_resolve.assert_called_once_with(project_info)
+    dependencies = mock_resolve.return_value
+    project_creator.file_generator.generate_readme.assert_called_once_with(
+        project_info, dependencies
+    )
+    project_creator.file_generator.generate_dockerfile.assert_called_once_with(
+        project_info, dependencies
+    )
+    project_creator.file_generator.generate_requirements_txt.assert_called_once_with(
+        dependencies
+    )
+
+
+def test_update_project(project_creator, project_info):
+    manifest = Mock(project_info=project_info, files={"README.md": "abc"})
+    with patch(
+        "boilrpy.project_creator.ProjectManifest.load", return_value=manifest
+    ) as mock_load, patch(
+        "boilrpy.project_creator.os.chdir"
+    ) as mock_chdir, patch.object(
+        project_creator, "_generate_project_files"
+    ) as mock_generate, patch.object(
+        project_creator, "_write_manifest"
+    ) as mock_write_manifest, patch.object(
+        project_creator, "_create_dependency_files"
+    ) as mock_dependency_files, patch.object(
+        project_creator, "_initialize_git_repository"
+    ) as mock_init_git:
+        writer = project_creator.update_project("/path/to/project")
+
+    mock_load.assert_called_once_with("/path/to/project", "utf-8")
+    mock_chdir.assert_called_once_with("/path/to/project")
+    mock_generate.assert_called_once_with(project_info)
+    mock_write_manifest.assert_called_once_with(project_info)
+    mock_dependency_files.assert_not_called()
+    mock_init_git.assert_not_called()
+    assert isinstance(writer, IncrementalFileWriter)
+    assert writer.recorded_files == {"README.md": "abc"}
+    assert project_creator.project_name == "test_project"
+
+
+def test_update_project_rewrites_only_changed_files(
+    tmp_path, mock_config, project_info
+):
+    project_info["use_flask"] = False
+    project_info["license"] = "None"
+    creator = ProjectCreator(mock_config)
+    creator.file_writer = FileWriter("utf-8")
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        creator._generate_project_files(project_info)
+        creator._write_manifest(project_info)
+        (tmp_path / "CHANGELOG.md").write_text("# My own changelog\n")
+        (tmp_path / "main.py").unlink()
+
+        updater = ProjectCreator(mock_config)
+        writer = updater.update_project(str(tmp_path))
+    finally:
+        os.chdir(cwd)
+
+    assert writer.modified_files == ["CHANGELOG.md", "main.py"]
+    assert writer.updated_files == []
+    assert writer.created_files == []
+    assert "README.md" in writer.unchanged_files
+    assert (tmp_path / "CHANGELOG.md").read_text() == "# My own changelog\n"
+    assert not (tmp_path / "main.py").exists()
+
+
+def test_write_manifest(project_creator, project_info):
+    project_creator.file_writer.written_files = {"README.md": "abc"}
+    with patch("boilrpy.project_creator.ProjectManifest") as MockManifest, patch(
+        "boilrpy.project_creator.os.getcwd", return_value="/path/to/project"
+    ):
+        project_creator._write_manifest(project_info)
+
+    MockManifest.assert_called_once_with(project_info, {"README.md": "abc"})
+    MockManifest.return_value.save.assert_called_once_with("/path/to/project", "utf-8")
+
+
+@patch("builtins.print")
+def test_display_update_summary(mock_print, project_creator):
+    project_creator.file_writer = IncrementalFileWriter("utf-8")
+    project_creator.file_writer.updated_files = ["Dockerfile"]
+    project_creator.file_writer.modified_files = ["README.md"]
+    project_creator.file_writer.unchanged_files = [".gitignore", "LICENSE"]
+
+    project_creator._display_update_summary()
+
+    printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+    assert "Updated: Dockerfile" in printed
+    assert "Modified by user, left untouched: README.md" in printed
+    assert "2 file(s) already up to date." in printed
+
+
+@patch("builtins.print")
+def test_check_project(mock_print, project_creator):
+    manifest = Mock()
+    manifest.check_drift.return_value = {
+        "README.md": "modified",
+        "LICENSE": "unchanged",
+        "Dockerfile": "missing",
+    }
+    with patch(
+        "boilrpy.project_creator.ProjectManifest.load", return_value=manifest
+    ) as mock_load:
+        drifted = project_creator.check_project("/path/to/project")
+
+    mock_load.assert_called_once_with("/path/to/project", "utf-8")
+    manifest.check_drift.assert_called_once_with("/path/to/project", "utf-8")
+    assert drifted == {"README.md": "modified", "Dockerfile": "missing"}
+    assert mock_print.call_count == 2
+
+
+@patch("builtins.print")
+def test_check_project_up_to_date(mock_print, project_creator):
+    manifest = Mock()
+    manifest.check_drift.return_value = {"README.md": "unchanged"}
+    with patch("boilrpy.project_creator.ProjectManifest.load", return_value=manifest):
+        assert project_creator.check_project("/path/to/project") == {}
+    assert "up to date" in mock_print.call_args.args[0]